@@ -0,0 +1,50 @@
+"""
+Gunicorn configuration for the production container.
+
+Run with ``gunicorn -c python:config.gunicorn config.wsgi``, or with
+``-k uvicorn.workers.UvicornWorker config.asgi`` for the ASGI mode. Every
+value can be overridden through the environment variables read below.
+"""
+
+import multiprocessing
+import os
+
+
+def _env_int(name, default):
+    return int(os.environ.get(name, default))
+
+
+bind = os.environ.get("GUNICORN_BIND", "0.0.0.0:8000")
+
+# The classic (2 x CPU) + 1 sizing; each worker is a separate process.
+workers = _env_int("GUNICORN_WORKERS", multiprocessing.cpu_count() * 2 + 1)
+# More than one thread switches to the gthread worker, which overlaps the
+# I/O waits (database, cache) of concurrent requests inside each process.
+threads = _env_int("GUNICORN_THREADS", 1)
+worker_class = os.environ.get("GUNICORN_WORKER_CLASS") or (
+    "gthread" if threads > 1 else "sync"
+)
+
+# Import Django once in the master and fork the workers from it: faster boot
+# and shared memory pages. Connections opened while loading are closed in
+# post_fork so workers never share a database socket.
+preload_app = os.environ.get("GUNICORN_PRELOAD", "True").lower() in ("true", "1")
+
+# Recycle workers periodically to bound memory growth; the jitter keeps them
+# from restarting all at once.
+max_requests = _env_int("GUNICORN_MAX_REQUESTS", 1000)
+max_requests_jitter = _env_int("GUNICORN_MAX_REQUESTS_JITTER", 100)
+
+timeout = _env_int("GUNICORN_TIMEOUT", 30)
+graceful_timeout = _env_int("GUNICORN_GRACEFUL_TIMEOUT", 30)
+keepalive = _env_int("GUNICORN_KEEPALIVE", 5)
+
+accesslog = os.environ.get("GUNICORN_ACCESS_LOG", "-")
+errorlog = "-"
+loglevel = os.environ.get("GUNICORN_LOG_LEVEL", "info")
+
+
+def post_fork(server, worker):
+    from django.db import connections
+
+    connections.close_all()
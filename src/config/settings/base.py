@@ -54,8 +54,10 @@ BASE_APPS = [
     "django.contrib.sessions",
     "django.contrib.messages",
     "django.contrib.staticfiles",
+    "django.contrib.postgres",
     "drf_yasg",
     "django_extensions",
+    "django_q",
 ]
 LOCAL_APPS = ["security", "core", "event_management"]
 
@@ -105,6 +107,11 @@ AUTH_USER_MODEL = "security.User"
 # Database
 # https://docs.djangoproject.com/en/4.1/ref/settings/#databases
 
+# Set when DB_HOST points at PgBouncer running with pool_mode = transaction.
+DB_PGBOUNCER_TRANSACTION_POOLING = os.environ.get(
+    "DB_PGBOUNCER_TRANSACTION_POOLING", "False"
+).lower() in ("true", "1")
+
 DATABASES = {
     "default": {
         "ENGINE": "django.db.backends.postgresql",
@@ -113,10 +120,71 @@ DATABASES = {
         "PASSWORD": os.environ.get("DB_PASSWORD"),
         "HOST": os.environ.get("DB_HOST"),
         "PORT": os.environ.get("DB_PORT"),
+        # Reuse connections across requests instead of reconnecting each time;
+        # 0 closes them at the end of every request.
+        "CONN_MAX_AGE": int(os.environ.get("DB_CONN_MAX_AGE", 60)),
+        # Ping a reused connection before its first query in a request.
+        "CONN_HEALTH_CHECKS": os.environ.get("DB_CONN_HEALTH_CHECKS", "True").lower()
+        in ("true", "1"),
+        # Server-side cursors (QuerySet.iterator) do not survive PgBouncer's
+        # transaction pooling, where each transaction may use another backend.
+        "DISABLE_SERVER_SIDE_CURSORS": DB_PGBOUNCER_TRANSACTION_POOLING,
+        "OPTIONS": {"connect_timeout": int(os.environ.get("DB_CONNECT_TIMEOUT", 10))},
     }
 }
 
 
+# Cache
+# https://docs.djangoproject.com/en/4.1/topics/cache/
+
+CACHES = {
+    "default": {
+        "BACKEND": os.environ.get(
+            "CACHE_BACKEND", "django.core.cache.backends.locmem.LocMemCache"
+        ),
+        "LOCATION": os.environ.get("CACHE_LOCATION", ""),
+    },
+    # Rendered API responses, and the version stamps of the permission and
+    # report caches, shared by every worker of the host: a file or database
+    # cache (run ``createcachetable`` for the latter).
+    "responses": {
+        "BACKEND": os.environ.get(
+            "RESPONSE_CACHE_BACKEND",
+            "django.core.cache.backends.filebased.FileBasedCache",
+        ),
+        "LOCATION": os.environ.get(
+            "RESPONSE_CACHE_LOCATION", "/var/tmp/event_management_responses"
+        ),
+    },
+}
+RESPONSE_CACHE_ALIAS = "responses"
+
+# Seconds a rendered event list page stays cached (see response_cache_service)
+EVENT_LIST_CACHE_TIMEOUT = int(os.environ.get("EVENT_LIST_CACHE_TIMEOUT", 300))
+
+# Seconds a user's resolved permission set stays cached (see core.utils.permission_cache)
+PERMISSION_CACHE_TIMEOUT = int(os.environ.get("PERMISSION_CACHE_TIMEOUT", 300))
+
+# Bounds of the in-process LRU of verified JWT payloads (see core.utils.token_cache);
+# entries also expire at the token's exp. 0 entries disables the cache.
+TOKEN_CACHE_MAX_ENTRIES = int(os.environ.get("TOKEN_CACHE_MAX_ENTRIES", 10000))
+TOKEN_CACHE_TTL = int(os.environ.get("TOKEN_CACHE_TTL", 300))
+
+# Bounds of the in-process LRU of generated reports (see report_cache_service);
+# its data version stamp is kept in the shared "responses" cache.
+REPORT_CACHE_MAX_BYTES = int(os.environ.get("REPORT_CACHE_MAX_BYTES", 64 * 1024 * 1024))
+REPORT_CACHE_MAX_ENTRY_BYTES = int(
+    os.environ.get("REPORT_CACHE_MAX_ENTRY_BYTES", 8 * 1024 * 1024)
+)
+REPORT_CACHE_TTL = int(os.environ.get("REPORT_CACHE_TTL", 3600))
+
+# Admin bulk actions update in primary-key batches of this size, each in its
+# own transaction, and run in a django-q task above the threshold
+# (see core.utils.batched_update)
+BULK_UPDATE_BATCH_SIZE = int(os.environ.get("BULK_UPDATE_BATCH_SIZE", 1000))
+BULK_UPDATE_ASYNC_THRESHOLD = int(os.environ.get("BULK_UPDATE_ASYNC_THRESHOLD", 20000))
+
+
 # Password validation
 # https://docs.djangoproject.com/en/4.1/ref/settings/#auth-password-validators
 
@@ -135,6 +203,31 @@ AUTH_PASSWORD_VALIDATORS = [
     },
 ]
 
+# The first hasher hashes new passwords, the others verify existing hashes.
+PASSWORD_HASHERS = os.environ.get(
+    "PASSWORD_HASHERS",
+    ",".join(
+        [
+            "security.hashers.PBKDF2PasswordHasher",
+            "django.contrib.auth.hashers.PBKDF2SHA1PasswordHasher",
+            "django.contrib.auth.hashers.Argon2PasswordHasher",
+            "django.contrib.auth.hashers.BCryptSHA256PasswordHasher",
+            "django.contrib.auth.hashers.ScryptPasswordHasher",
+        ]
+    ),
+).split(",")
+# Work factor of security.hashers.PBKDF2PasswordHasher (Django 4.1: 390000)
+PASSWORD_PBKDF2_ITERATIONS = int(os.environ.get("PASSWORD_PBKDF2_ITERATIONS", 390000))
+# Rehash passwords stored with another hasher or work factor at login
+PASSWORD_REHASH_ON_LOGIN = os.environ.get(
+    "PASSWORD_REHASH_ON_LOGIN", "True"
+).lower() in ("true", "1")
+
+# Seconds during which repeated logins do not rewrite last_login, and whether
+# the write is queued to django-q (see security.services.last_login_service)
+LAST_LOGIN_UPDATE_INTERVAL = int(os.environ.get("LAST_LOGIN_UPDATE_INTERVAL", 0))
+LAST_LOGIN_ASYNC = os.environ.get("LAST_LOGIN_ASYNC", "False").lower() in ("true", "1")
+
 APPEND_SLASH = False
 
 # Internationalization
@@ -154,6 +247,11 @@ USE_TZ = True
 
 STATIC_URL = "static/"
 
+# Media files (background report artifacts)
+
+MEDIA_URL = "media/"
+MEDIA_ROOT = os.environ.get("MEDIA_ROOT", os.path.join(BASE_DIR.parent, "media"))
+
 # Default primary key field type
 # https://docs.djangoproject.com/en/4.1/ref/settings/#default-auto-field
 
@@ -182,6 +280,13 @@ SIMPLE_JWT = {
     "SLIDING_TOKEN_REFRESH_LIFETIME": timedelta(days=7),
 }
 
+# Opt-in: build request.user from the access token claims instead of fetching
+# the User row on every request (see core.utils.token_user.TokenUser).
+STATELESS_JWT_AUTH = os.environ.get("STATELESS_JWT_AUTH", "False").lower() in (
+    "true",
+    "1",
+)
+
 Q_CLUSTER = {
     "name": "DjangORM",
     "workers": 4,
@@ -1,4 +1,6 @@
 # src/settings/test.py
+import tempfile
+
 from .base import *
 
 DEBUG = False
@@ -9,3 +11,16 @@ DATABASES = {
         "NAME": ":memory:",
     }
 }
+
+# Run django-q tasks inline and keep report artifacts out of the tree.
+Q_CLUSTER = {**Q_CLUSTER, "sync": True}
+MEDIA_ROOT = tempfile.mkdtemp(prefix="event_management_media_")
+
+# Keep the shared response cache in memory.
+CACHES = {
+    **CACHES,
+    "responses": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "responses",
+    },
+}
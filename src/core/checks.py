@@ -0,0 +1,53 @@
+"""
+System checks validating the database connection settings at startup.
+"""
+
+from django.conf import settings
+from django.core.checks import Error, Warning, register
+
+
+@register()
+def check_database_connections(app_configs, **kwargs):
+    """
+    Validate the persistent connection and PgBouncer settings of every database.
+
+    Returns:
+        list: The errors and warnings found.
+    """
+    messages = []
+    pgbouncer = getattr(settings, "DB_PGBOUNCER_TRANSACTION_POOLING", False)
+    for alias, database in settings.DATABASES.items():
+        max_age = database.get("CONN_MAX_AGE", 0)
+        if max_age is not None and (not isinstance(max_age, int) or max_age < 0):
+            messages.append(
+                Error(
+                    f"DATABASES['{alias}']['CONN_MAX_AGE'] must be a "
+                    f"non-negative integer or None, got {max_age!r}.",
+                    hint="Set DB_CONN_MAX_AGE to a number of seconds.",
+                    id="core.E001",
+                )
+            )
+        elif max_age != 0 and not database.get("CONN_HEALTH_CHECKS", False):
+            messages.append(
+                Warning(
+                    f"DATABASES['{alias}'] keeps connections open without "
+                    "CONN_HEALTH_CHECKS; a connection dropped by the server "
+                    "fails the first query of the next request.",
+                    hint="Set DB_CONN_HEALTH_CHECKS=True.",
+                    id="core.W001",
+                )
+            )
+        if (
+            pgbouncer
+            and "postgresql" in database.get("ENGINE", "")
+            and not database.get("DISABLE_SERVER_SIDE_CURSORS", False)
+        ):
+            messages.append(
+                Error(
+                    f"DATABASES['{alias}'] uses server-side cursors behind "
+                    "PgBouncer in transaction pooling mode.",
+                    hint="Set DISABLE_SERVER_SIDE_CURSORS to True.",
+                    id="core.E002",
+                )
+            )
+    return messages
@@ -0,0 +1,59 @@
+import statistics
+import time
+from django.core.management.base import BaseCommand
+from django.core.signals import request_finished, request_started
+from django.db import connections
+from event_management.models import Event
+
+
+class Command(BaseCommand):
+    help = (
+        "Simulates request cycles against the database with and without "
+        "persistent connections and compares the per-request latency."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--requests", type=int, default=500)
+        parser.add_argument("--database", default="default")
+        parser.add_argument(
+            "--max-ages",
+            type=int,
+            nargs="+",
+            default=[0, 60],
+            help="CONN_MAX_AGE values to compare.",
+        )
+
+    def handle(self, *args, **options):
+        connection = connections[options["database"]]
+        original = connection.settings_dict["CONN_MAX_AGE"]
+        self.stdout.write(
+            f"{options['requests']} requests on {connection.vendor} "
+            f"(health checks: {connection.settings_dict['CONN_HEALTH_CHECKS']})"
+        )
+        try:
+            for max_age in options["max_ages"]:
+                connection.close()
+                connection.settings_dict["CONN_MAX_AGE"] = max_age
+                timings = [
+                    self._request(options["database"])
+                    for _ in range(options["requests"])
+                ]
+                self.stdout.write(
+                    f"CONN_MAX_AGE={max_age:>4}: "
+                    f"median {statistics.median(timings):7.2f} ms | "
+                    f"p95 {statistics.quantiles(timings, n=20)[-1]:7.2f} ms"
+                )
+        finally:
+            connection.close()
+            connection.settings_dict["CONN_MAX_AGE"] = original
+
+    def _request(self, database):
+        """
+        Run one request cycle: the request signals open and close connections
+        exactly like the WSGI handler does.
+        """
+        start = time.perf_counter()
+        request_started.send(sender=self.__class__)
+        list(Event.objects.using(database).order_by("date")[:10])
+        request_finished.send(sender=self.__class__)
+        return (time.perf_counter() - start) * 1000
@@ -0,0 +1,57 @@
+import statistics
+import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.error import HTTPError
+from urllib.request import Request, urlopen
+from django.core.management.base import BaseCommand, CommandError
+from security.models import User
+from security.serializers.token_pair_serializer import MyTokenObtainPairSerializer
+
+
+class Command(BaseCommand):
+    help = (
+        "Load tests running servers with concurrent connections, e.g. the "
+        "WSGI (gunicorn) and ASGI (uvicorn) deployments of the event endpoints."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("urls", nargs="+", help="Full URLs to compare.")
+        parser.add_argument("--email", required=True, help="User to authenticate as.")
+        parser.add_argument("--concurrency", type=int, default=32)
+        parser.add_argument("--requests", type=int, default=1000)
+
+    def handle(self, *args, **options):
+        user = User.objects.filter(email=options["email"]).first()
+        if user is None:
+            raise CommandError(f"User {options['email']} does not exist.")
+        token = str(MyTokenObtainPairSerializer.get_token(user).access_token)
+
+        concurrency, total = options["concurrency"], options["requests"]
+        self.stdout.write(f"{total} requests, {concurrency} concurrent connections")
+        for url in options["urls"]:
+            self._fetch(url, token)  # warm up
+            start = time.perf_counter()
+            with ThreadPoolExecutor(max_workers=concurrency) as pool:
+                results = list(
+                    pool.map(lambda _: self._fetch(url, token), range(total))
+                )
+            elapsed = time.perf_counter() - start
+            latencies = [latency for latency, ok in results]
+            errors = sum(1 for latency, ok in results if not ok)
+            self.stdout.write(
+                f"{url}\n  {total / elapsed:8.1f} req/s | "
+                f"median {statistics.median(latencies):7.1f} ms | "
+                f"p95 {statistics.quantiles(latencies, n=20)[-1]:7.1f} ms | "
+                f"errors {errors}"
+            )
+
+    def _fetch(self, url, token):
+        request = Request(url, headers={"Authorization": f"Bearer {token}"})
+        start = time.perf_counter()
+        try:
+            with urlopen(request, timeout=60) as response:
+                response.read()
+                ok = response.status == 200
+        except (HTTPError, OSError):
+            ok = False
+        return (time.perf_counter() - start) * 1000, ok
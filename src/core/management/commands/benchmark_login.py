@@ -0,0 +1,63 @@
+import os
+import time
+import uuid
+from django.contrib.auth.hashers import make_password
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext, override_settings
+from security.models import User
+from security.serializers.token_pair_serializer import MyTokenObtainPairSerializer
+
+PASSWORD = "BenchmarkPassword123"
+
+
+class Command(BaseCommand):
+    help = (
+        "Measures the login path (credential check, token and last_login "
+        "write) in logins per second per core for several PBKDF2 work factors."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--logins", type=int, default=50)
+        parser.add_argument(
+            "--iterations",
+            type=int,
+            nargs="+",
+            default=[390000, 100000],
+            help="PASSWORD_PBKDF2_ITERATIONS values to compare.",
+        )
+
+    def handle(self, *args, **options):
+        self.stdout.write(
+            f"{options['logins']} sequential logins per work factor "
+            f"({os.cpu_count()} cores available, one used)"
+        )
+        for iterations in options["iterations"]:
+            with override_settings(
+                PASSWORD_PBKDF2_ITERATIONS=iterations, PASSWORD_REHASH_ON_LOGIN=True
+            ), transaction.atomic():
+                rate, queries = self._run(options["logins"])
+                transaction.set_rollback(True)
+            self.stdout.write(
+                f"iterations={iterations:>7}: {rate:8.1f} logins/s/core | "
+                f"{queries} queries per login"
+            )
+
+    def _run(self, logins):
+        """
+        Log a throwaway user in ``logins`` times through the login serializer.
+        """
+        user = User.objects.create(
+            email=f"benchmark-{uuid.uuid4().hex}@example.com",
+            username=f"benchmark-{uuid.uuid4().hex}",
+            password=make_password(PASSWORD),
+        )
+        data = {"email": user.email, "password": PASSWORD}
+        MyTokenObtainPairSerializer(data=data).is_valid(raise_exception=True)
+
+        with CaptureQueriesContext(connection) as queries:
+            start = time.process_time()
+            for _ in range(logins):
+                MyTokenObtainPairSerializer(data=data).is_valid(raise_exception=True)
+            elapsed = time.process_time() - start
+        return logins / elapsed, len(queries) // logins
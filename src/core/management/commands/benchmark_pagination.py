@@ -0,0 +1,112 @@
+import statistics
+import time
+from datetime import timedelta
+from django.core.management.base import BaseCommand
+from django.db import reset_queries
+from django.test import RequestFactory
+from django.utils import timezone
+from rest_framework.request import Request
+from core.utils.pagination import CustomPageNumberPagination, KeysetPagination
+from event_management.models import Category, Event, Reservation
+
+MODELS = {
+    "events": (Event, ("date", "id")),
+    "reservations": (Reservation, ("reservation_date", "id")),
+}
+
+
+class KeysetView:
+    def __init__(self, keyset_ordering):
+        self.keyset_ordering = keyset_ordering
+
+
+class Command(BaseCommand):
+    help = (
+        "Compares OFFSET/LIMIT and keyset pagination latency on the first "
+        "and on a deep page."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--model", choices=MODELS, default="events")
+        parser.add_argument("--page", type=int, default=10000)
+        parser.add_argument("--size", type=int, default=10)
+        parser.add_argument("--repeat", type=int, default=5)
+        parser.add_argument(
+            "--seed",
+            type=int,
+            default=0,
+            help="Bulk create this many events before measuring (events only).",
+        )
+
+    def handle(self, *args, **options):
+        model, ordering = MODELS[options["model"]]
+        if options["seed"]:
+            self._seed_events(options["seed"])
+
+        size, repeat = options["size"], options["repeat"]
+        queryset = model.objects.order_by(*ordering)
+        total = queryset.count()
+        deep_page = max(min(options["page"], total // size), 1)
+        self.stdout.write(f"{model.__name__}: {total} rows, page size {size}")
+
+        for page in (1, deep_page):
+            offset = self._measure(
+                repeat, lambda: self._offset_page(queryset, page, size)
+            )
+            cursor = self._cursor_for(queryset, ordering, (page - 1) * size)
+            keyset = self._measure(
+                repeat, lambda: self._keyset_page(queryset, ordering, cursor, size)
+            )
+            self.stdout.write(
+                f"page {page:>7}: offset {offset:8.2f} ms | keyset {keyset:8.2f} ms"
+            )
+
+    def _seed_events(self, count):
+        category, _ = Category.objects.get_or_create(name="Benchmark")
+        start = timezone.now() + timedelta(days=1)
+        Event.objects.bulk_create(
+            (
+                Event(
+                    name=f"Benchmark event {i}",
+                    description="Pagination benchmark",
+                    date=start + timedelta(minutes=i),
+                    location="Benchmark",
+                    category=category,
+                )
+                for i in range(count)
+            ),
+            batch_size=5000,
+        )
+        self.stdout.write(self.style.SUCCESS(f"Seeded {count} events."))
+
+    def _measure(self, repeat, fetch):
+        timings = []
+        for _ in range(repeat):
+            reset_queries()
+            start = time.perf_counter()
+            fetch()
+            timings.append((time.perf_counter() - start) * 1000)
+        return statistics.median(timings)
+
+    def _offset_page(self, queryset, page, size):
+        request = Request(RequestFactory().get("/", {"page": page, "size": size}))
+        return CustomPageNumberPagination().paginate_queryset(queryset, request)
+
+    def _keyset_page(self, queryset, ordering, cursor, size):
+        params = {"size": size}
+        if cursor:
+            params["cursor"] = cursor
+        request = Request(RequestFactory().get("/", params))
+        return KeysetPagination().paginate_queryset(
+            queryset, request, KeysetView(ordering)
+        )
+
+    def _cursor_for(self, queryset, ordering, offset):
+        """
+        Build the cursor pointing right before the row at ``offset`` (not timed).
+        """
+        if offset == 0:
+            return None
+        paginator = KeysetPagination()
+        paginator.ordering = ordering
+        return paginator.encode_cursor(queryset[offset - 1])
@@ -0,0 +1,66 @@
+import time
+from datetime import timedelta
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+from event_management.models import Category, Event
+from event_management.serializers import EventReportSerializer
+
+
+class Command(BaseCommand):
+    help = (
+        "Compares the time to build the event report in each format "
+        "(xlsx, csv, ndjson) and reports the throughput in rows per second."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--seed",
+            type=int,
+            default=0,
+            help="Bulk create this many events before measuring.",
+        )
+        parser.add_argument("--formats", nargs="+", default=["xlsx", "csv", "ndjson"])
+
+    def handle(self, *args, **options):
+        if options["seed"]:
+            self._seed_events(options["seed"])
+
+        rows = Event.objects.count()
+        self.stdout.write(f"Event report: {rows} rows")
+        for report_format in options["formats"]:
+            serializer = EventReportSerializer(data={"format": report_format})
+            serializer.is_valid(raise_exception=True)
+            start = time.perf_counter()
+            size = self._build(serializer, report_format)
+            elapsed = time.perf_counter() - start
+            self.stdout.write(
+                f"{report_format:>6}: {elapsed:8.2f} s | "
+                f"{rows / elapsed:10.0f} rows/s | {size / 1024 / 1024:8.2f} MB"
+            )
+
+    def _build(self, serializer, report_format):
+        """
+        Consume the whole report and return its size in bytes.
+        """
+        if report_format == "xlsx":
+            with serializer.generate_report() as report:
+                return len(report.read())
+        return sum(len(chunk) for chunk in serializer.stream_report())
+
+    def _seed_events(self, count):
+        category, _ = Category.objects.get_or_create(name="Benchmark")
+        start = timezone.now() + timedelta(days=1)
+        Event.objects.bulk_create(
+            (
+                Event(
+                    name=f"Benchmark event {i}",
+                    description="Report format benchmark",
+                    date=start + timedelta(minutes=i),
+                    location="Benchmark",
+                    category=category,
+                )
+                for i in range(count)
+            ),
+            batch_size=5000,
+        )
+        self.stdout.write(self.style.SUCCESS(f"Seeded {count} events."))
@@ -0,0 +1,111 @@
+import statistics
+import time
+from datetime import timedelta
+from django.core.management.base import BaseCommand
+from django.db.models import Q
+from django.utils import timezone
+from event_management.models import Attendee, Category, Event, Reservation
+from event_management.services import build_search_text
+from security.models import User
+
+
+class Command(BaseCommand):
+    help = (
+        "Compares the joined ILIKE reservation search with the search over "
+        "the denormalized Reservation.search_text column."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--term", default="event 42")
+        parser.add_argument("--size", type=int, default=10)
+        parser.add_argument("--repeat", type=int, default=5)
+        parser.add_argument(
+            "--seed",
+            type=int,
+            default=0,
+            help="Bulk create this many reservations before measuring.",
+        )
+        parser.add_argument(
+            "--per-event",
+            type=int,
+            default=100,
+            help="Reservations per seeded event.",
+        )
+
+    def handle(self, *args, **options):
+        if options["seed"]:
+            self._seed_reservations(options["seed"], options["per_event"])
+
+        term, size, repeat = options["term"], options["size"], options["repeat"]
+        joined = Reservation.objects.filter(
+            Q(event__name__icontains=term) | Q(attendee__user__email__icontains=term)
+        )
+        denormalized = Reservation.objects.filter(search_text__contains=term.lower())
+        self.stdout.write(
+            f"Reservations: {Reservation.objects.count()} rows, term {term!r}"
+        )
+        for label, queryset in (("joined", joined), ("search_text", denormalized)):
+            page = self._measure(repeat, lambda: list(queryset[:size]))
+            count = self._measure(repeat, queryset.count)
+            self.stdout.write(
+                f"{label:>11}: first page {page:8.2f} ms | count {count:8.2f} ms"
+            )
+
+    def _seed_reservations(self, count, per_event):
+        """
+        Bulk create ``count`` reservations spread over ``count / per_event``
+        events, each attendee reserving once per event.
+        """
+        category, _ = Category.objects.get_or_create(name="Benchmark")
+        start = timezone.now() + timedelta(days=1)
+        offset = User.objects.count()
+        events = Event.objects.bulk_create(
+            (
+                Event(
+                    name=f"Benchmark event {i}",
+                    description="Reservation search benchmark",
+                    date=start + timedelta(minutes=i),
+                    location="Benchmark",
+                    category=category,
+                )
+                for i in range(-(-count // per_event))
+            ),
+            batch_size=5000,
+        )
+        users = User.objects.bulk_create(
+            (
+                User(
+                    email=f"attendee{offset + i}@benchmark.test",
+                    username=f"benchmark{offset + i}",
+                    password="!",
+                )
+                for i in range(per_event)
+            ),
+            batch_size=5000,
+        )
+        attendees = Attendee.objects.bulk_create(
+            (Attendee(user=user) for user in users), batch_size=5000
+        )
+        Reservation.objects.bulk_create(
+            (
+                Reservation(
+                    event=events[i // per_event],
+                    attendee=attendees[i % per_event],
+                    search_text=build_search_text(
+                        events[i // per_event].name,
+                        attendees[i % per_event].user.email,
+                    ),
+                )
+                for i in range(count)
+            ),
+            batch_size=5000,
+        )
+        self.stdout.write(self.style.SUCCESS(f"Seeded {count} reservations."))
+
+    def _measure(self, repeat, fetch):
+        timings = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            fetch()
+            timings.append((time.perf_counter() - start) * 1000)
+        return statistics.median(timings)
@@ -0,0 +1,39 @@
+from django.core.management.base import BaseCommand
+from event_management.services import (
+    find_confirmed_count_drift,
+    recompute_confirmed_counts,
+)
+
+
+class Command(BaseCommand):
+    help = "Detects and repairs drift in the denormalized Event.confirmed_count."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Only report the drifted events without repairing them.",
+        )
+
+    def handle(self, *args, **options):
+        drifted = list(find_confirmed_count_drift())
+        for event in drifted:
+            self.stdout.write(
+                f"{event['id']} ({event['name']}): stored {event['confirmed_count']}, "
+                f"actual {event['actual']}"
+            )
+
+        if not drifted:
+            self.stdout.write(self.style.SUCCESS("All confirmed counts are in sync."))
+            return
+
+        if options["dry_run"]:
+            self.stdout.write(
+                self.style.WARNING(f"{len(drifted)} event(s) out of sync (dry run).")
+            )
+            return
+
+        recompute_confirmed_counts(event["id"] for event in drifted)
+        self.stdout.write(
+            self.style.SUCCESS(f"Repaired {len(drifted)} event confirmed count(s).")
+        )
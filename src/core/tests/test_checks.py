@@ -0,0 +1,36 @@
+from django.test import SimpleTestCase, override_settings
+from core.checks import check_database_connections
+
+POSTGRES = {"ENGINE": "django.db.backends.postgresql", "NAME": "events"}
+
+
+class TestDatabaseConnectionChecks(SimpleTestCase):
+    """
+    Test cases for the startup validation of the database connection settings.
+    """
+
+    def check_ids(self):
+        return [message.id for message in check_database_connections(None)]
+
+    @override_settings(
+        DATABASES={
+            "default": {**POSTGRES, "CONN_MAX_AGE": 60, "CONN_HEALTH_CHECKS": True}
+        }
+    )
+    def test_persistent_connections_with_health_checks(self):
+        self.assertEqual(self.check_ids(), [])
+
+    @override_settings(DATABASES={"default": {**POSTGRES, "CONN_MAX_AGE": -1}})
+    def test_invalid_conn_max_age(self):
+        self.assertEqual(self.check_ids(), ["core.E001"])
+
+    @override_settings(DATABASES={"default": {**POSTGRES, "CONN_MAX_AGE": 60}})
+    def test_persistent_connections_without_health_checks(self):
+        self.assertEqual(self.check_ids(), ["core.W001"])
+
+    @override_settings(
+        DB_PGBOUNCER_TRANSACTION_POOLING=True,
+        DATABASES={"default": {**POSTGRES, "DISABLE_SERVER_SIDE_CURSORS": False}},
+    )
+    def test_pgbouncer_requires_disabled_server_side_cursors(self):
+        self.assertEqual(self.check_ids(), ["core.E002"])
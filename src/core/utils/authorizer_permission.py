@@ -4,10 +4,14 @@ This file contains the permission class for the authorizer.
 
 import logging
 import jwt
+from asgiref.sync import sync_to_async
 from rest_framework.permissions import BasePermission
 from django.conf import settings
 from security.models import User
-from core.utils.errors import APIErrors, CustomAPIException
+from core.utils.errors import APIErrors, AuthErrors, CustomAPIException
+from core.utils.permission_cache import get_permission_version
+from core.utils.token_cache import token_cache
+from core.utils.token_user import TokenUser
 
 logger = logging.getLogger(__name__)
 
@@ -28,22 +32,75 @@ class AuthorizerPermission(BasePermission):
         Returns:
             bool: True if the user has permission, otherwise raises a CustomAPIException.
         """
-        token = self._get_token_from_header(request)
+        user_id, payload = self._authenticate(request)
+        request.user = self._guard(self._get_user, user_id, payload)
+        return True
+
+    async def ahas_permission(self, request, view):
+        """
+        Async-safe variant of ``has_permission`` for the ASGI views.
+
+        The token is verified in the event loop (CPU only) and the user is
+        loaded with the async ORM.
+
+        Parameters:
+            request (HttpRequest): The current request instance.
+            view (View): The view instance being accessed.
 
+        Returns:
+            bool: True if the user has permission, otherwise raises a CustomAPIException.
+        """
+        user_id, payload = self._authenticate(request)
         try:
-            payload = jwt.decode(
-                jwt=token, key=settings.SECRET_KEY, algorithms=["HS256"]
+            request.user = await self._aget_user(user_id, payload)
+        except CustomAPIException:
+            raise
+        except Exception as e:
+            logger.error("Unexpected error during token processing: %s", e)
+            raise CustomAPIException(
+                detail=APIErrors.SERVER_ERROR["message"],
+                code=APIErrors.SERVER_ERROR["code"],
             )
-            user_id = payload.get("user_id")
+        return True
 
-            if not user_id:
-                raise CustomAPIException(
-                    detail=APIErrors.INVALID_AUTH_TOKEN["message"],
-                    code=APIErrors.INVALID_AUTH_TOKEN["code"],
-                )
+    def _authenticate(self, request):
+        """
+        Verifies the JWT token of the request.
 
-            request.user = self._get_user(user_id)
+        Tokens already verified with the current key are answered from the
+        in-process ``token_cache`` until they expire.
 
+        Parameters:
+            request (HttpRequest): The current request instance.
+
+        Returns:
+            tuple: The user ID and the verified token payload.
+
+        Raises:
+            CustomAPIException: If the token is missing, invalid or expired.
+        """
+        token = self._get_token_from_header(request)
+        key = settings.SECRET_KEY
+        payload = token_cache.get(token, key)
+        if payload is None:
+            payload = self._guard(jwt.decode, jwt=token, key=key, algorithms=["HS256"])
+            token_cache.set(token, key, payload)
+        user_id = payload.get("user_id")
+        if not user_id:
+            raise CustomAPIException(
+                detail=APIErrors.INVALID_AUTH_TOKEN["message"],
+                code=APIErrors.INVALID_AUTH_TOKEN["code"],
+            )
+        return user_id, payload
+
+    def _guard(self, func, *args, **kwargs):
+        """
+        Calls ``func`` translating token and unexpected errors to API errors.
+        """
+        try:
+            return func(*args, **kwargs)
+        except CustomAPIException:
+            raise
         except jwt.ExpiredSignatureError:
             raise CustomAPIException(
                 detail=APIErrors.EXPIRED_AUTH_TOKEN["message"],
@@ -61,8 +118,6 @@ class AuthorizerPermission(BasePermission):
                 code=APIErrors.SERVER_ERROR["code"],
             )
 
-        return True
-
     def _get_token_from_header(self, request):
         """
         Extracts the JWT token from the Authorization header.
@@ -84,19 +139,28 @@ class AuthorizerPermission(BasePermission):
             )
         return auth_header.split(" ")[1]
 
-    def _get_user(self, user_id):
+    def _get_user(self, user_id, payload=None):
         """
         Retrieves the user instance by user_id.
 
+        When ``STATELESS_JWT_AUTH`` is enabled and the token carries current
+        stateless claims, a lazy ``TokenUser`` is returned instead, so no query
+        is made unless a model attribute is accessed.
+
         Parameters:
             user_id (int): The ID of the user to retrieve.
+            payload (dict, optional): The verified token payload.
 
         Returns:
-            User: The user instance.
+            User | TokenUser: The user instance.
 
         Raises:
-            CustomAPIException: If the user does not exist.
+            CustomAPIException: If the user does not exist or is inactive.
         """
+        token_user = self._get_token_user(payload)
+        if token_user is not None:
+            return token_user
+
         try:
             return User.objects.get(id=user_id)
         except User.DoesNotExist:
@@ -104,3 +168,80 @@ class AuthorizerPermission(BasePermission):
                 detail=APIErrors.RESOURCE_NOT_FOUND["message"],
                 code=APIErrors.RESOURCE_NOT_FOUND["code"],
             )
+
+    async def _aget_user(self, user_id, payload=None):
+        """
+        Async variant of ``_get_user``, loading the user with the async ORM.
+        """
+        token_user = await self._aget_token_user(payload)
+        if token_user is not None:
+            return token_user
+
+        try:
+            return await User.objects.aget(id=user_id)
+        except User.DoesNotExist:
+            raise CustomAPIException(
+                detail=APIErrors.RESOURCE_NOT_FOUND["message"],
+                code=APIErrors.RESOURCE_NOT_FOUND["code"],
+            )
+
+    @staticmethod
+    def _is_stateless(payload):
+        """
+        Whether stateless authentication is enabled and the token supports it.
+        """
+        return bool(
+            payload
+            and getattr(settings, "STATELESS_JWT_AUTH", False)
+            and TokenUser.supports(payload)
+        )
+
+    @staticmethod
+    def _build_token_user(payload, permission_version):
+        """
+        Builds a ``TokenUser`` if the token's claims are still current.
+
+        The claims are only trusted while the token's ``perm_version`` matches
+        the user's current permission version, which the security signals
+        rotate when the user (e.g. ``is_active``) or their roles change.
+        Otherwise the user is loaded from the database.
+
+        Returns:
+            TokenUser | None: The user built from the claims, or None.
+
+        Raises:
+            CustomAPIException: If the token belongs to an inactive account.
+        """
+        if payload["perm_version"] != permission_version:
+            return None
+        if not payload["is_active"]:
+            raise CustomAPIException(
+                detail=AuthErrors.INACTIVE_ACCOUNT["message"],
+                code=AuthErrors.INACTIVE_ACCOUNT["code"],
+            )
+        return TokenUser(payload)
+
+    def _get_token_user(self, payload):
+        """
+        Builds a ``TokenUser`` when stateless authentication applies.
+
+        Returns:
+            TokenUser | None: The user built from the claims, or None.
+        """
+        if not self._is_stateless(payload):
+            return None
+        return self._build_token_user(
+            payload, get_permission_version(payload["user_id"])
+        )
+
+    async def _aget_token_user(self, payload):
+        """
+        Async variant of ``_get_token_user``; the permission version is read
+        in the sync thread, since the shared cache may be a database cache.
+        """
+        if not self._is_stateless(payload):
+            return None
+        permission_version = await sync_to_async(get_permission_version)(
+            payload["user_id"]
+        )
+        return self._build_token_user(payload, permission_version)
@@ -0,0 +1,145 @@
+"""
+Chunked ``QuerySet.update`` for bulk actions over large selections.
+
+A single ``UPDATE`` over hundreds of thousands of rows holds their row locks
+until it commits. ``batched_update`` walks the selection by primary key and
+updates it range by range, each range in its own short transaction, calling
+an invalidation hook once per batch. Selections above
+``BULK_UPDATE_ASYNC_THRESHOLD`` rows are handed to a django-q task.
+"""
+
+import logging
+from collections import namedtuple
+from django.apps import apps
+from django.conf import settings
+from django.db import transaction
+from django.utils.module_loading import import_string
+from django_q.tasks import async_task
+
+logger = logging.getLogger(__name__)
+
+BulkUpdateResult = namedtuple("BulkUpdateResult", ["rows", "batches", "task_id"])
+
+
+def _batch_size():
+    return getattr(settings, "BULK_UPDATE_BATCH_SIZE", 1000)
+
+
+def _async_threshold():
+    return getattr(settings, "BULK_UPDATE_ASYNC_THRESHOLD", 20000)
+
+
+def batched_update(queryset, values, on_batch=None, total=None):
+    """
+    Update the rows of a queryset in primary-key ranges of
+    ``BULK_UPDATE_BATCH_SIZE`` rows, one transaction per range.
+
+    Parameters:
+        queryset (QuerySet): The selected rows.
+        values (dict): The fields to set, as given to ``QuerySet.update``.
+        on_batch (str, optional): Dotted path of a hook called with the
+            rows of each batch (selected by primary key, without the
+            caller's filters) inside its transaction, e.g. to resync
+            counters or expire caches once per batch instead of per row.
+        total (int, optional): The number of selected rows, for progress logs.
+
+    Returns:
+        BulkUpdateResult: The rows updated and the number of batches.
+    """
+    hook = import_string(on_batch) if on_batch else None
+    label = queryset.model._meta.label
+    pks = queryset.order_by("pk").values_list("pk", flat=True)
+    rows = batches = 0
+    last_pk = None
+    while True:
+        chunk = pks if last_pk is None else pks.filter(pk__gt=last_pk)
+        batch = list(chunk[: _batch_size()])
+        if not batch:
+            break
+        last_pk = batch[-1]
+        with transaction.atomic():
+            batch_queryset = queryset.order_by().filter(
+                pk__gte=batch[0], pk__lte=last_pk
+            )
+            rows += batch_queryset.update(**values)
+            if hook is not None:
+                # By primary key: the caller's filters may no longer match
+                # the rows once they are updated.
+                hook(queryset.model._base_manager.filter(pk__in=batch))
+        batches += 1
+        logger.info(
+            "Bulk update of %s: batch %d, %d/%s rows",
+            label,
+            batches,
+            rows,
+            total if total is not None else "?",
+        )
+    return BulkUpdateResult(rows, batches, None)
+
+
+def run_batched_update(model_label, query, values, on_batch=None, total=None):
+    """
+    django-q entry point of ``batched_update``; querysets are rebuilt from
+    their pickled ``query``.
+
+    Parameters:
+        model_label (str): The ``app_label.ModelName`` of the rows.
+        query (Query): The ``query`` of the selected queryset.
+        values (dict): The fields to set.
+        on_batch (str, optional): Dotted path of the per-batch hook.
+        total (int, optional): The number of selected rows.
+
+    Returns:
+        BulkUpdateResult: The rows updated and the number of batches.
+    """
+    queryset = apps.get_model(model_label)._base_manager.all()
+    queryset.query = query
+    return batched_update(queryset, values, on_batch, total)
+
+
+def bulk_update(queryset, values, on_batch=None):
+    """
+    Run ``batched_update`` inline, or in a django-q task when the selection
+    has more than ``BULK_UPDATE_ASYNC_THRESHOLD`` rows.
+
+    Parameters:
+        queryset (QuerySet): The selected rows.
+        values (dict): The fields to set.
+        on_batch (str, optional): Dotted path of the per-batch hook.
+
+    Returns:
+        BulkUpdateResult: The rows updated and batches run inline, or the
+        ID of the task the update was queued as.
+    """
+    total = queryset.count()
+    if total > _async_threshold():
+        task_id = async_task(
+            "core.utils.batched_update.run_batched_update",
+            queryset.model._meta.label,
+            queryset.query,
+            values,
+            on_batch,
+            total,
+        )
+        return BulkUpdateResult(total, None, task_id)
+    return batched_update(queryset, values, on_batch, total)
+
+
+def message_bulk_update(modeladmin, request, result):
+    """
+    Tell the admin user how a bulk action was carried out.
+
+    Parameters:
+        modeladmin (ModelAdmin): The admin the action ran on.
+        request (HttpRequest): The current request.
+        result (BulkUpdateResult): The result of ``bulk_update``.
+    """
+    name = modeladmin.model._meta.verbose_name_plural
+    if result.task_id:
+        message = (
+            f"{result.rows} {name} are being updated in the background "
+            f"(task {result.task_id})."
+        )
+    else:
+        message = f"{result.rows} {name} updated in {result.batches} batch(es)."
+    modeladmin.message_user(request, message)
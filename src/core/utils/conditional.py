@@ -0,0 +1,162 @@
+"""
+HTTP conditional GET support (ETag / Last-Modified) for querysets.
+
+The validators come from one aggregate over the rows a response is built
+from: their count catches insertions and deletions, the latest ``modified_at``
+of the rows (and of the related rows they embed) catches edits. Fields
+reached through a many-valued relation (e.g. ``speakers__modified_at``) get
+their own ``Max``, so rows without related objects do not blank the result,
+and the rows are then counted distinctly. The latest
+soft deletion of the model, read through the partial ``deleted_at`` index of
+the model, is folded into Last-Modified, so clients that only send
+``If-Modified-Since`` still see deletions. Keyset-paginated lists skip the
+count, which would scan every filtered row for a page that never needs it.
+"""
+
+import hashlib
+from django.core.exceptions import ValidationError
+from django.db.models import Count, F, Max
+from django.db.models.constants import LOOKUP_SEP
+from django.db.models.functions import Greatest
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, quote_etag
+
+
+def _is_many_valued(model, path):
+    """
+    Whether a field path crosses a many-to-many or reverse foreign key relation.
+    """
+    for name in path.split(LOOKUP_SEP)[:-1]:
+        field = model._meta.get_field(name)
+        if field.many_to_many or field.one_to_many:
+            return True
+        model = field.related_model
+    return False
+
+
+def queryset_validators(queryset, modified_fields=("modified_at",), key="", count=True):
+    """
+    Compute the ETag and Last-Modified of the rows of a queryset.
+
+    Parameters:
+        queryset (QuerySet): The filtered rows, without pagination or limit.
+        modified_fields (tuple): Fields whose latest value is the last change,
+            e.g. ``("modified_at", "category__modified_at")``; the first
+            one must be a field of the model itself.
+        key (str): Request parameters that change the body (filters, page).
+        count (bool): Fold the number of rows into the ETag.
+
+    Returns:
+        tuple: The quoted ETag and the Last-Modified timestamp (or None).
+    """
+    many = [
+        field for field in modified_fields if _is_many_valued(queryset.model, field)
+    ]
+    single = [field for field in modified_fields if field not in many]
+    latest = Greatest(*map(F, single)) if len(single) > 1 else F(single[0])
+    aggregates = {"last_modified": Max(latest)}
+    for index, field in enumerate(many):
+        aggregates[f"last_related_{index}"] = Max(field)
+    if count:
+        aggregates["rows"] = Count("pk", distinct=bool(many))
+    stats = queryset.order_by().aggregate(**aggregates)
+    last_modified = max(
+        (value for name, value in stats.items() if name != "rows" and value),
+        default=None,
+    )
+
+    deleted = getattr(queryset.model, "all_objects", None)
+    if deleted is not None:
+        last_deleted = deleted.aggregate(latest=Max("deleted_at"))["latest"]
+        if last_deleted and (last_modified is None or last_deleted > last_modified):
+            last_modified = last_deleted
+
+    stamp = last_modified.isoformat() if last_modified else ""
+    fingerprint = f"{key}:{stats.get('rows', '')}:{stamp}"
+    etag = quote_etag(hashlib.sha256(fingerprint.encode()).hexdigest()[:32])
+    return etag, int(last_modified.timestamp()) if last_modified else None
+
+
+def not_modified_response(request, validators):
+    """
+    Return a ``304 Not Modified`` response if the client's copy is current.
+
+    Parameters:
+        request (HttpRequest): The current request.
+        validators (tuple): The ETag and Last-Modified from ``queryset_validators``.
+
+    Returns:
+        HttpResponse | None: The 304 response, or None to build the full one.
+    """
+    etag, last_modified = validators
+    response = get_conditional_response(request, etag=etag, last_modified=last_modified)
+    return add_validators(response, validators) if response is not None else None
+
+
+def add_validators(response, validators):
+    """
+    Set the ETag, Last-Modified and revalidation headers on a response.
+
+    Returns:
+        HttpResponse: The same response.
+    """
+    if validators is None:
+        return response
+    etag, last_modified = validators
+    response["ETag"] = etag
+    if last_modified:
+        response["Last-Modified"] = http_date(last_modified)
+    response["Cache-Control"] = "private, no-cache"
+    return response
+
+
+class ConditionalGetMixin:
+    """
+    Viewset mixin answering ``list`` and ``retrieve`` conditionally.
+
+    Views list the ``modified_at`` fields their representation depends on in
+    ``conditional_modified_fields``, including those of embedded relations,
+    or override ``get_conditional_modified_fields`` when the embedded
+    relations depend on the request.
+    """
+
+    conditional_modified_fields = ("modified_at",)
+
+    def get_conditional_key(self):
+        """
+        Normalized query parameters, so equivalent URLs share an ETag.
+        """
+        params = sorted(
+            (name, value)
+            for name, values in self.request.query_params.lists()
+            for value in values
+        )
+        return f"{self.action}:{self.kwargs}:{params}"
+
+    def get_conditional_modified_fields(self):
+        return self.conditional_modified_fields
+
+    def get_validators(self, queryset):
+        uses_keyset = getattr(self.paginator, "uses_keyset", None)
+        return queryset_validators(
+            queryset,
+            self.get_conditional_modified_fields(),
+            self.get_conditional_key(),
+            count=not (uses_keyset and uses_keyset(self.request)),
+        )
+
+    def get_object_validators(self):
+        """
+        Validators of the object addressed by the URL, computed before loading it.
+
+        Returns:
+            tuple | None: The validators, or None if the lookup value is invalid.
+        """
+        lookup_url_kwarg = self.lookup_url_kwarg or self.lookup_field
+        try:
+            queryset = self.filter_queryset(self.get_queryset()).filter(
+                **{self.lookup_field: self.kwargs[lookup_url_kwarg]}
+            )
+            return self.get_validators(queryset)
+        except (TypeError, ValueError, ValidationError):
+            return None
@@ -65,6 +65,10 @@ class FormErrors:
         "code": "FORM010",
         "message": "A featured event must have a description",
     }
+    NO_AVAILABLE_SLOTS = {
+        "code": "no_available_slots",
+        "message": "This event has no available slots.",
+    }
 
 
 class AuthErrors:
@@ -0,0 +1,116 @@
+"""
+Bounded in-process LRU cache with per-entry expiry and hit/miss metrics.
+
+Shared by the in-process caches of the project (generated reports, verified
+tokens). Each entry has a weight (1 by default, e.g. its size in bytes for
+reports); the least recently used entries are evicted until the total weight
+fits in ``max_weight``.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+
+
+class LRUCache:
+    """
+    Thread-safe LRU of values that expire at a given timestamp.
+
+    Hits, misses, evictions and expirations are counted for monitoring.
+    """
+
+    def __init__(self, max_weight, weigh=None):
+        """
+        Parameters:
+            max_weight (int): Upper bound of the total weight of the entries;
+                0 disables the cache.
+            weigh (callable, optional): Returns the weight of a value;
+                every entry weighs 1 when omitted.
+        """
+        self.max_weight = max_weight
+        self.weigh = weigh or (lambda value: 1)
+        self._entries = OrderedDict()
+        self._weight = 0
+        self._lock = threading.RLock()
+        self.hits = self.misses = self.evictions = self.expirations = 0
+
+    def _discard(self, key):
+        """
+        Remove an entry and its weight. Called with the lock held.
+        """
+        _, value = self._entries.pop(key)
+        self._weight -= self.weigh(value)
+
+    def get(self, key):
+        """
+        Return the cached value of a key and mark it as recently used.
+
+        Returns:
+            object: The cached value, or None on a miss.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            if entry[0] <= time.time():
+                self._discard(key)
+                self.expirations += 1
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def set(self, key, value, expires_at):
+        """
+        Store a value until ``expires_at``, evicting the least recently used
+        entries if needed.
+
+        Parameters:
+            key (hashable): The cache key.
+            value (object): The value to store.
+            expires_at (float): The UNIX timestamp the entry expires at.
+
+        Returns:
+            bool: True if the value was cached, False if it weighs more than
+            the whole cache.
+        """
+        weight = self.weigh(value)
+        if not self.max_weight or weight > self.max_weight:
+            return False
+        with self._lock:
+            if key in self._entries:
+                self._discard(key)
+            self._entries[key] = (expires_at, value)
+            self._weight += weight
+            while self._weight > self.max_weight:
+                self._discard(next(iter(self._entries)))
+                self.evictions += 1
+        return True
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._weight = 0
+            self.hits = self.misses = self.evictions = self.expirations = 0
+
+    def stats(self):
+        """
+        Return the cache metrics.
+
+        Returns:
+            dict: Hits, misses, evictions, expirations, hit rate, number of
+            entries and their total weight.
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "entries": len(self._entries),
+                "weight": self._weight,
+            }
@@ -1,4 +1,18 @@
-from rest_framework.pagination import PageNumberPagination
+import base64
+import binascii
+import json
+from collections import OrderedDict
+from datetime import date, datetime
+from django.core.exceptions import ValidationError
+from django.core.paginator import Paginator
+from django.db import connections
+from django.db.models import Q
+from django.utils.functional import cached_property
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination, PageNumberPagination
+from rest_framework.response import Response
+from rest_framework.settings import api_settings
+from rest_framework.utils.urls import remove_query_param, replace_query_param
 
 
 class CustomPageNumberPagination(PageNumberPagination):
@@ -12,3 +26,259 @@ class CustomPageNumberPagination(PageNumberPagination):
     """
 
     page_size_query_param = "size"
+
+
+class KeysetPagination(BasePagination):
+    """
+    Keyset (cursor) pagination over a unique, ascending ordering.
+
+    Each page is fetched with ``WHERE (k1, k2) > (last_k1, last_k2) ORDER BY
+    k1, k2 LIMIT size``, so deep pages cost the same as the first one and
+    pages stay stable when rows are inserted. The ordering comes from the
+    view's ``keyset_ordering`` attribute and must end with a unique field.
+    The ``COUNT(*)`` query only runs when the client sends ``?count=true``.
+
+    Attributes:
+    page_size_query_param (str): Query parameter to set the page size.
+    cursor_query_param (str): Query parameter carrying the opaque cursor.
+    count_query_param (str): Query parameter to request the total count.
+    """
+
+    page_size = api_settings.PAGE_SIZE
+    page_size_query_param = "size"
+    max_page_size = 1000
+    cursor_query_param = "cursor"
+    count_query_param = "count"
+    invalid_cursor_message = "Invalid cursor"
+
+    def paginate_queryset(self, queryset, request, view=None):
+        """
+        Return the page of rows that follows (or precedes) the cursor.
+        """
+        self.request = request
+        self.ordering = tuple(getattr(view, "keyset_ordering", ("pk",)))
+        self.page_size = self.get_page_size(request)
+        position, reverse = self.decode_cursor(request)
+
+        self.count = None
+        if request.query_params.get(self.count_query_param, "").lower() == "true":
+            self.count = queryset.count()
+
+        if position is not None:
+            queryset = queryset.filter(self._seek(queryset.model, position, reverse))
+        ordering = [f"-{field}" if reverse else field for field in self.ordering]
+        rows = list(queryset.order_by(*ordering)[: self.page_size + 1])
+
+        has_more = len(rows) > self.page_size
+        rows = rows[: self.page_size]
+        if reverse:
+            rows.reverse()
+            self.has_next, self.has_previous = position is not None, has_more
+        else:
+            self.has_next, self.has_previous = has_more, position is not None
+
+        self.page = rows
+        return rows
+
+    def get_paginated_response(self, data):
+        """
+        Return the page with the links to the adjacent pages.
+        """
+        payload = OrderedDict()
+        if self.count is not None:
+            payload["count"] = self.count
+        payload["next"] = self.get_next_link()
+        payload["previous"] = self.get_previous_link()
+        payload["results"] = data
+        return Response(payload)
+
+    def get_page_size(self, request):
+        """
+        Read the page size from the query string, bounded by ``max_page_size``.
+        """
+        try:
+            size = int(request.query_params[self.page_size_query_param])
+        except (KeyError, ValueError):
+            return self.page_size
+        return min(size, self.max_page_size) if size > 0 else self.page_size
+
+    def get_next_link(self):
+        if not self.has_next or not self.page:
+            return None
+        return self._link(self.page[-1], reverse=False)
+
+    def get_previous_link(self):
+        if not self.has_previous:
+            return None
+        if not self.page:
+            url = self.request.build_absolute_uri()
+            return remove_query_param(url, self.cursor_query_param)
+        return self._link(self.page[0], reverse=True)
+
+    def decode_cursor(self, request):
+        """
+        Decode the cursor from the query string.
+
+        Returns:
+            tuple: The key values of the boundary row (or None) and whether
+            the page goes backwards.
+
+        Raises:
+            NotFound: If the cursor is malformed.
+        """
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None, False
+        try:
+            cursor = json.loads(base64.urlsafe_b64decode(encoded.encode()))
+            position, reverse = cursor["p"], bool(cursor.get("r"))
+        except (TypeError, ValueError, KeyError, binascii.Error):
+            raise NotFound(self.invalid_cursor_message)
+        if not isinstance(position, list) or len(position) != len(self.ordering):
+            raise NotFound(self.invalid_cursor_message)
+        return position, reverse
+
+    def _seek(self, model, position, reverse):
+        """
+        Build the lexicographic ``(k1, k2, ...) > (v1, v2, ...)`` condition.
+        """
+        lookup = "lt" if reverse else "gt"
+        try:
+            values = [
+                model._meta.get_field(field).to_python(value)
+                for field, value in zip(self._field_names(model), position)
+            ]
+        except ValidationError:
+            raise NotFound(self.invalid_cursor_message)
+        condition = Q()
+        for index, field in enumerate(self.ordering):
+            step = Q(**{f"{field}__{lookup}": values[index]})
+            for previous, value in zip(self.ordering[:index], values[:index]):
+                step &= Q(**{previous: value})
+            condition |= step
+        # Redundant range on the leading key lets the planner seek the index.
+        return Q(**{f"{self.ordering[0]}__{lookup}e": values[0]}) & condition
+
+    def _field_names(self, model):
+        return [model._meta.pk.name if f == "pk" else f for f in self.ordering]
+
+    def encode_cursor(self, row, reverse=False):
+        """
+        Encode the key values of a row into an opaque cursor.
+
+        Parameters:
+            row (Model): The boundary row of the page.
+            reverse (bool): Whether the cursor points backwards.
+
+        Returns:
+            str: The URL-safe cursor.
+        """
+        position = [self._serialize(getattr(row, field)) for field in self.ordering]
+        cursor = json.dumps({"p": position, "r": int(reverse)}, separators=(",", ":"))
+        return base64.urlsafe_b64encode(cursor.encode()).decode()
+
+    def _link(self, row, reverse):
+        url = self.request.build_absolute_uri()
+        return replace_query_param(
+            url, self.cursor_query_param, self.encode_cursor(row, reverse)
+        )
+
+    @staticmethod
+    def _serialize(value):
+        # Full precision ISO format; DjangoJSONEncoder would drop microseconds.
+        if isinstance(value, (datetime, date)):
+            return value.isoformat()
+        return str(value)
+
+    def get_schema_operation_parameters(self, view):
+        return [
+            {
+                "name": self.cursor_query_param,
+                "required": False,
+                "in": "query",
+                "description": "The pagination cursor value.",
+                "schema": {"type": "string"},
+            },
+            {
+                "name": self.page_size_query_param,
+                "required": False,
+                "in": "query",
+                "description": "Number of results to return per page.",
+                "schema": {"type": "integer"},
+            },
+            {
+                "name": self.count_query_param,
+                "required": False,
+                "in": "query",
+                "description": "Set to true to include the total count.",
+                "schema": {"type": "boolean"},
+            },
+        ]
+
+
+class OptionalKeysetPagination(BasePagination):
+    """
+    Page-number pagination by default, keyset pagination on demand.
+
+    Clients opt in with ``?pagination=cursor`` (or by sending a ``cursor``);
+    everything else keeps the ``CustomPageNumberPagination`` behaviour.
+    """
+
+    mode_query_param = "pagination"
+
+    def uses_keyset(self, request):
+        """
+        Whether the request asks for keyset pagination.
+        """
+        return (
+            request.query_params.get(self.mode_query_param) == "cursor"
+            or KeysetPagination.cursor_query_param in request.query_params
+        )
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.paginator = (
+            KeysetPagination()
+            if self.uses_keyset(request)
+            else CustomPageNumberPagination()
+        )
+        return self.paginator.paginate_queryset(queryset, request, view)
+
+    def get_paginated_response(self, data):
+        return self.paginator.get_paginated_response(data)
+
+
+class EstimatedCountPaginator(Paginator):
+    """
+    Paginator for large admin changelists that trusts the planner's row
+    estimate instead of running an exact ``COUNT(*)`` over big tables.
+
+    On PostgreSQL the estimate comes from ``EXPLAIN``; when it is below
+    ``exact_count_threshold`` (or on other databases) the exact count is used,
+    so small tables and narrow filters still paginate precisely.
+    """
+
+    exact_count_threshold = 10000
+
+    @cached_property
+    def count(self):
+        queryset = self.object_list
+        estimate = self._estimated_count(queryset)
+        if estimate is not None and estimate >= self.exact_count_threshold:
+            return estimate
+        return super().count
+
+    @staticmethod
+    def _estimated_count(queryset):
+        """
+        Return the planner's row estimate of a queryset, or None if unknown.
+        """
+        query = getattr(queryset, "query", None)
+        if query is None or connections[queryset.db].vendor != "postgresql":
+            return None
+        sql, params = queryset.order_by().values("pk").query.sql_with_params()
+        with connections[queryset.db].cursor() as cursor:
+            cursor.execute(f"EXPLAIN (FORMAT JSON) {sql}", params)
+            plan = cursor.fetchone()[0]
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+        return int(plan[0]["Plan"]["Plan Rows"])
@@ -0,0 +1,127 @@
+"""
+Cache of the effective permission codenames of each user.
+
+The set combines the user's Django permissions with the permissions of their
+active roles. It is cached in the process and in the cache shared by every
+worker (``RESPONSE_CACHE_ALIAS``), and every entry is keyed by a version stamp
+that the security signals rotate whenever roles, role permissions or user
+permissions change. The stamps must live in the shared cache: kept in a
+per-process cache, a change made through one worker would not expire the
+entries of the others.
+"""
+
+import time
+import uuid
+from functools import lru_cache
+from django.conf import settings
+from django.contrib.auth.models import Permission
+from django.core.cache import caches
+from security.models import User, UserRol
+
+GLOBAL_VERSION_KEY = "permissions:version"
+USER_VERSION_KEY = "permissions:version:{user_id}"
+PERMISSIONS_KEY = "permissions:{user_id}:{stamp}"
+
+
+def _cache():
+    return caches[getattr(settings, "RESPONSE_CACHE_ALIAS", "default")]
+
+
+def _timeout():
+    return getattr(settings, "PERMISSION_CACHE_TIMEOUT", 300)
+
+
+def get_permission_version(user_id):
+    """
+    Read the global and per-user version tokens in one cache round trip.
+
+    Parameters:
+        user_id (UUID): The ID of the user.
+
+    Returns:
+        str: A stamp that changes whenever the user's permissions may change.
+    """
+    user_key = USER_VERSION_KEY.format(user_id=user_id)
+    versions = _cache().get_many([GLOBAL_VERSION_KEY, user_key])
+    return f"{versions.get(GLOBAL_VERSION_KEY, 0)}.{versions.get(user_key, 0)}"
+
+
+def load_permission_codenames(user_id):
+    """
+    Resolve the effective permission codenames of a user from the database.
+
+    Users without any role assignment get no permissions, as before.
+
+    Parameters:
+        user_id (UUID): The ID of the user.
+
+    Returns:
+        frozenset: The permission codenames granted to the user.
+    """
+    user = User.objects.filter(pk=user_id).first()
+    if user is None or not UserRol.objects.filter(user_id=user_id).exists():
+        return frozenset()
+
+    codenames = {perm.split(".", 1)[1] for perm in user.get_all_permissions()}
+    codenames.update(
+        Permission.objects.filter(
+            roles__userrol__user_id=user_id,
+            roles__userrol__active=True,
+            roles__userrol__deleted_at__isnull=True,
+            roles__active=True,
+            roles__deleted_at__isnull=True,
+        ).values_list("codename", flat=True)
+    )
+    return frozenset(codenames)
+
+
+@lru_cache(maxsize=1024)
+def _local_permission_codenames(user_id, stamp, time_bucket):
+    """
+    Per-process layer; the stamp and time bucket in the key expire old entries.
+    """
+    key = PERMISSIONS_KEY.format(user_id=user_id, stamp=stamp)
+    codenames = _cache().get(key)
+    if codenames is None:
+        codenames = load_permission_codenames(user_id)
+        _cache().set(key, codenames, _timeout())
+    return codenames
+
+
+def get_permission_codenames(user_id):
+    """
+    Return the cached effective permission codenames of a user.
+
+    Parameters:
+        user_id (UUID): The ID of the user.
+
+    Returns:
+        frozenset: The permission codenames granted to the user.
+    """
+    time_bucket = int(time.monotonic() // max(_timeout(), 1))
+    return _local_permission_codenames(
+        str(user_id), get_permission_version(user_id), time_bucket
+    )
+
+
+def invalidate_user_permissions(*user_ids):
+    """
+    Expire the cached permissions of the given users.
+
+    Parameters:
+        user_ids (UUID): The IDs of the users whose permissions changed.
+    """
+    _cache().set_many(
+        {
+            USER_VERSION_KEY.format(user_id=user_id): uuid.uuid4().hex
+            for user_id in user_ids
+        },
+        None,
+    )
+
+
+def invalidate_all_permissions():
+    """
+    Expire the cached permissions of every user, e.g. when a role changes.
+    """
+    _cache().set(GLOBAL_VERSION_KEY, uuid.uuid4().hex, None)
@@ -0,0 +1,38 @@
+import json
+from rest_framework.renderers import BaseRenderer
+
+
+class FileDownloadRenderer(BaseRenderer):
+    """
+    Renderer that lets ``?format=<ext>`` select a file download format.
+
+    The view returns the file itself (a ``FileResponse`` or a
+    ``StreamingHttpResponse``), so this renderer only has to pass bytes
+    through. Error payloads raised before the file is built are still
+    rendered as JSON.
+    """
+
+    charset = None
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if isinstance(data, bytes):
+            return data
+        response = (renderer_context or {}).get("response")
+        if response is not None:
+            response["Content-Type"] = "application/json"
+        return json.dumps(data).encode()
+
+
+class XLSXRenderer(FileDownloadRenderer):
+    media_type = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+    format = "xlsx"
+
+
+class CSVRenderer(FileDownloadRenderer):
+    media_type = "text/csv"
+    format = "csv"
+
+
+class NDJSONRenderer(FileDownloadRenderer):
+    media_type = "application/x-ndjson"
+    format = "ndjson"
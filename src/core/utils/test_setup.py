@@ -1,9 +1,12 @@
 from faker import Faker
 from rest_framework.test import APITestCase
 from event_management.models import Event, Reservation, Attendee, Category, Speaker
+from event_management.services import bump_event_list_version
 from security.models import User, Rol, UserRol
 from django.contrib.auth.models import Permission
 from django.conf import settings
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 import jwt
 import random
 import time
@@ -36,6 +39,34 @@ class TestSetup(APITestCase):
         """
         self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {self.token}")
 
+    def assert_constant_query_count(self, url, sizes=(1, 10), **params):
+        """
+        Assert that a list endpoint runs the same number of queries whatever
+        the page size, i.e. that it has no N+1 queries.
+
+        The caller must create at least ``max(sizes)`` rows beforehand. The
+        cached event lists are expired before each request, so every request
+        builds its page from the database.
+
+        Parameters:
+            url (str): The list endpoint URL.
+            sizes (tuple): The page sizes to compare.
+            params: Extra query parameters sent with every request.
+        """
+        # Warm up per-process caches (permissions, content types) first.
+        self.client.get(url, {"size": sizes[0], **params})
+        counts = {}
+        for size in sizes:
+            bump_event_list_version()
+            with CaptureQueriesContext(connection) as queries:
+                response = self.client.get(url, {"size": size, **params})
+            assert response.status_code == 200, response.content
+            counts[size] = len(queries)
+        assert (
+            len(set(counts.values())) == 1
+        ), f"Query count grows with the page size: {counts}"
+        return counts
+
     @staticmethod
     def _create_roles():
         """
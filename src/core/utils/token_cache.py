@@ -0,0 +1,119 @@
+"""
+In-process cache of verified JWT payloads.
+
+Verifying a token (HMAC signature plus claim validation) is repeated for every
+request although the same bearer token arrives many times. The cache maps the
+SHA-256 digest of a token (the raw token is never stored) to its verified
+payload until the token's ``exp``, capped by ``TOKEN_CACHE_TTL``, with at most
+``TOKEN_CACHE_MAX_ENTRIES`` entries evicted in LRU order. Entries are bound to
+the signing key they were verified with: when the key changes (rotation) the
+whole cache is dropped, so no token is accepted without being verified with
+the current key.
+"""
+
+import hashlib
+import time
+from django.conf import settings
+from core.utils.lru_cache import LRUCache
+
+
+class VerifiedTokenCache(LRUCache):
+    """
+    Bounded, thread-safe LRU of verified token payloads.
+
+    Only tokens carrying an ``exp`` claim are cached. Key rotations are
+    counted for monitoring along with the ``LRUCache`` metrics.
+    """
+
+    def __init__(self, max_entries, max_ttl):
+        """
+        Parameters:
+            max_entries (int): Upper bound of cached tokens; 0 disables the cache.
+            max_ttl (int): Upper bound, in seconds, of the life of an entry.
+        """
+        super().__init__(max_weight=max_entries)
+        self.max_entries = max_entries
+        self.max_ttl = max_ttl
+        self._key_digest = None
+        self.rotations = 0
+
+    @staticmethod
+    def _digest(value):
+        return hashlib.sha256(value.encode()).digest()
+
+    def _check_key(self, key):
+        """
+        Drop every entry if the signing key changed. Called with the lock held.
+        """
+        key_digest = self._digest(key)
+        if key_digest != self._key_digest:
+            if self._entries:
+                self.rotations += 1
+            self._entries.clear()
+            self._weight = 0
+            self._key_digest = key_digest
+
+    def get(self, token, key):
+        """
+        Return the cached payload of a token verified with ``key``.
+
+        Parameters:
+            token (str): The bearer token.
+            key (str): The current signing key.
+
+        Returns:
+            dict: A copy of the verified payload, or None on a miss.
+        """
+        if not self.max_entries:
+            return None
+        with self._lock:
+            self._check_key(key)
+            payload = super().get(self._digest(token))
+        return dict(payload) if payload is not None else None
+
+    def set(self, token, key, payload):
+        """
+        Cache the payload of a token just verified with ``key``.
+
+        Parameters:
+            token (str): The bearer token.
+            key (str): The signing key the token was verified with.
+            payload (dict): The verified payload.
+
+        Returns:
+            bool: True if the payload was cached, False if it has no usable
+            ``exp`` or the cache is disabled.
+        """
+        exp = payload.get("exp")
+        if not self.max_entries or not isinstance(exp, (int, float)):
+            return False
+        expires_at = min(exp, time.time() + self.max_ttl)
+        with self._lock:
+            self._check_key(key)
+            return super().set(self._digest(token), dict(payload), expires_at)
+
+    def clear(self):
+        with self._lock:
+            super().clear()
+            self._key_digest = None
+            self.rotations = 0
+
+    def stats(self):
+        """
+        Return the cache metrics.
+
+        Returns:
+            dict: Hits, misses, evictions, expirations, key rotations, hit
+            rate and number of entries.
+        """
+        with self._lock:
+            stats = super().stats()
+            stats.pop("weight")
+            stats["rotations"] = self.rotations
+            return stats
+
+
+token_cache = VerifiedTokenCache(
+    max_entries=getattr(settings, "TOKEN_CACHE_MAX_ENTRIES", 10000),
+    max_ttl=getattr(settings, "TOKEN_CACHE_TTL", 300),
+)
@@ -0,0 +1,69 @@
+"""
+Lightweight user built from the claims of a verified access token.
+"""
+
+from django.utils.functional import cached_property
+from security.models import User
+from core.utils.errors import APIErrors, CustomAPIException
+
+STATELESS_CLAIMS = ("user_id", "is_active", "perm_version", "roles")
+
+
+class TokenUser:
+    """
+    Request user backed by JWT claims instead of a database row.
+
+    Exposes ``id``, ``is_active``, ``role_ids`` and ``permission_version``
+    straight from the token. Any other attribute (email, username, ...) loads
+    the real ``User`` once, on first access.
+    """
+
+    is_authenticated = True
+    is_anonymous = False
+
+    def __init__(self, payload):
+        """
+        Parameters:
+            payload (dict): The decoded and verified token payload.
+        """
+        self.id = self.pk = payload["user_id"]
+        self.is_active = payload["is_active"]
+        self.role_ids = tuple(payload["roles"])
+        self.permission_version = payload["perm_version"]
+
+    @classmethod
+    def supports(cls, payload):
+        """
+        Whether the token carries every claim needed to skip the user fetch.
+
+        Parameters:
+            payload (dict): The decoded token payload.
+
+        Returns:
+            bool: True if the payload has all the stateless claims.
+        """
+        return all(claim in payload for claim in STATELESS_CLAIMS)
+
+    @cached_property
+    def _user(self):
+        try:
+            return User.objects.get(id=self.id)
+        except User.DoesNotExist:
+            raise CustomAPIException(
+                detail=APIErrors.RESOURCE_NOT_FOUND["message"],
+                code=APIErrors.RESOURCE_NOT_FOUND["code"],
+            )
+
+    def __getattr__(self, name):
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return getattr(self._user, name)
+
+    def __eq__(self, other):
+        return str(getattr(other, "pk", None)) == str(self.pk)
+
+    def __hash__(self):
+        return hash(str(self.pk))
+
+    def __str__(self):
+        return str(self.pk)
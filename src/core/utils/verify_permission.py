@@ -1,13 +1,15 @@
+import asyncio
 from functools import wraps
+from asgiref.sync import sync_to_async
 from django.http import JsonResponse
 from rest_framework import status
-from django.contrib.auth.models import Permission
-from security.models import UserRol
+from core.utils.permission_cache import get_permission_codenames
 
 
 def verify_permission(permission_codename):
     """
     Decorator to verify if a user has the required permissions for a specific action.
+    Works on both regular and ``async def`` view methods.
 
     Parameters:
         permission_codename (str): Codename of the required permission.
@@ -17,21 +19,24 @@ def verify_permission(permission_codename):
     """
 
     def decorator(view_func):
+        if asyncio.iscoroutinefunction(view_func):
+
+            @wraps(view_func)
+            async def _async_wrapped_view(instance, request, *args, **kwargs):
+                if not await ahas_permission_for_action(
+                    request.user.id, permission_codename
+                ):
+                    return permission_denied_response()
+                return await view_func(instance, request, *args, **kwargs)
+
+            return _async_wrapped_view
+
         @wraps(view_func)
         def _wrapped_view(instance, request, *args, **kwargs):
             user_id = request.user.id
 
             if not has_permission_for_action(user_id, permission_codename):
-                response = JsonResponse(
-                    {
-                        "message": "Permission denied",
-                        "status": 403,
-                        "data": None,
-                        "error": "Permission denied",
-                    },
-                    status=status.HTTP_403_FORBIDDEN,
-                )
-                return response
+                return permission_denied_response()
 
             return view_func(instance, request, *args, **kwargs)
 
@@ -40,10 +45,31 @@ def verify_permission(permission_codename):
     return decorator
 
 
+def permission_denied_response():
+    """
+    Builds the response returned when the user lacks the required permission.
+
+    Returns:
+        JsonResponse: A 403 response.
+    """
+    return JsonResponse(
+        {
+            "message": "Permission denied",
+            "status": 403,
+            "data": None,
+            "error": "Permission denied",
+        },
+        status=status.HTTP_403_FORBIDDEN,
+    )
+
+
 def has_permission_for_action(user_id, permission_codename):
     """
     Checks if the user has the required permission based on user roles.
 
+    The user's effective permissions are resolved once and cached (see
+    ``core.utils.permission_cache``), so the check is a set lookup.
+
     Parameters:
         user_id (UUID): The ID of the user.
         permission_codename (str): Codename of the required permission.
@@ -51,30 +77,19 @@ def has_permission_for_action(user_id, permission_codename):
     Returns:
         bool: True if the user has the required permission, False otherwise.
     """
+    return permission_codename in get_permission_codenames(user_id)
 
-    try:
-        user = UserRol.objects.get(user_id=user_id).user
-
-        if user.has_perm(f"{permission_codename}"):
-            return True
 
-        permission = Permission.objects.filter(codename=permission_codename).first()
-        if not permission:
-            return False
-
-        app_label = permission.content_type.app_label
-
-        roles = UserRol.objects.filter(user=user, active=True).values_list(
-            "rol", flat=True
-        )
-
-        has_permission = Permission.objects.filter(
-            roles__id__in=roles,
-            content_type__app_label=app_label,
-            codename=permission_codename,
-        ).exists()
+async def ahas_permission_for_action(user_id, permission_codename):
+    """
+    Async-safe variant of ``has_permission_for_action``; the cache and database
+    lookups run in the sync thread.
 
-        return has_permission
+    Parameters:
+        user_id (UUID): The ID of the user.
+        permission_codename (str): Codename of the required permission.
 
-    except UserRol.DoesNotExist:
-        return False
+    Returns:
+        bool: True if the user has the required permission, False otherwise.
+    """
+    return await sync_to_async(has_permission_for_action)(user_id, permission_codename)
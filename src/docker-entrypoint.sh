@@ -0,0 +1,38 @@
+#!/bin/sh
+# Container launch modes:
+#   web      serve the API with gunicorn (default)
+#   asgi     serve the API with gunicorn + uvicorn workers (async endpoints);
+#            persistent connections are disabled, see below
+#   migrate  one-shot step: wait for the database, apply the migrations and
+#            create the database cache tables
+#   worker   run the django-q cluster for background jobs
+#   dev      development server with auto reload
+set -e
+
+case "$1" in
+    web)
+        exec gunicorn -c python:config.gunicorn config.wsgi
+        ;;
+    asgi)
+        # Under ASGI each request may run its ORM calls in a different
+        # thread, so connections kept open by CONN_MAX_AGE are never reused
+        # and pile up until the server's max_connections is reached.
+        export DB_CONN_MAX_AGE=0
+        exec gunicorn -c python:config.gunicorn \
+            -k uvicorn.workers.UvicornWorker config.asgi
+        ;;
+    migrate)
+        python manage.py wait_for_db
+        python manage.py migrate --noinput
+        exec python manage.py createcachetable
+        ;;
+    worker)
+        exec python manage.py qcluster
+        ;;
+    dev)
+        exec python manage.py runserver 0.0.0.0:8000
+        ;;
+    *)
+        exec "$@"
+        ;;
+esac
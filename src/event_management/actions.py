@@ -1,16 +1,68 @@
 from django.contrib import admin
+from django.db.models.functions import Now
+from core.utils.batched_update import bulk_update, message_bulk_update
+from event_management.services import (
+    bump_event_list_version,
+    bump_report_data_version,
+    recompute_confirmed_counts,
+)
 
 
-def update_field(queryset, field_name, value):
+def update_field(queryset, field_name, value, on_batch=None):
     """
     Generic function to update a specific field in the given queryset.
 
+    The rows are updated in primary-key batches, each in a short transaction
+    (in a background task for large selections), and ``modified_at`` is
+    touched so conditional GETs see the change.
+
     Parameters:
         queryset (QuerySet): A QuerySet containing the selected objects.
         field_name (str): The name of the field to update.
         value: The value to set for the field.
+        on_batch (str, optional): Dotted path of a hook called once per batch.
+
+    Returns:
+        BulkUpdateResult: How the update was carried out.
+    """
+    return bulk_update(queryset, {field_name: value, "modified_at": Now()}, on_batch)
+
+
+def expire_event_caches(batch):
+    """
+    Per-batch hook of the event actions: ``QuerySet.update`` bypasses the
+    model signals, so the cached reports and event lists are expired here.
+    """
+    bump_report_data_version()
+    bump_event_list_version()
+
+
+def resync_reservation_counters(batch):
+    """
+    Per-batch hook of the reservation actions: recompute the confirmed
+    counters of the events of the batch in a single statement.
+    """
+    recompute_confirmed_counts(set(batch.values_list("event_id", flat=True)))
+
+
+def update_reservation_status(queryset, status):
+    """
+    Bulk update the status of reservations and resync the confirmed counters
+    of the affected events after each batch.
+
+    Parameters:
+        queryset (QuerySet): A QuerySet containing the selected reservations.
+        status (str): The new reservation status.
+
+    Returns:
+        BulkUpdateResult: How the update was carried out.
     """
-    queryset.update(**{field_name: value})
+    return update_field(
+        queryset,
+        "status",
+        status,
+        on_batch="event_management.actions.resync_reservation_counters",
+    )
 
 
 @admin.action(description="Mark selected events as featured")
@@ -26,7 +78,13 @@ def make_events_featured(modeladmin, request, queryset):
         request (HttpRequest): The current HTTP request object.
         queryset (QuerySet): A QuerySet containing the selected objects.
     """
-    update_field(queryset, "is_featured", True)
+    result = update_field(
+        queryset,
+        "is_featured",
+        True,
+        on_batch="event_management.actions.expire_event_caches",
+    )
+    message_bulk_update(modeladmin, request, result)
 
 
 @admin.action(description="Change reservations status to confirmed")
@@ -43,7 +101,8 @@ def mark_reservations_confirmed(modeladmin, request, queryset):
         request (HttpRequest): The current HTTP request object.
         queryset (QuerySet): A QuerySet containing the selected objects.
     """
-    update_field(queryset, "status", "Confirmed")
+    result = update_reservation_status(queryset, "Confirmed")
+    message_bulk_update(modeladmin, request, result)
 
 
 @admin.action(description="Change reservations status to Unconfirmed")
@@ -60,4 +119,5 @@ def mark_reservations_no_confirmed(modeladmin, request, queryset):
         request (HttpRequest): The current HTTP request object.
         queryset (QuerySet): A QuerySet containing the selected objects.
     """
-    update_field(queryset, "status", "Unconfirmed")
+    result = update_reservation_status(queryset, "Unconfirmed")
+    message_bulk_update(modeladmin, request, result)
@@ -1,5 +1,6 @@
 from django.contrib import admin
-from .models import Event, Reservation
+from core.utils.pagination import EstimatedCountPaginator
+from .models import Attendee, Event, Reservation
 from .forms import EventForm
 from .actions import (
     make_events_featured,
@@ -21,10 +22,13 @@ class EventAdmin(admin.ModelAdmin):
 
     form = EventForm
     list_display = ("name", "date", "location", "category", "is_featured")
+    list_select_related = ("category",)
     list_filter = ("date", "category", "location")
-    search_fields = ("name", "description", "location", "category")
+    search_fields = ("name", "description", "location", "category__name")
     ordering = ["date"]
     actions = [make_events_featured]
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
     fieldsets = (
         (None, {"fields": ("name", "description", "date", "is_featured")}),
         (
@@ -48,11 +52,35 @@ class ReservationAdmin(admin.ModelAdmin):
     Displays a list of reservations showing the event, attendee, reservation date,
     and status. Supports filtering by status and reservation date, and searching
     by event name and attendee's email. Reservations are ordered by reservation date.
-    Includes an action to mark reservations as confirmed.
+    Includes an action to mark reservations as confirmed. The event and the
+    attendee's user are joined in the changelist query, and picked through
+    autocomplete widgets instead of full-table dropdowns.
     """
 
     list_display = ("event", "attendee", "reservation_date", "status")
+    list_select_related = ("event", "attendee__user")
     list_filter = ("status", "reservation_date")
     search_fields = ("event__name", "attendee__user__email")
+    autocomplete_fields = ("event", "attendee")
     ordering = ["reservation_date"]
     actions = [mark_reservations_confirmed, mark_reservations_no_confirmed]
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+
+
+@admin.register(Attendee)
+class AttendeeAdmin(admin.ModelAdmin):
+    """
+    Admin interface for managing Attendee model instances.
+
+    Lists attendees by their user's email, which the reservation autocomplete
+    searches.
+    """
+
+    list_display = ("user",)
+    list_select_related = ("user",)
+    search_fields = ("user__email",)
+    autocomplete_fields = ("user",)
+    ordering = ["user__email"]
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
@@ -0,0 +1,40 @@
+# Generated by Django 4.1.4 on 2026-10-18 03:13
+
+from django.db import migrations, models
+from django.db.models.functions import Coalesce
+
+
+def populate_confirmed_count(apps, schema_editor):
+    Event = apps.get_model("event_management", "Event")
+    Reservation = apps.get_model("event_management", "Reservation")
+    confirmed = (
+        Reservation.objects.filter(
+            event=models.OuterRef("pk"), status="Confirmed", deleted_at__isnull=True
+        )
+        .order_by()
+        .values("event")
+        .annotate(total=models.Count("pk"))
+        .values("total")
+    )
+    Event.objects.update(
+        confirmed_count=Coalesce(
+            models.Subquery(confirmed, output_field=models.IntegerField()),
+            models.Value(0),
+        )
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("event_management", "0006_alter_reservation_event"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="event",
+            name="confirmed_count",
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.RunPython(populate_confirmed_count, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 4.1.4 on 2026-10-18 03:22
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("event_management", "0007_event_confirmed_count"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="event",
+            index=models.Index(fields=["date", "id"], name="event_date_id_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="reservation",
+            index=models.Index(
+                fields=["reservation_date", "id"], name="reservation_date_id_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,77 @@
+# Generated by Django 4.1.4 on 2026-10-18 03:26
+
+from django.db import migrations, models
+import uuid
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("event_management", "0008_keyset_pagination_indexes"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ReportJob",
+            fields=[
+                (
+                    "deleted_by_cascade",
+                    models.BooleanField(default=False, editable=False),
+                ),
+                (
+                    "id",
+                    models.UUIDField(
+                        default=uuid.uuid4,
+                        editable=False,
+                        primary_key=True,
+                        serialize=False,
+                    ),
+                ),
+                ("created_at", models.DateTimeField(auto_now_add=True, null=True)),
+                (
+                    "created_by",
+                    models.UUIDField(db_column="created_by", editable=False, null=True),
+                ),
+                (
+                    "modified_at",
+                    models.DateTimeField(
+                        auto_now=True, db_column="modified_at", null=True
+                    ),
+                ),
+                (
+                    "modified_by",
+                    models.UUIDField(
+                        db_column="modified_by", editable=False, null=True
+                    ),
+                ),
+                ("deleted_at", models.DateTimeField(db_column="deleted_at", null=True)),
+                (
+                    "deleted_by",
+                    models.UUIDField(db_column="deleted_by", editable=False, null=True),
+                ),
+                (
+                    "status",
+                    models.CharField(
+                        choices=[
+                            ("Queued", "Queued"),
+                            ("Running", "Running"),
+                            ("Finished", "Finished"),
+                            ("Failed", "Failed"),
+                        ],
+                        default="Queued",
+                        max_length=20,
+                    ),
+                ),
+                ("filters", models.JSONField(blank=True, default=dict)),
+                ("file", models.FileField(blank=True, upload_to="reports/")),
+                ("error", models.TextField(blank=True)),
+                ("task_id", models.CharField(blank=True, max_length=32)),
+                ("requested_by", models.UUIDField(editable=False, null=True)),
+                ("finished_at", models.DateTimeField(blank=True, null=True)),
+            ],
+            options={
+                "db_table": "report_job",
+                "ordering": ["-created_at"],
+            },
+        ),
+    ]
@@ -0,0 +1,64 @@
+# Generated by Django 4.1.4 on 2026-10-18 03:33
+
+import django.contrib.postgres.search
+from django.db import migrations
+
+SEARCH_VECTOR_SQL = """
+    setweight(to_tsvector('english', coalesce({row}name, '')), 'A') ||
+    setweight(to_tsvector('english', coalesce({row}description, '')), 'B')
+"""
+
+CREATE_SEARCH_SQL = f"""
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+CREATE OR REPLACE FUNCTION event_search_vector_update() RETURNS trigger AS $$
+BEGIN
+    NEW.search_vector := {SEARCH_VECTOR_SQL.format(row="NEW.")};
+    RETURN NEW;
+END
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER event_search_vector_trigger
+    BEFORE INSERT OR UPDATE OF name, description ON event
+    FOR EACH ROW EXECUTE FUNCTION event_search_vector_update();
+
+UPDATE event SET search_vector = {SEARCH_VECTOR_SQL.format(row="")};
+
+CREATE INDEX event_search_vector_idx ON event USING gin (search_vector);
+CREATE INDEX event_name_trgm_idx ON event USING gin (name gin_trgm_ops);
+"""
+
+DROP_SEARCH_SQL = """
+DROP INDEX IF EXISTS event_name_trgm_idx;
+DROP INDEX IF EXISTS event_search_vector_idx;
+DROP TRIGGER IF EXISTS event_search_vector_trigger ON event;
+DROP FUNCTION IF EXISTS event_search_vector_update();
+"""
+
+
+def create_search_objects(apps, schema_editor):
+    if schema_editor.connection.vendor == "postgresql":
+        schema_editor.execute(CREATE_SEARCH_SQL)
+
+
+def drop_search_objects(apps, schema_editor):
+    if schema_editor.connection.vendor == "postgresql":
+        schema_editor.execute(DROP_SEARCH_SQL)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("event_management", "0009_report_job"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="event",
+            name="search_vector",
+            field=django.contrib.postgres.search.SearchVectorField(
+                editable=False, null=True
+            ),
+        ),
+        migrations.RunPython(create_search_objects, drop_search_objects),
+    ]
@@ -0,0 +1,52 @@
+# Generated by Django 4.1.4 on 2026-10-18 03:35
+
+from django.db import migrations, models
+from django.db.models.functions import Concat, Lower
+
+
+def populate_search_text(apps, schema_editor):
+    Event = apps.get_model("event_management", "Event")
+    Reservation = apps.get_model("event_management", "Reservation")
+    User = apps.get_model("security", "User")
+    event_name = Event.objects.filter(pk=models.OuterRef("event_id")).values("name")
+    email = User.objects.filter(attendee=models.OuterRef("attendee_id")).values("email")
+    Reservation.objects.update(
+        search_text=Lower(
+            Concat(
+                models.Subquery(event_name[:1]),
+                models.Value(" "),
+                models.Subquery(email[:1]),
+            )
+        )
+    )
+
+
+def create_trigram_index(apps, schema_editor):
+    if schema_editor.connection.vendor == "postgresql":
+        schema_editor.execute(
+            "CREATE EXTENSION IF NOT EXISTS pg_trgm;"
+            "CREATE INDEX reservation_search_text_trgm_idx "
+            "ON reservation USING gin (search_text gin_trgm_ops);"
+        )
+
+
+def drop_trigram_index(apps, schema_editor):
+    if schema_editor.connection.vendor == "postgresql":
+        schema_editor.execute("DROP INDEX IF EXISTS reservation_search_text_trgm_idx;")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("event_management", "0010_event_search_vector"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="reservation",
+            name="search_text",
+            field=models.TextField(default="", editable=False),
+        ),
+        migrations.RunPython(populate_search_text, migrations.RunPython.noop),
+        migrations.RunPython(create_trigram_index, drop_trigram_index),
+    ]
@@ -0,0 +1,55 @@
+# Generated by Django 4.1.4 on 2026-10-18 03:39
+
+from django.db import migrations, models
+import django.db.models.functions.text
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("event_management", "0011_reservation_search_text"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="category",
+            index=models.Index(
+                django.db.models.functions.text.Upper("name"),
+                name="category_upper_name_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="event",
+            index=models.Index(
+                condition=models.Q(("deleted_at__isnull", True)),
+                fields=["date"],
+                name="event_live_date_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="event",
+            index=models.Index(
+                condition=models.Q(("deleted_at__isnull", True)),
+                fields=["category", "date"],
+                name="event_live_category_date_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="reservation",
+            index=models.Index(
+                condition=models.Q(
+                    ("deleted_at__isnull", True), ("status", "Confirmed")
+                ),
+                fields=["event"],
+                name="reservation_confirmed_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="reservation",
+            index=models.Index(
+                condition=models.Q(("deleted_at__isnull", True)),
+                fields=["event", "status", "reservation_date"],
+                name="reservation_live_event_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,37 @@
+# Generated by Django 4.1.4 on 2026-10-18 04:39
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("event_management", "0012_query_pattern_indexes"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="attendee",
+            index=models.Index(
+                condition=models.Q(("deleted_at__isnull", False)),
+                fields=["deleted_at"],
+                name="attendee_deleted_at_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="event",
+            index=models.Index(
+                condition=models.Q(("deleted_at__isnull", False)),
+                fields=["deleted_at"],
+                name="event_deleted_at_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="reservation",
+            index=models.Index(
+                condition=models.Q(("deleted_at__isnull", False)),
+                fields=["deleted_at"],
+                name="reservation_deleted_at_idx",
+            ),
+        ),
+    ]
@@ -3,3 +3,4 @@ from .speaker_model import Speaker
 from .event_model import Event
 from .attendee_model import Attendee
 from .reservation_model import Reservation
+from .report_job_model import ReportJob
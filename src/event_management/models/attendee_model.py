@@ -19,3 +19,11 @@ class Attendee(BaseModel):
 
     class Meta:
         db_table = "attendee"
+        indexes = [
+            # Latest soft deletion, for the conditional GET validators.
+            models.Index(
+                fields=["deleted_at"],
+                condition=models.Q(deleted_at__isnull=False),
+                name="attendee_deleted_at_idx",
+            ),
+        ]
@@ -1,4 +1,5 @@
 from django.db import models
+from django.db.models.functions import Upper
 
 from core.management.commands.base_model import (
     BaseModel,
@@ -19,3 +20,5 @@ class Category(BaseModel):
     class Meta:
         db_table = "category"
         verbose_name_plural = "categories"
+        # Serves the case-insensitive ``category`` filter of the event list.
+        indexes = [models.Index(Upper("name"), name="category_upper_name_idx")]
@@ -1,3 +1,4 @@
+from django.contrib.postgres.search import SearchVectorField
 from django.db import models
 
 from core.management.commands.base_model import BaseModel
@@ -19,24 +20,68 @@ class Event(BaseModel):
     speakers = models.ManyToManyField(Speaker, related_name="events")
     is_featured = models.BooleanField(default=False)
     total_slots = models.PositiveIntegerField(default=0)
+    confirmed_count = models.PositiveIntegerField(default=0, editable=False)
+    # Maintained by a database trigger on PostgreSQL, see migration 0010.
+    search_vector = SearchVectorField(null=True, editable=False)
 
     @property
     def available_slots(self):
         """
         Calculate the number of available slots for the event.
 
+        Uses the denormalized ``confirmed_count``, which is kept in sync by the
+        reservation signals, so reading it does not hit the database.
+
         Returns:
             int: The number of available slots.
         """
-        confirmed_reservations = self.reservation_set.filter(status="Confirmed").count()
-        return max(self.total_slots - confirmed_reservations, 0)
+        return max(self.total_slots - self.confirmed_count, 0)
 
     def __str__(self):
         return self.name
 
+    def save(self, *args, **kwargs):
+        """
+        Leaves ``confirmed_count`` out of the UPDATE of an existing event.
+
+        The counter is only written in SQL by ``adjust_confirmed_count`` and
+        ``recompute_confirmed_counts``; saving an instance loaded before a
+        reservation changed would otherwise write the stale value back.
+        """
+        if (
+            not self._state.adding
+            and not kwargs.get("force_insert")
+            and kwargs.get("update_fields") is None
+        ):
+            kwargs["update_fields"] = [
+                field.name
+                for field in self._meta.concrete_fields
+                if not field.primary_key and field.name != "confirmed_count"
+            ]
+        super().save(*args, **kwargs)
+
     class Meta:
         db_table = "event"
         ordering = ["date"]
+        indexes = [
+            models.Index(fields=["date", "id"], name="event_date_id_idx"),
+            models.Index(
+                fields=["date"],
+                condition=models.Q(deleted_at__isnull=True),
+                name="event_live_date_idx",
+            ),
+            models.Index(
+                fields=["category", "date"],
+                condition=models.Q(deleted_at__isnull=True),
+                name="event_live_category_date_idx",
+            ),
+            # Latest soft deletion, for the conditional GET validators.
+            models.Index(
+                fields=["deleted_at"],
+                condition=models.Q(deleted_at__isnull=False),
+                name="event_deleted_at_idx",
+            ),
+        ]
         permissions = [
             ("create_event", "Can create event"),
             ("edit_event", "Can edit event"),
@@ -0,0 +1,35 @@
+from django.db import models
+
+from core.management.commands.base_model import BaseModel
+
+
+class ReportJob(BaseModel):
+    """
+    Represents an event report generated in the background by django-q.
+    """
+
+    QUEUED = "Queued"
+    RUNNING = "Running"
+    FINISHED = "Finished"
+    FAILED = "Failed"
+    STATUS_CHOICES = [
+        (QUEUED, QUEUED),
+        (RUNNING, RUNNING),
+        (FINISHED, FINISHED),
+        (FAILED, FAILED),
+    ]
+
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default=QUEUED)
+    filters = models.JSONField(default=dict, blank=True)
+    file = models.FileField(upload_to="reports/", blank=True)
+    error = models.TextField(blank=True)
+    task_id = models.CharField(max_length=32, blank=True)
+    requested_by = models.UUIDField(null=True, editable=False)
+    finished_at = models.DateTimeField(null=True, blank=True)
+
+    def __str__(self):
+        return f"Report {self.id} ({self.status})"
+
+    class Meta:
+        db_table = "report_job"
+        ordering = ["-created_at"]
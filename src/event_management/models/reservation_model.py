@@ -11,6 +11,7 @@ class Reservation(BaseModel):
     Represents a reservation that an attendee makes for an event.
     """
 
+    CONFIRMED = "Confirmed"
     STATUS_CHOICES = [
         ("Pending", "Pending"),
         ("Confirmed", "Confirmed"),
@@ -24,11 +25,62 @@ class Reservation(BaseModel):
     )
     reservation_date = models.DateTimeField(auto_now_add=True)
     status = models.CharField(max_length=20, choices=STATUS_CHOICES, default="Pending")
+    # Lowercased "<event name> <attendee email>", kept in sync by the signals.
+    search_text = models.TextField(default="", editable=False)
 
     class Meta:
         db_table = "reservation"
         ordering = ["reservation_date"]
         unique_together = ("event", "attendee")
+        indexes = [
+            models.Index(
+                fields=["reservation_date", "id"], name="reservation_date_id_idx"
+            ),
+            models.Index(
+                fields=["event"],
+                condition=models.Q(status="Confirmed", deleted_at__isnull=True),
+                name="reservation_confirmed_idx",
+            ),
+            models.Index(
+                fields=["event", "status", "reservation_date"],
+                condition=models.Q(deleted_at__isnull=True),
+                name="reservation_live_event_idx",
+            ),
+            # Latest soft deletion, for the conditional GET validators.
+            models.Index(
+                fields=["deleted_at"],
+                condition=models.Q(deleted_at__isnull=False),
+                name="reservation_deleted_at_idx",
+            ),
+        ]
 
     def __str__(self):
         return f"{self.attendee.user.email} - {self.event.name}"
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        """
+        Keeps a snapshot of the slot-related state loaded from the database so
+        the confirmed counter and search text signals can compute deltas
+        without a query.
+        """
+        instance = super().from_db(db, field_names, values)
+        loaded = dict(zip(field_names, values))
+        if {"event_id", "attendee_id"} <= loaded.keys():
+            instance._search_snapshot = (loaded["event_id"], loaded["attendee_id"])
+        if {"event_id", "status", "deleted_at"} <= loaded.keys():
+            instance._slot_snapshot = (
+                loaded["event_id"],
+                loaded["status"] == cls.CONFIRMED and loaded["deleted_at"] is None,
+            )
+        return instance
+
+    @property
+    def holds_slot(self):
+        """
+        Whether this reservation counts against the event capacity.
+
+        Returns:
+            bool: True if the reservation is confirmed and not soft deleted.
+        """
+        return self.status == self.CONFIRMED and self.deleted_at is None
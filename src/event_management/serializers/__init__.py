@@ -2,4 +2,10 @@ from .event_serializer import EventSerializer
 from .event_create_update_serializer import EventCreateUpdateSerializer
 from .reservation_serializer import ReservationListSerializer
 from .reservation_create_update_serializer import ReservationCreateUpdateSerializer
+from .reservation_bulk_serializer import (
+    ReservationBulkCreateSerializer,
+    ReservationBulkStatusSerializer,
+)
 from .event_report_serializer import EventReportSerializer
+from .report_job_serializer import ReportJobSerializer
+from .lookup_serializer import LookupQuerySerializer
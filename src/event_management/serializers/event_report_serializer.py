@@ -1,9 +1,49 @@
-from rest_framework import serializers
-from openpyxl import Workbook
+import csv
+import json
+import os
+import tempfile
+import xlsxwriter
 from io import BytesIO
+from rest_framework import serializers
 from event_management.models import Event
-from openpyxl.styles import Font, Alignment, PatternFill
-from openpyxl.worksheet.table import Table, TableStyleInfo
+from event_management.services import (
+    get_report_data_version,
+    report_cache,
+    report_fingerprint,
+)
+
+REPORT_HEADERS = [
+    "Event Name",
+    "Description",
+    "Date",
+    "Location",
+    "Category",
+    "Is Featured",
+]
+REPORT_CHUNK_SIZE = 2000
+REPORT_FORMATS = {
+    "xlsx": "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+    "csv": "text/csv",
+    "ndjson": "application/x-ndjson",
+}
+REPORT_VALUES = (
+    "name",
+    "description",
+    "date",
+    "location",
+    "category__name",
+    "is_featured",
+)
+NDJSON_KEYS = ("name", "description", "date", "location", "category", "is_featured")
+
+
+class Echo:
+    """
+    File-like object whose ``write`` returns the value, for streaming csv.writer.
+    """
+
+    def write(self, value):
+        return value
 
 
 class EventReportSerializer(serializers.Serializer):
@@ -20,13 +60,18 @@ class EventReportSerializer(serializers.Serializer):
     end_date = serializers.DateField(
         required=False, help_text="Filter by end date (YYYY-MM-DD)"
     )
+    format = serializers.ChoiceField(
+        choices=list(REPORT_FORMATS),
+        default="xlsx",
+        help_text="Output format: xlsx (default), csv or ndjson",
+    )
 
-    def generate_report(self):
+    def get_filtered_events(self):
         """
-        Generate an Excel report based on the validated filters.
+        Apply the validated filters to the events, without joins or projection.
 
         Returns:
-            BytesIO: The generated Excel file as a binary stream.
+            QuerySet: The events matching the filters.
         """
         category_id = self.validated_data.get("category_id")
         start_date = self.validated_data.get("start_date")
@@ -39,32 +84,144 @@ class EventReportSerializer(serializers.Serializer):
             events = events.filter(date__gte=start_date)
         if end_date:
             events = events.filter(date__lte=end_date)
+        return events
 
-        workbook = Workbook()
-        sheet = workbook.active
-        sheet.title = "Event Report"
-
-        headers = [
-            "Event Name",
-            "Description",
-            "Date",
-            "Location",
-            "Category",
-            "Is Featured",
-        ]
-        sheet.append(headers)
-        header_fill = PatternFill(
-            start_color="D9EAD3", end_color="D9EAD3", fill_type="solid"
+    def get_events(self):
+        """
+        Build the events queryset matching the validated filters.
+
+        Returns:
+            QuerySet: The filtered events with their category joined.
+        """
+        return (
+            self.get_filtered_events()
+            .select_related("category")
+            .only(
+                "name",
+                "description",
+                "date",
+                "location",
+                "is_featured",
+                "category__name",
+            )
+        )
+
+    def get_report_values(self):
+        """
+        Return the report columns as plain tuples, read in server-side chunks.
+
+        Returns:
+            Iterator[tuple]: One ``REPORT_VALUES`` tuple per event.
+        """
+        return (
+            self.get_filtered_events()
+            .order_by("date", "id")
+            .values_list(*REPORT_VALUES)
+            .iterator(chunk_size=REPORT_CHUNK_SIZE)
         )
-        header_font = Font(bold=True)
-        header_alignment = Alignment(horizontal="center", vertical="center")
-        for cell in sheet[1]:
-            cell.fill = header_fill
-            cell.font = header_font
-            cell.alignment = header_alignment
-
-        for event in events:
-            sheet.append(
+
+    def stream_csv(self):
+        """
+        Generate the report as CSV, one encoded chunk per batch of rows.
+
+        Returns:
+            Iterator[bytes]: The CSV document, header first.
+        """
+        writer = csv.writer(Echo())
+        yield writer.writerow(REPORT_HEADERS).encode()
+        batch = []
+        for (
+            name,
+            description,
+            date,
+            location,
+            category,
+            featured,
+        ) in self.get_report_values():
+            batch.append(
+                writer.writerow(
+                    (
+                        name,
+                        description,
+                        date.strftime("%Y-%m-%d %H:%M:%S"),
+                        location,
+                        category,
+                        "Yes" if featured else "No",
+                    )
+                )
+            )
+            if len(batch) == REPORT_CHUNK_SIZE:
+                yield "".join(batch).encode()
+                batch = []
+        if batch:
+            yield "".join(batch).encode()
+
+    def stream_ndjson(self):
+        """
+        Generate the report as newline-delimited JSON, one object per event.
+
+        Dates are ISO 8601 and ``is_featured`` is a boolean, so downstream
+        loaders do not have to parse display values.
+
+        Returns:
+            Iterator[bytes]: The NDJSON document.
+        """
+        batch = []
+        for values in self.get_report_values():
+            row = dict(zip(NDJSON_KEYS, values))
+            row["date"] = row["date"].isoformat()
+            batch.append(json.dumps(row, separators=(",", ":")))
+            if len(batch) == REPORT_CHUNK_SIZE:
+                yield ("\n".join(batch) + "\n").encode()
+                batch = []
+        if batch:
+            yield ("\n".join(batch) + "\n").encode()
+
+    def stream_report(self):
+        """
+        Stream the report in a text format chosen with the ``format`` field.
+
+        Returns:
+            Iterator[bytes]: The CSV or NDJSON document.
+        """
+        if self.validated_data["format"] == "csv":
+            return self.stream_csv()
+        return self.stream_ndjson()
+
+    def generate_report(self):
+        """
+        Generate an Excel report based on the validated filters.
+
+        Rows are read in chunks with ``.iterator()`` and written with
+        XlsxWriter in ``constant_memory`` mode, which flushes every row to
+        disk, so memory stays bounded whatever the number of events.
+
+        Returns:
+            file: A temporary file holding the workbook, positioned at the start.
+        """
+        output = tempfile.TemporaryFile()
+        workbook = xlsxwriter.Workbook(
+            output, {"constant_memory": True, "in_memory": False}
+        )
+        sheet = workbook.add_worksheet("Event Report")
+
+        header_format = workbook.add_format(
+            {
+                "bold": True,
+                "bg_color": "#D9EAD3",
+                "align": "center",
+                "valign": "vcenter",
+            }
+        )
+        sheet.write_row(0, 0, REPORT_HEADERS, header_format)
+        sheet.freeze_panes(1, 0)
+
+        row = 0
+        for event in self.get_events().iterator(chunk_size=REPORT_CHUNK_SIZE):
+            row += 1
+            sheet.write_row(
+                row,
+                0,
                 [
                     event.name,
                     event.description,
@@ -72,14 +229,32 @@ class EventReportSerializer(serializers.Serializer):
                     event.location,
                     event.category.name,
                     "Yes" if event.is_featured else "No",
-                ]
+                ],
             )
 
-        table_ref = f"A1:F{sheet.max_row}"
-        table = Table(displayName="EventTable", ref=table_ref)
-        sheet.add_table(table)
+        sheet.autofilter(0, 0, row, len(REPORT_HEADERS) - 1)
+        workbook.close()
+        output.seek(0)
+        return output
+
+    def generate_cached_report(self):
+        """
+        Return the report from the report cache, generating it on a miss.
+
+        The cache key hashes the validated filters with the Event/Category
+        data version, so any change to the data invalidates older reports.
+
+        Returns:
+            tuple: The report file positioned at the start, and whether it
+            was a cache hit.
+        """
+        key = report_fingerprint("xlsx", self.validated_data, get_report_data_version())
+        content = report_cache.get(key)
+        if content is not None:
+            return BytesIO(content), True
 
-        buffer = BytesIO()
-        workbook.save(buffer)
-        buffer.seek(0)
-        return buffer
+        report = self.generate_report()
+        if os.fstat(report.fileno()).st_size <= report_cache.max_entry_bytes:
+            report_cache.set(key, report.read())
+            report.seek(0)
+        return report, False
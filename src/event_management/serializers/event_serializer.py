@@ -11,6 +11,8 @@ class EventSerializer(serializers.ModelSerializer):
     """
 
     category = serializers.SerializerMethodField()
+    available_slots = serializers.SerializerMethodField()
+    speakers = serializers.SerializerMethodField()
 
     class Meta:
         model = Event
@@ -22,8 +24,18 @@ class EventSerializer(serializers.ModelSerializer):
             "location",
             "is_featured",
             "category",
+            "available_slots",
+            "speakers",
         ]
 
+    def __init__(self, *args, **kwargs):
+        """
+        Drops the speakers field unless it was requested with ``?expand=speakers``.
+        """
+        super().__init__(*args, **kwargs)
+        if not self.context.get("expand_speakers"):
+            self.fields.pop("speakers")
+
     def get_category(self, obj):
         """
         Custom method to return category details with both id and name.
@@ -36,3 +48,30 @@ class EventSerializer(serializers.ModelSerializer):
         """
         category = obj.category
         return {"id": category.id, "name": category.name} if category else None
+
+    def get_available_slots(self, obj):
+        """
+        Return the available slots, preferring the value annotated by the viewset.
+
+        Parameters:
+            obj (Event): The event instance being serialized.
+
+        Returns:
+            int: The number of available slots.
+        """
+        open_slots = getattr(obj, "open_slots", None)
+        return obj.available_slots if open_slots is None else open_slots
+
+    def get_speakers(self, obj):
+        """
+        Return the speakers of the event with their id and name.
+
+        Parameters:
+            obj (Event): The event instance being serialized.
+
+        Returns:
+            list: Dictionaries containing the id and name of each speaker.
+        """
+        return [
+            {"id": speaker.id, "name": speaker.name} for speaker in obj.speakers.all()
+        ]
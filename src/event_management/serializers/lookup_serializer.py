@@ -0,0 +1,20 @@
+from rest_framework import serializers
+
+
+class LookupQuerySerializer(serializers.Serializer):
+    """
+    Serializer for validating the query parameters of the lookup endpoints.
+    """
+
+    q = serializers.CharField(
+        required=False,
+        allow_blank=True,
+        max_length=100,
+        help_text="Case-insensitive name prefix",
+    )
+    limit = serializers.IntegerField(
+        required=False,
+        min_value=1,
+        max_value=1000,
+        help_text="Maximum number of results",
+    )
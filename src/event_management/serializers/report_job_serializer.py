@@ -0,0 +1,40 @@
+from rest_framework import serializers
+from django.urls import reverse
+from event_management.models import ReportJob
+
+
+class ReportJobSerializer(serializers.ModelSerializer):
+    """
+    Serializer for exposing the status of a background report job.
+    """
+
+    job_id = serializers.UUIDField(source="id", read_only=True)
+    download_url = serializers.SerializerMethodField()
+
+    class Meta:
+        model = ReportJob
+        fields = [
+            "job_id",
+            "status",
+            "filters",
+            "error",
+            "created_at",
+            "finished_at",
+            "download_url",
+        ]
+
+    def get_download_url(self, obj):
+        """
+        Return the absolute download URL once the report is finished.
+
+        Parameters:
+            obj (ReportJob): The report job being serialized.
+
+        Returns:
+            str: The download URL, or None while the report is not ready.
+        """
+        if obj.status != ReportJob.FINISHED:
+            return None
+        url = reverse("event-report_job_download", kwargs={"job_id": obj.id})
+        request = self.context.get("request")
+        return request.build_absolute_uri(url) if request else url
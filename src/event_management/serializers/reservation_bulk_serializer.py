@@ -0,0 +1,48 @@
+from rest_framework import serializers
+from django.utils import timezone
+from core.utils.errors import CustomAPIException, FormErrors
+from event_management.models import Event, Reservation
+
+MAX_BULK_ITEMS = 500
+
+
+class ReservationBulkCreateSerializer(serializers.Serializer):
+    """
+    Serializer for creating the reservations of many attendees for one event.
+    """
+
+    event = serializers.PrimaryKeyRelatedField(queryset=Event.objects.all())
+    attendees = serializers.ListField(
+        child=serializers.UUIDField(),
+        min_length=1,
+        max_length=MAX_BULK_ITEMS,
+        help_text="IDs of the attendees to reserve for",
+    )
+    status = serializers.ChoiceField(
+        choices=Reservation.STATUS_CHOICES, default="Pending"
+    )
+
+    def validate_event(self, value):
+        """
+        Validate that the event has not taken place yet.
+        """
+        if value.date < timezone.now():
+            raise CustomAPIException(
+                detail=FormErrors.INVALID_DATE["message"],
+                code=FormErrors.INVALID_DATE["code"],
+            )
+        return value
+
+
+class ReservationBulkStatusSerializer(serializers.Serializer):
+    """
+    Serializer for confirming or cancelling many reservations at once.
+    """
+
+    reservations = serializers.ListField(
+        child=serializers.UUIDField(),
+        min_length=1,
+        max_length=MAX_BULK_ITEMS,
+        help_text="IDs of the reservations to update",
+    )
+    status = serializers.ChoiceField(choices=Reservation.STATUS_CHOICES)
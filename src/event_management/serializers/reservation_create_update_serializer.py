@@ -1,5 +1,6 @@
 from rest_framework import serializers
-from event_management.models import Reservation, Event
+from event_management.models import Attendee, Reservation, Event
+from event_management.services import create_reservation, update_reservation
 from core.utils.errors import CustomAPIException, FormErrors
 from django.utils import timezone
 
@@ -9,6 +10,11 @@ class ReservationCreateUpdateSerializer(serializers.ModelSerializer):
     Serializer for creating and updating reservations.
     """
 
+    # The attendee's email is part of the reservation's search text.
+    attendee = serializers.PrimaryKeyRelatedField(
+        queryset=Attendee.objects.select_related("user")
+    )
+
     class Meta:
         model = Reservation
         fields = ["id", "event", "attendee", "reservation_date", "status"]
@@ -23,14 +29,11 @@ class ReservationCreateUpdateSerializer(serializers.ModelSerializer):
                 code=FormErrors.INVALID_DATE["code"],
             )
         if self.instance is None:  # Solo al crear una reserva
-            # Verifica si hay slots disponibles
-            confirmed_reservations = value.reservation_set.filter(
-                status="Confirmed"
-            ).count()
-            if confirmed_reservations >= value.total_slots:
+            # Fail fast; the slot itself is claimed atomically on save.
+            if not value.available_slots:
                 raise CustomAPIException(
-                    detail="This event has no available slots.",
-                    code="no_available_slots",
+                    detail=FormErrors.NO_AVAILABLE_SLOTS["message"],
+                    code=FormErrors.NO_AVAILABLE_SLOTS["code"],
                 )
 
         return value
@@ -47,3 +50,15 @@ class ReservationCreateUpdateSerializer(serializers.ModelSerializer):
                 code=FormErrors.DUPLICATE_RESERVATION["code"],
             )
         return attrs
+
+    def create(self, validated_data):
+        """
+        Create the reservation through the slot-claiming reservation service.
+        """
+        return create_reservation(validated_data)
+
+    def update(self, instance, validated_data):
+        """
+        Update the reservation through the slot-claiming reservation service.
+        """
+        return update_reservation(instance, validated_data)
@@ -0,0 +1,37 @@
+from .confirmed_count_service import (
+    adjust_confirmed_count,
+    recompute_confirmed_counts,
+    find_confirmed_count_drift,
+)
+from .reservation_service import (
+    claim_slot,
+    claim_slots,
+    create_reservation,
+    update_reservation,
+)
+from .report_cache_service import (
+    bump_report_data_version,
+    get_report_data_version,
+    report_cache,
+    report_fingerprint,
+)
+from .reservation_search_service import (
+    build_search_text,
+    refresh_reservation_search_text,
+)
+from .lookup_service import (
+    attendee_lookup,
+    event_lookup,
+    stream_json_array,
+)
+from .response_cache_service import (
+    bump_event_list_version,
+    event_list_cache_key,
+    get_cached_event_list,
+    get_event_list_version,
+    set_cached_event_list,
+)
+from .reservation_bulk_service import (
+    bulk_create_reservations,
+    bulk_update_reservation_status,
+)
@@ -0,0 +1,80 @@
+from django.db.models import Count, F, IntegerField, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce, Greatest, Now
+from event_management.models import Event, Reservation
+from .response_cache_service import bump_event_list_version
+
+
+def _confirmed_reservations_subquery():
+    """
+    Build a correlated subquery counting the live confirmed reservations of an event.
+
+    Returns:
+        Subquery: A subquery usable in annotations and updates on Event.
+    """
+    confirmed = (
+        Reservation.objects.filter(event=OuterRef("pk"), status=Reservation.CONFIRMED)
+        .order_by()
+        .values("event")
+        .annotate(total=Count("pk"))
+        .values("total")
+    )
+    return Coalesce(Subquery(confirmed, output_field=IntegerField()), Value(0))
+
+
+def adjust_confirmed_count(event_id, delta):
+    """
+    Atomically shift the confirmed counter of an event by ``delta``.
+
+    The update is done in SQL with an F() expression, so concurrent writers
+    never lose increments. The counter is clamped at zero. ``modified_at`` and
+    the cached event lists are bumped too, since the available slots changed.
+
+    Parameters:
+        event_id (UUID): The ID of the event to update.
+        delta (int): The amount to add (negative to subtract).
+    """
+    if not delta:
+        return
+    Event.all_objects.filter(pk=event_id).update(
+        confirmed_count=Greatest(F("confirmed_count") + delta, Value(0)),
+        modified_at=Now(),
+    )
+    bump_event_list_version()
+
+
+def recompute_confirmed_counts(event_ids=None):
+    """
+    Recompute the confirmed counter from the reservation table in one UPDATE.
+
+    Only the events whose counter drifted are written, and their
+    ``modified_at`` is bumped so cached validators of those events expire.
+
+    Parameters:
+        event_ids (iterable, optional): Restrict the recount to these events.
+            All events are recounted when omitted.
+
+    Returns:
+        int: The number of event rows updated.
+    """
+    events = Event.all_objects.alias(actual=_confirmed_reservations_subquery())
+    if event_ids is not None:
+        events = events.filter(pk__in=list(event_ids))
+    updated = events.exclude(confirmed_count=F("actual")).update(
+        confirmed_count=_confirmed_reservations_subquery(), modified_at=Now()
+    )
+    bump_event_list_version()
+    return updated
+
+
+def find_confirmed_count_drift():
+    """
+    List the events whose stored counter differs from the real confirmed count.
+
+    Returns:
+        QuerySet: Dicts with ``id``, ``name``, ``confirmed_count`` and ``actual``.
+    """
+    return (
+        Event.all_objects.annotate(actual=_confirmed_reservations_subquery())
+        .exclude(confirmed_count=F("actual"))
+        .values("id", "name", "confirmed_count", "actual")
+    )
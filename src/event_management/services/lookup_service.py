@@ -0,0 +1,70 @@
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import Value
+from django.db.models.functions import Concat
+from event_management.models import Attendee, Event
+
+LOOKUP_CHUNK_SIZE = 500
+
+
+def event_lookup(prefix="", limit=None):
+    """
+    Build the ``(id, name)`` rows of the events lookup.
+
+    Parameters:
+        prefix (str): Case-insensitive prefix the name must start with.
+        limit (int, optional): Maximum number of rows.
+
+    Returns:
+        tuple: The rows queryset and the unlimited queryset for the validators.
+    """
+    events = Event.objects.all()
+    if prefix:
+        events = events.filter(name__istartswith=prefix)
+    rows = events.order_by("name", "id").values_list("id", "name")
+    return (rows[:limit] if limit else rows), events
+
+
+def attendee_lookup(prefix="", limit=None):
+    """
+    Build the ``(id, full_name)`` rows of the attendees lookup, with the full
+    name concatenated in SQL.
+
+    Parameters:
+        prefix (str): Case-insensitive prefix of the full name or last name.
+        limit (int, optional): Maximum number of rows.
+
+    Returns:
+        tuple: The rows queryset and the unlimited queryset for the validators.
+    """
+    attendees = Attendee.objects.annotate(
+        full_name=Concat("user__first_name", Value(" "), "user__last_name")
+    )
+    if prefix:
+        attendees = attendees.filter(full_name__istartswith=prefix) | attendees.filter(
+            user__last_name__istartswith=prefix
+        )
+    rows = attendees.order_by("full_name", "id").values_list("id", "full_name")
+    return (rows[:limit] if limit else rows), attendees
+
+
+def stream_json_array(rows, keys):
+    """
+    Encode rows of values as a JSON array of objects, chunk by chunk.
+
+    Parameters:
+        rows (QuerySet): A ``values_list`` queryset.
+        keys (tuple): The object keys, in the order of the row values.
+
+    Returns:
+        Iterator[bytes]: The JSON document.
+    """
+    encoder = DjangoJSONEncoder(separators=(",", ":"))
+    separator = "["
+    batch = []
+    for row in rows.iterator(chunk_size=LOOKUP_CHUNK_SIZE):
+        batch.append(separator + encoder.encode(dict(zip(keys, row))))
+        separator = ","
+        if len(batch) == LOOKUP_CHUNK_SIZE:
+            yield "".join(batch).encode()
+            batch = []
+    yield ("".join(batch) + ("]" if separator == "," else "[]")).encode()
@@ -0,0 +1,106 @@
+import hashlib
+import json
+import time
+import uuid
+from django.conf import settings
+from django.core.cache import caches
+from core.utils.lru_cache import LRUCache
+
+DATA_VERSION_KEY = "reports:data_version"
+
+
+def _version_cache():
+    """
+    The version stamp lives in the cache shared by every worker, so a change
+    made through one worker expires the reports cached by all of them.
+    """
+    return caches[getattr(settings, "RESPONSE_CACHE_ALIAS", "default")]
+
+
+def get_report_data_version():
+    """
+    Return the current version stamp of the data the reports are built from.
+
+    Returns:
+        str: A token that changes whenever an Event or Category changes.
+    """
+    return _version_cache().get(DATA_VERSION_KEY, "0")
+
+
+def bump_report_data_version():
+    """
+    Invalidate every cached report by rotating the data version stamp.
+    """
+    _version_cache().set(DATA_VERSION_KEY, uuid.uuid4().hex, None)
+
+
+def report_fingerprint(report_format, filters, data_version):
+    """
+    Hash the validated filters together with the data version.
+
+    Parameters:
+        report_format (str): The output format of the report (e.g. "xlsx").
+        filters (dict): The validated report filters.
+        data_version (str): The data version stamp.
+
+    Returns:
+        str: A stable hex digest identifying the report content.
+    """
+    payload = json.dumps(
+        {"format": report_format, "filters": filters, "version": data_version},
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+class ReportCache(LRUCache):
+    """
+    In-process LRU cache of generated report files, bounded by total size.
+
+    Entries larger than ``max_entry_bytes`` are never stored, entries older
+    than ``ttl`` seconds are dropped, and the least recently used entries are
+    evicted until the cache fits in ``max_bytes``.
+    """
+
+    def __init__(self, max_bytes, max_entry_bytes, ttl):
+        """
+        Parameters:
+            max_bytes (int): Upper bound of the total cached size.
+            max_entry_bytes (int): Upper bound of a single cached report.
+            ttl (int): Upper bound, in seconds, of the life of an entry.
+        """
+        super().__init__(max_weight=max_bytes, weigh=len)
+        self.max_bytes = max_bytes
+        self.max_entry_bytes = max_entry_bytes
+        self.ttl = ttl
+
+    def set(self, key, content):
+        """
+        Store a report, evicting the least recently used entries if needed.
+
+        Returns:
+            bool: True if the report was cached, False if it is too large.
+        """
+        if len(content) > self.max_entry_bytes:
+            return False
+        return super().set(key, content, time.time() + self.ttl)
+
+    def stats(self):
+        """
+        Return the cache metrics.
+
+        Returns:
+            dict: Hits, misses, evictions, expirations, hit rate, entries and
+            size in bytes.
+        """
+        stats = super().stats()
+        stats["bytes"] = stats.pop("weight")
+        return stats
+
+
+report_cache = ReportCache(
+    max_bytes=getattr(settings, "REPORT_CACHE_MAX_BYTES", 64 * 1024 * 1024),
+    max_entry_bytes=getattr(settings, "REPORT_CACHE_MAX_ENTRY_BYTES", 8 * 1024 * 1024),
+    ttl=getattr(settings, "REPORT_CACHE_TTL", 3600),
+)
@@ -0,0 +1,150 @@
+from collections import defaultdict
+from django.db import IntegrityError, transaction
+from django.db.models.functions import Now
+from core.utils.errors import APIErrors, CustomAPIException, FormErrors
+from event_management.models import Attendee, Reservation
+from .confirmed_count_service import adjust_confirmed_count
+from .reservation_search_service import build_search_text
+from .reservation_service import claim_slots
+
+
+def _error(error):
+    return {"result": "error", "error": dict(error)}
+
+
+def bulk_create_reservations(event, attendee_ids, status="Pending"):
+    """
+    Create the reservations of many attendees for one event with set-based
+    queries: one attendee lookup, one duplicate lookup, one capacity claim
+    and one ``bulk_create``, all in a single transaction.
+
+    ``bulk_create`` skips the model signals, so the search text is filled
+    here and confirmed reservations take their slots with one conditional
+    UPDATE: either every new confirmed reservation gets a slot or none is
+    created.
+
+    Parameters:
+        event (Event): The event to reserve.
+        attendee_ids (list): The IDs of the attendees, in request order.
+        status (str): The status of the new reservations.
+
+    Returns:
+        list: One result per attendee, in request order, with either the ID
+        of the created reservation or the error that prevented it.
+
+    Raises:
+        CustomAPIException: If a reservation of one of the attendees was
+            created concurrently; nothing is created and no slot is taken.
+    """
+    emails = dict(
+        Attendee.objects.filter(pk__in=attendee_ids).values_list("pk", "user__email")
+    )
+    # Soft deleted reservations still hold the (event, attendee) unique key.
+    reserved = set(
+        Reservation.all_objects.filter(
+            event=event, attendee__in=attendee_ids
+        ).values_list("attendee_id", flat=True)
+    )
+
+    results, reservations = [], []
+    for attendee_id in attendee_ids:
+        if attendee_id not in emails:
+            results.append({"attendee": attendee_id, **_error(FormErrors.INVALID_ID)})
+        elif attendee_id in reserved:
+            results.append(
+                {"attendee": attendee_id, **_error(FormErrors.DUPLICATE_RESERVATION)}
+            )
+        else:
+            reserved.add(attendee_id)
+            reservation = Reservation(
+                event=event,
+                attendee_id=attendee_id,
+                status=status,
+                search_text=build_search_text(event.name, emails[attendee_id]),
+            )
+            reservations.append(reservation)
+            results.append({"attendee": attendee_id, "reservation": reservation})
+
+    try:
+        with transaction.atomic():
+            confirmed = sum(1 for reservation in reservations if reservation.holds_slot)
+            if confirmed and not claim_slots(event.pk, confirmed):
+                reservations = []
+                for result in results:
+                    if result.pop("reservation", None) is not None:
+                        result.update(_error(FormErrors.NO_AVAILABLE_SLOTS))
+            Reservation.objects.bulk_create(reservations)
+    except IntegrityError:
+        # The (event, attendee) key was taken between the duplicate lookup
+        # and the insert; the transaction rolled the slot claim back.
+        raise CustomAPIException(
+            detail=FormErrors.DUPLICATE_RESERVATION["message"],
+            code=FormErrors.DUPLICATE_RESERVATION["code"],
+        )
+
+    for result in results:
+        reservation = result.pop("reservation", None)
+        if reservation is not None:
+            result.update(result="created", id=reservation.pk)
+    return results
+
+
+def bulk_update_reservation_status(reservation_ids, status):
+    """
+    Move many reservations to ``status`` (e.g. confirm or cancel them) in one
+    transaction.
+
+    The reservations are locked and read in one query. Confirmations claim
+    the slots of each event with one conditional UPDATE, all or nothing per
+    event; cancellations release them per event. The statuses are written
+    with a single ``QuerySet.update``.
+
+    Parameters:
+        reservation_ids (list): The IDs of the reservations, in request order.
+        status (str): The new status.
+
+    Returns:
+        list: One result per reservation, in request order: ``updated``,
+        ``unchanged`` or the error that prevented the change.
+    """
+    holds_slot = status == Reservation.CONFIRMED
+    with transaction.atomic():
+        current = {
+            pk: (event_id, previous)
+            for pk, event_id, previous in Reservation.objects.select_for_update()
+            .filter(pk__in=reservation_ids)
+            .values_list("pk", "event_id", "status")
+        }
+        by_event = defaultdict(list)
+        for pk, (event_id, previous) in current.items():
+            if previous != status and (previous == Reservation.CONFIRMED) != holds_slot:
+                by_event[event_id].append(pk)
+
+        sold_out = set()
+        for event_id, pks in by_event.items():
+            if not holds_slot:
+                adjust_confirmed_count(event_id, -len(pks))
+            elif not claim_slots(event_id, len(pks)):
+                sold_out.update(pks)
+
+        changed = [
+            pk
+            for pk, (event_id, previous) in current.items()
+            if previous != status and pk not in sold_out
+        ]
+        Reservation.objects.filter(pk__in=changed).update(
+            status=status, modified_at=Now()
+        )
+
+    results = []
+    for pk in reservation_ids:
+        if pk not in current:
+            result = _error(APIErrors.RESOURCE_NOT_FOUND)
+        elif pk in sold_out:
+            result = _error(FormErrors.NO_AVAILABLE_SLOTS)
+        elif current[pk][1] == status:
+            result = {"result": "unchanged"}
+        else:
+            result = {"result": "updated"}
+        results.append({"id": pk, **result})
+    return results
@@ -0,0 +1,42 @@
+from django.db.models import OuterRef, Subquery, Value
+from django.db.models.functions import Concat, Lower
+from event_management.models import Event, Reservation
+from security.models import User
+
+
+def build_search_text(event_name, email):
+    """
+    Build the denormalized search text of a reservation.
+
+    Parameters:
+        event_name (str): The name of the reserved event.
+        email (str): The email of the attendee's user.
+
+    Returns:
+        str: The lowercased ``"<event name> <email>"`` text.
+    """
+    return f"{event_name} {email}".lower()
+
+
+def refresh_reservation_search_text(*conditions, **filters):
+    """
+    Recompute ``Reservation.search_text`` in a single UPDATE.
+
+    Parameters:
+        conditions (Q): Extra conditions on the reservations to refresh.
+        filters: Lookups selecting the reservations to refresh (all if empty).
+
+    Returns:
+        int: The number of reservations updated.
+    """
+    event_name = Event.all_objects.filter(pk=OuterRef("event_id")).values("name")
+    email = User.objects.filter(attendee=OuterRef("attendee_id")).values("email")
+    return (
+        Reservation.all_objects.filter(*conditions, **filters)
+        .order_by()
+        .update(
+            search_text=Lower(
+                Concat(Subquery(event_name[:1]), Value(" "), Subquery(email[:1]))
+            )
+        )
+    )
@@ -0,0 +1,112 @@
+from django.db import transaction
+from django.db.models import F
+from django.db.models.functions import Now
+from core.utils.errors import CustomAPIException, FormErrors
+from event_management.models import Event, Reservation
+from .response_cache_service import bump_event_list_version
+
+
+def claim_slot(event_id):
+    """
+    Atomically take one slot of an event.
+
+    Runs a single conditional ``UPDATE ... WHERE confirmed_count < total_slots``,
+    so concurrent callers are serialized by the row lock and the event can
+    never be overbooked. No COUNT query is needed.
+
+    Parameters:
+        event_id (UUID): The ID of the event.
+
+    Returns:
+        bool: True if a slot was claimed, False if the event is sold out.
+    """
+    return claim_slots(event_id, 1)
+
+
+def claim_slots(event_id, count):
+    """
+    Atomically take ``count`` slots of an event, or none of them.
+
+    Parameters:
+        event_id (UUID): The ID of the event.
+        count (int): The number of slots to take.
+
+    Returns:
+        bool: True if the slots were claimed, False if they are not available.
+    """
+    claimed = (
+        Event.objects.filter(
+            pk=event_id, confirmed_count__lte=F("total_slots") - count
+        ).update(confirmed_count=F("confirmed_count") + count, modified_at=Now())
+        == 1
+    )
+    if claimed:
+        bump_event_list_version()
+    return claimed
+
+
+def _save_with_claim(reservation, previous_event_id, previously_held):
+    """
+    Claim a slot if the reservation starts holding one, then save it.
+
+    Parameters:
+        reservation (Reservation): The reservation with its new state applied.
+        previous_event_id (UUID): The event it held a slot in before, if any.
+        previously_held (bool): Whether it already held a slot.
+
+    Raises:
+        CustomAPIException: If the event has no available slots.
+
+    Returns:
+        Reservation: The saved reservation.
+    """
+    needs_slot = reservation.holds_slot and not (
+        previously_held and previous_event_id == reservation.event_id
+    )
+    with transaction.atomic():
+        if needs_slot and not claim_slot(reservation.event_id):
+            raise CustomAPIException(
+                detail=FormErrors.NO_AVAILABLE_SLOTS["message"],
+                code=FormErrors.NO_AVAILABLE_SLOTS["code"],
+            )
+        # Tells the counter signal that the increment was already applied.
+        reservation._slot_claimed = needs_slot
+        reservation.save()
+    return reservation
+
+
+def create_reservation(validated_data):
+    """
+    Create a reservation, claiming a slot atomically when it is confirmed.
+
+    Parameters:
+        validated_data (dict): The validated reservation fields.
+
+    Raises:
+        CustomAPIException: If the event is sold out.
+
+    Returns:
+        Reservation: The created reservation.
+    """
+    reservation = Reservation(**validated_data)
+    return _save_with_claim(reservation, None, False)
+
+
+def update_reservation(reservation, validated_data):
+    """
+    Update a reservation, claiming a slot atomically when it becomes confirmed.
+
+    Parameters:
+        reservation (Reservation): The reservation to update.
+        validated_data (dict): The validated fields to change.
+
+    Raises:
+        CustomAPIException: If the event is sold out.
+
+    Returns:
+        Reservation: The updated reservation.
+    """
+    previous_event_id, previously_held = reservation.event_id, reservation.holds_slot
+    for field, value in validated_data.items():
+        setattr(reservation, field, value)
+    return _save_with_claim(reservation, previous_event_id, previously_held)
@@ -0,0 +1,88 @@
+"""
+Shared cache of the event list responses.
+
+The event list does not depend on who asks for it, only on the query
+parameters, so one rendered page is shared by every caller holding the same
+permissions. Entries are keyed by a version stamp that the Event, Category
+and Speaker signals (and the bulk updates bypassing them) rotate, so a change
+expires every cached page at once without scanning the cache.
+"""
+
+import hashlib
+import json
+import uuid
+from django.conf import settings
+from django.core.cache import caches
+
+EVENT_LIST_VERSION_KEY = "responses:event_list:version"
+EVENT_LIST_KEY = "responses:event_list:{version}:{digest}"
+
+
+def _response_cache():
+    return caches[getattr(settings, "RESPONSE_CACHE_ALIAS", "default")]
+
+
+def get_event_list_version():
+    """
+    Return the current version stamp of the cached event lists.
+
+    Returns:
+        str: A token that changes whenever the listed data changes.
+    """
+    return _response_cache().get(EVENT_LIST_VERSION_KEY, "0")
+
+
+def bump_event_list_version():
+    """
+    Invalidate every cached event list by rotating the version stamp.
+    """
+    _response_cache().set(EVENT_LIST_VERSION_KEY, uuid.uuid4().hex, None)
+
+
+def event_list_cache_key(base_url, params, permissions, version=None):
+    """
+    Build the cache key of an event list response.
+
+    Parameters:
+        base_url (str): Scheme, host and path of the request, which the
+            pagination links are built from.
+        params (list): The normalized (sorted) query parameters.
+        permissions (iterable): The permission codenames of the caller.
+        version (str, optional): The version stamp; read from the cache
+            when omitted.
+
+    Returns:
+        str: The cache key.
+    """
+    if version is None:
+        version = get_event_list_version()
+    payload = json.dumps(
+        {"url": base_url, "params": params, "permissions": sorted(permissions)},
+        sort_keys=True,
+        default=str,
+    )
+    digest = hashlib.sha256(payload.encode()).hexdigest()
+    return EVENT_LIST_KEY.format(version=version, digest=digest)
+
+
+def get_cached_event_list(key):
+    """
+    Return the cached ``(data, validators)`` of an event list, or None.
+    """
+    return _response_cache().get(key)
+
+
+def set_cached_event_list(key, data, validators):
+    """
+    Store a rendered event list with its ETag / Last-Modified validators.
+
+    Parameters:
+        key (str): The key from ``event_list_cache_key``.
+        data (dict | list): The response data.
+        validators (tuple): The ETag and Last-Modified of the response.
+    """
+    _response_cache().set(
+        key,
+        (data, validators),
+        getattr(settings, "EVENT_LIST_CACHE_TIMEOUT", 300),
+    )
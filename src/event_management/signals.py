@@ -0,0 +1,173 @@
+from django.db.models import F, Q, Value
+from django.db.models.functions import Concat, Lower
+from django.utils import timezone
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_save
+from django.dispatch import receiver
+from event_management.models import Attendee, Category, Event, Reservation, Speaker
+from event_management.services import (
+    adjust_confirmed_count,
+    build_search_text,
+    bump_event_list_version,
+    bump_report_data_version,
+    recompute_confirmed_counts,
+    refresh_reservation_search_text,
+)
+from security.models import User
+
+
+@receiver(post_save, sender=Reservation)
+def sync_confirmed_count_on_save(sender, instance, created, **kwargs):
+    """
+    Keep ``Event.confirmed_count`` in sync when a reservation is saved.
+
+    Covers create, status changes, event reassignment, soft delete and undelete
+    (safedelete performs those through ``save``). Slots already taken through
+    ``claim_slot`` are flagged with ``_slot_claimed`` and not counted twice.
+    """
+    snapshot = getattr(instance, "_slot_snapshot", None)
+    claimed = instance.__dict__.pop("_slot_claimed", False)
+    if snapshot is None and not created:
+        # Loaded with deferred fields: the previous state is unknown, recount.
+        recompute_confirmed_counts([instance.event_id])
+    else:
+        previous_event_id, previously_held = snapshot or (None, False)
+        unchanged = (
+            previously_held
+            and instance.holds_slot
+            and previous_event_id == instance.event_id
+        )
+        if previously_held and not unchanged:
+            adjust_confirmed_count(previous_event_id, -1)
+        if instance.holds_slot and not unchanged and not claimed:
+            adjust_confirmed_count(instance.event_id, 1)
+    instance._slot_snapshot = (instance.event_id, instance.holds_slot)
+
+
+@receiver(post_delete, sender=Reservation)
+def sync_confirmed_count_on_delete(sender, instance, **kwargs):
+    """
+    Release the slot of a confirmed reservation when it is hard deleted.
+    """
+    snapshot = getattr(instance, "_slot_snapshot", None)
+    if snapshot is None:
+        recompute_confirmed_counts([instance.event_id])
+    elif snapshot[1]:
+        adjust_confirmed_count(snapshot[0], -1)
+    instance._slot_snapshot = (instance.event_id, False)
+
+
+@receiver(post_save, sender=Event)
+@receiver(post_delete, sender=Event)
+@receiver(post_save, sender=Category)
+@receiver(post_delete, sender=Category)
+def invalidate_reports_on_data_change(sender, **kwargs):
+    """
+    Rotate the report data version so cached reports are not served stale.
+    """
+    bump_report_data_version()
+
+
+@receiver(post_save, sender=Event)
+@receiver(post_delete, sender=Event)
+@receiver(post_save, sender=Category)
+@receiver(post_delete, sender=Category)
+@receiver(post_save, sender=Speaker)
+@receiver(post_delete, sender=Speaker)
+@receiver(m2m_changed, sender=Event.speakers.through)
+def invalidate_event_lists_on_data_change(sender, **kwargs):
+    """
+    Rotate the event list version so cached list responses are not served stale.
+    """
+    bump_event_list_version()
+
+
+@receiver(m2m_changed, sender=Event.speakers.through)
+def touch_events_on_speakers_change(
+    sender, instance, action, reverse, pk_set, **kwargs
+):
+    """
+    Bump ``modified_at`` of the events whose speakers were added or removed,
+    so the conditional GET validators of their expanded lists change.
+    """
+    if action in ("post_add", "post_remove", "post_clear") and not reverse:
+        events = Event.all_objects.filter(pk=instance.pk)
+    elif action in ("post_add", "post_remove") and pk_set:
+        events = Event.all_objects.filter(pk__in=pk_set)
+    elif action == "pre_clear" and reverse:
+        events = Event.all_objects.filter(speakers=instance)
+    else:
+        return
+    events.update(modified_at=timezone.now())
+
+
+@receiver(pre_save, sender=Reservation)
+def set_reservation_search_text(sender, instance, **kwargs):
+    """
+    Fill ``Reservation.search_text`` when a reservation is created or moved
+    to another event or attendee.
+
+    The text is built from the event and attendee user already loaded on the
+    instance. When they are not loaded (or ``update_fields`` leaves the text
+    out), it is written after the save by one UPDATE instead of fetching them.
+    """
+    search_keys = (instance.event_id, instance.attendee_id)
+    if getattr(instance, "_search_snapshot", None) == search_keys:
+        return
+    update_fields = kwargs.get("update_fields")
+    loaded = (
+        Reservation.event.is_cached(instance)
+        and Reservation.attendee.is_cached(instance)
+        and Attendee.user.is_cached(instance.attendee)
+    )
+    if loaded:
+        instance.search_text = build_search_text(
+            instance.event.name, instance.attendee.user.email
+        )
+    if not loaded or (update_fields is not None and "search_text" not in update_fields):
+        instance._search_text_stale = True
+    instance._search_snapshot = search_keys
+
+
+@receiver(post_save, sender=Reservation)
+def refresh_stale_reservation_search_text(sender, instance, **kwargs):
+    """
+    Write the search text that ``set_reservation_search_text`` could not
+    build from the loaded objects.
+    """
+    if instance.__dict__.pop("_search_text_stale", False):
+        refresh_reservation_search_text(pk=instance.pk)
+
+
+@receiver(post_save, sender=Event)
+def sync_search_text_on_event_rename(sender, instance, created, **kwargs):
+    """
+    Refresh the search text of the event's reservations after a rename.
+    Reservations whose text already is the expected one are not rewritten.
+    """
+    if created:
+        return
+    refresh_reservation_search_text(
+        ~Q(
+            search_text=Lower(
+                Concat(Value(instance.name), Value(" "), F("attendee__user__email"))
+            )
+        ),
+        event_id=instance.pk,
+    )
+
+
+@receiver(post_save, sender=User)
+def sync_search_text_on_email_change(sender, instance, created, **kwargs):
+    """
+    Refresh the search text of the user's reservations after an email change.
+    """
+    if created or kwargs.get("update_fields") == frozenset({"last_login"}):
+        return
+    refresh_reservation_search_text(
+        ~Q(
+            search_text=Lower(
+                Concat(F("event__name"), Value(" "), Value(instance.email))
+            )
+        ),
+        attendee__user_id=instance.pk,
+    )
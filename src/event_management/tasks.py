@@ -0,0 +1,37 @@
+"""
+Background tasks executed by the django-q cluster (``python manage.py qcluster``).
+"""
+
+import logging
+from django.core.files import File
+from django.utils import timezone
+from event_management.models import ReportJob
+from event_management.serializers import EventReportSerializer
+
+logger = logging.getLogger(__name__)
+
+
+def build_event_report(job_id):
+    """
+    Generate the Excel report of a ReportJob and store it in the default storage.
+
+    Parameters:
+        job_id (UUID): The ID of the report job to process.
+    """
+    job = ReportJob.objects.get(pk=job_id)
+    job.status = ReportJob.RUNNING
+    job.save(update_fields=["status", "modified_at"])
+
+    try:
+        serializer = EventReportSerializer(data=job.filters)
+        serializer.is_valid(raise_exception=True)
+        with serializer.generate_report() as report:
+            job.file.save(f"event_report_{job.id}.xlsx", File(report), save=False)
+        job.status = ReportJob.FINISHED
+    except Exception as e:
+        logger.error("Report job %s failed: %s", job_id, e)
+        job.status = ReportJob.FAILED
+        job.error = str(e)
+
+    job.finished_at = timezone.now()
+    job.save(update_fields=["status", "file", "error", "finished_at", "modified_at"])
@@ -1,4 +1,6 @@
 import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from event_management.models import Event
 from core.utils.test_setup import TestSetup
@@ -146,3 +148,38 @@ class TestEventManagementAdmin(TestSetup):
         assert response.status_code == 302
         self.reservation.refresh_from_db()
         assert self.reservation.status == "Unconfirmed"
+
+    def test_reservation_admin_list_view_constant_queries(self):
+        """
+        Ensure the reservation changelist joins the event and the attendee's
+        user instead of querying them per row.
+        """
+        url = reverse("admin:event_management_reservation_changelist")
+        self.client.get(url)
+        counts = []
+        for _ in range(2):
+            with CaptureQueriesContext(connection) as queries:
+                response = self.client.get(url)
+            assert response.status_code == 200
+            counts.append(len(queries))
+            for _ in range(5):
+                self.create_reservation(event=self.event)
+        assert counts[0] == counts[1], counts
+
+    def test_reservation_admin_attendee_autocomplete(self):
+        """
+        Ensure attendees are picked through the admin autocomplete by email.
+        """
+        response = self.client.get(
+            reverse("admin:autocomplete"),
+            {
+                "app_label": "event_management",
+                "model_name": "reservation",
+                "field_name": "attendee",
+                "term": self.attendee.user.email,
+            },
+        )
+        assert response.status_code == 200
+        assert [item["id"] for item in response.json()["results"]] == [
+            str(self.attendee.id)
+        ]
@@ -0,0 +1,128 @@
+import json
+import jwt
+import pytest
+import time
+from django.conf import settings
+from django.core.management import call_command
+from django.test import override_settings
+from core.utils.permission_cache import get_permission_version
+from core.utils.test_setup import TestSetup
+from security.models import Rol
+
+
+@pytest.mark.django_db
+class TestAsyncEventAPI(TestSetup):
+    """
+    Test cases for the async (ASGI) read-only event endpoints. They must answer
+    exactly like their synchronous counterparts.
+    """
+
+    def setup_method(self, method):
+        """
+        Setup common elements for each test.
+        """
+        self.url = "/v1/api/event_management/event/"
+        self.async_url = "/v1/api/event_management/async/event/"
+
+    def assert_same_response(self, path, **params):
+        sync_response = self.client.get(self.url + path, params)
+        async_response = self.client.get(self.async_url + path, params)
+        assert async_response.status_code == sync_response.status_code
+        # Pagination links point at each endpoint's own path.
+        async_body = async_response.content.decode().replace("/async/event/", "/event/")
+        assert json.loads(async_body) == json.loads(sync_response.getvalue())
+        return async_response
+
+    def test_list_events(self):
+        """
+        Test that the async list matches the sync list, including pagination.
+        """
+        for _ in range(12):
+            self.create_event()
+        response = self.assert_same_response("")
+        assert response.json()["count"] == 12
+        assert response.json()["next"].startswith("http")
+        self.assert_same_response("", page=2)
+        self.assert_same_response("", size=5, ordering="-name")
+        self.assert_same_response("", page=9)
+
+    def test_list_events_with_filters_and_search(self):
+        """
+        Test that filters, search and expansions are shared with the sync list.
+        """
+        event = self.create_event(name="Async Summit")
+        event.speakers.add(self.create_speaker())
+        self.create_event(name="Other")
+        response = self.assert_same_response("", search="async", expand="speakers")
+        assert len(response.json()["results"]) == 1
+
+    def test_retrieve_event(self):
+        """
+        Test that the async detail matches the sync detail.
+        """
+        event = self.create_event()
+        response = self.assert_same_response(f"{event.id}/")
+        assert response.json()["id"] == str(event.id)
+
+    def test_list_events_and_attendees(self):
+        """
+        Test the async name lists.
+        """
+        self.create_event(name="Async Summit")
+        self.create_event()
+        self.create_attendee()
+        self.assert_same_response("list-events/")
+        self.assert_same_response("list-events/", q="async", limit=1)
+        self.assert_same_response("list-attendees/")
+
+    def test_requires_authentication(self):
+        """
+        Test that a request without a token is rejected like on the sync path.
+        """
+        self.client.credentials()
+        self.assert_same_response("")
+
+    def test_requires_permission(self):
+        """
+        Test that a user without ``view_event`` gets a 403.
+        """
+        Rol.objects.get_or_create(name="Basic User")
+        user = self._create_user_with_role("Basic User")
+        self.client.credentials(
+            HTTP_AUTHORIZATION=f"Bearer {self._generate_token(user)}"
+        )
+        response = self.assert_same_response("")
+        assert response.status_code == 403
+
+    @override_settings(
+        STATELESS_JWT_AUTH=True,
+        CACHES={
+            **settings.CACHES,
+            "responses": {
+                "BACKEND": "django.core.cache.backends.db.DatabaseCache",
+                "LOCATION": "test_responses_cache",
+            },
+        },
+    )
+    def test_stateless_token_with_database_cache(self):
+        """
+        Test that a stateless token is accepted by the async endpoints when the
+        shared cache is a database cache, read outside the event loop.
+        """
+        call_command("createcachetable", "test_responses_cache")
+        self.create_event()
+        token = jwt.encode(
+            {
+                "user_id": str(self.user.id),
+                "is_active": True,
+                "perm_version": get_permission_version(self.user.id),
+                "roles": [],
+                "exp": int(time.time()) + 3600,
+            },
+            key=settings.SECRET_KEY,
+            algorithm="HS256",
+        )
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {token}")
+        response = self.client.get(self.async_url)
+        assert response.status_code == 200, response.content
+        assert response.json()["count"] == 1
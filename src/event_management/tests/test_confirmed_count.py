@@ -0,0 +1,165 @@
+import pytest
+from datetime import timedelta
+from io import StringIO
+from django.core.management import call_command
+from django.utils import timezone
+from core.utils.test_setup import TestSetup
+from event_management.actions import update_reservation_status
+from event_management.models import Event, Reservation
+from event_management.services import recompute_confirmed_counts
+
+
+@pytest.mark.django_db
+class TestConfirmedCount(TestSetup):
+    """
+    Test cases for the denormalized Event.confirmed_count counter.
+    """
+
+    def setup_method(self, method):
+        """
+        Setup common elements for each test.
+        """
+        self.event = self.create_event(total_slots=5)
+
+    def _stored_count(self):
+        return Event.all_objects.get(pk=self.event.pk).confirmed_count
+
+    def test_create_confirmed_reservation_increments(self):
+        """
+        Creating confirmed reservations increments the counter, pending ones do not.
+        """
+        self.create_reservation(event=self.event, status="Confirmed")
+        self.create_reservation(event=self.event, status="Pending")
+        assert self._stored_count() == 1
+        self.event.refresh_from_db()
+        assert self.event.available_slots == 4
+
+    def test_status_change_updates_counter(self):
+        """
+        Confirming and then cancelling a reservation moves the counter up and down.
+        """
+        reservation = self.create_reservation(event=self.event, status="Pending")
+        reservation = Reservation.objects.get(pk=reservation.pk)
+        reservation.status = "Confirmed"
+        reservation.save()
+        assert self._stored_count() == 1
+
+        reservation.status = "Cancelled"
+        reservation.save()
+        assert self._stored_count() == 0
+
+    def test_soft_delete_and_undelete(self):
+        """
+        Soft deleting a confirmed reservation releases its slot and undelete restores it.
+        """
+        reservation = self.create_reservation(event=self.event, status="Confirmed")
+        Reservation.objects.get(pk=reservation.pk).delete()
+        assert self._stored_count() == 0
+
+        Reservation.all_objects.get(pk=reservation.pk).undelete()
+        assert self._stored_count() == 1
+
+    def test_event_reassignment_moves_slot(self):
+        """
+        Moving a confirmed reservation to another event moves the slot as well.
+        """
+        other_event = self.create_event(total_slots=5)
+        reservation = self.create_reservation(event=self.event, status="Confirmed")
+        reservation = Reservation.objects.get(pk=reservation.pk)
+        reservation.event = other_event
+        reservation.save()
+        assert self._stored_count() == 0
+        assert Event.objects.get(pk=other_event.pk).confirmed_count == 1
+
+    def test_bulk_status_update_resyncs_counter(self):
+        """
+        The admin bulk status update recomputes the counters of affected events.
+        """
+        for _ in range(3):
+            self.create_reservation(event=self.event, status="Pending")
+        update_reservation_status(
+            Reservation.objects.filter(event=self.event), "Confirmed"
+        )
+        assert self._stored_count() == 3
+
+    def test_bulk_status_update_runs_in_batches(self):
+        """
+        The bulk status update walks the selection in primary-key batches,
+        resyncing the counters once per batch, and offloads large selections
+        to a background task.
+        """
+        other_event = self.create_event(total_slots=5)
+        for event in (self.event, self.event, other_event, other_event, self.event):
+            self.create_reservation(event=event, status="Pending")
+        selection = Reservation.objects.filter(event__in=[self.event, other_event])
+
+        with self.settings(BULK_UPDATE_BATCH_SIZE=2):
+            result = update_reservation_status(selection, "Confirmed")
+        assert (result.rows, result.batches, result.task_id) == (5, 3, None)
+        assert self._stored_count() == 3
+        assert Event.objects.get(pk=other_event.pk).confirmed_count == 2
+
+        with self.settings(BULK_UPDATE_BATCH_SIZE=2, BULK_UPDATE_ASYNC_THRESHOLD=4):
+            result = update_reservation_status(selection, "Cancelled")
+        assert result.task_id is not None
+        assert not selection.filter(status="Confirmed").exists()
+        assert self._stored_count() == 0
+
+    def test_bulk_status_update_on_status_filtered_selection(self):
+        """
+        Confirming a selection filtered on the status it changes still
+        resyncs the counters of the updated reservations.
+        """
+        for _ in range(3):
+            self.create_reservation(event=self.event, status="Pending")
+        result = update_reservation_status(
+            Reservation.objects.filter(status="Pending"), "Confirmed"
+        )
+        assert result.rows == 3
+        assert self._stored_count() == 3
+
+    def test_saving_stale_event_keeps_counter(self):
+        """
+        Saving an event loaded before reservations were confirmed does not
+        write its stale counter back.
+        """
+        stale = Event.objects.get(pk=self.event.pk)
+        for _ in range(2):
+            self.create_reservation(event=self.event, status="Confirmed")
+        stale.location = "Elsewhere"
+        stale.save()
+        assert self._stored_count() == 2
+        assert Event.objects.get(pk=self.event.pk).location == "Elsewhere"
+
+    def test_sync_command_repairs_drift(self):
+        """
+        The sync_confirmed_counts command detects and repairs a drifted counter.
+        """
+        self.create_reservation(event=self.event, status="Confirmed")
+        Event.objects.filter(pk=self.event.pk).update(confirmed_count=4)
+
+        out = StringIO()
+        call_command("sync_confirmed_counts", "--dry-run", stdout=out)
+        assert "stored 4, actual 1" in out.getvalue()
+        assert self._stored_count() == 4
+
+        call_command("sync_confirmed_counts", stdout=StringIO())
+        assert self._stored_count() == 1
+
+    def test_recompute_bumps_modified_at_of_drifted_events(self):
+        """
+        Recomputing the counters bumps ``modified_at`` of the repaired events
+        only.
+        """
+        other = self.create_event(total_slots=5)
+        self.create_reservation(event=self.event, status="Confirmed")
+        Event.objects.filter(pk=self.event.pk).update(confirmed_count=3)
+        # SQLite's CURRENT_TIMESTAMP has a resolution of one second.
+        Event.all_objects.update(modified_at=timezone.now() - timedelta(days=1))
+        before = dict(Event.all_objects.values_list("pk", "modified_at"))
+
+        assert recompute_confirmed_counts([self.event.pk, other.pk]) == 1
+        after = dict(Event.all_objects.values_list("pk", "modified_at"))
+        assert self._stored_count() == 1
+        assert after[self.event.pk] > before[self.event.pk]
+        assert after[other.pk] == before[other.pk]
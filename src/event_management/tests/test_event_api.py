@@ -1,4 +1,9 @@
+import json
 import pytest
+from datetime import timedelta
+from django.utils import timezone
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from core.utils.test_setup import TestSetup
 from event_management.models import Event
 from security.models import Rol
@@ -128,6 +133,79 @@ class TestEventAPI(TestSetup):
 
         assert response_data["previous"] is None
 
+    def test_list_events_constant_queries(self):
+        """
+        Test that listing events does not issue one query per row,
+        including when the speakers are expanded.
+        """
+        speaker = self.create_speaker()
+        for i in range(10):
+            event = self.create_event(name=f"Event {i + 1}")
+            event.speakers.add(speaker)
+
+        self.assert_constant_query_count(self.url)
+        self.assert_constant_query_count(self.url, expand="speakers")
+
+    def test_retrieve_event_with_available_slots_and_speakers(self):
+        """
+        Test retrieving an event with its available slots and expanded speakers.
+        """
+        event = self.create_event(total_slots=3)
+        speaker = self.create_speaker()
+        event.speakers.add(speaker)
+        self.create_reservation(event=event, status="Confirmed")
+
+        response = self.client.get(f"{self.url}{event.id}/?expand=speakers")
+        response_data = response.json()
+        assert response.status_code == 200
+        assert response_data["available_slots"] == 2
+        assert response_data["speakers"] == [
+            {"id": str(speaker.id), "name": speaker.name}
+        ]
+
+        response = self.client.get(f"{self.url}{event.id}/")
+        assert "speakers" not in response.json()
+
+    def test_list_events_cursor_pagination(self):
+        """
+        Test walking the events with keyset pagination, forwards and backwards.
+        The count is only returned on demand and pages are stable under inserts.
+        """
+        Event.objects.all().delete()
+        events = [
+            self.create_event(name=f"Event {i}", date=f"2030-01-{i + 1:02d}T10:00:00Z")
+            for i in range(5)
+        ]
+
+        response = self.client.get(f"{self.url}?pagination=cursor&size=2")
+        first_page = response.json()
+        assert response.status_code == 200
+        assert "count" not in first_page
+        assert first_page["previous"] is None
+        assert [e["name"] for e in first_page["results"]] == ["Event 0", "Event 1"]
+
+        self.create_event(name="Early insert", date="2029-01-01T10:00:00Z")
+
+        second_page = self.client.get(first_page["next"]).json()
+        assert [e["name"] for e in second_page["results"]] == ["Event 2", "Event 3"]
+
+        last_page = self.client.get(second_page["next"]).json()
+        assert [e["name"] for e in last_page["results"]] == [events[4].name]
+        assert last_page["next"] is None
+
+        back_page = self.client.get(last_page["previous"]).json()
+        assert [e["name"] for e in back_page["results"]] == ["Event 2", "Event 3"]
+
+        response = self.client.get(f"{self.url}?pagination=cursor&count=true")
+        assert response.json()["count"] == 6
+
+    def test_list_events_invalid_cursor(self):
+        """
+        Test that a malformed cursor is rejected.
+        """
+        response = self.client.get(f"{self.url}?cursor=not-a-cursor")
+        assert response.status_code == 404
+
     def test_list_events_search(self):
         """
         Test searching events by name.
@@ -151,6 +229,268 @@ class TestEventAPI(TestSetup):
         assert response_data["results"][0]["name"] == event_1.name
         assert response_data["results"][0]["id"] == str(event_1.id)
 
+    def test_list_events_search_is_ranked(self):
+        """
+        Test that events matching the search term in their name come before
+        events matching it only in their description, unless an ordering is
+        requested.
+        """
+        now = timezone.now()
+        in_description = self.create_event(
+            name="Weekend meetup",
+            description="Talks about Python packaging.",
+            date=now + timedelta(days=1),
+        )
+        in_name = self.create_event(
+            name="Python Summit",
+            description="Yearly summit.",
+            date=now + timedelta(days=2),
+        )
+
+        response = self.client.get(self.url, {"search": "python"})
+        assert [event["id"] for event in response.json()["results"]] == [
+            str(in_name.id),
+            str(in_description.id),
+        ]
+
+        response = self.client.get(self.url, {"search": "python", "ordering": "date"})
+        assert [event["id"] for event in response.json()["results"]] == [
+            str(in_description.id),
+            str(in_name.id),
+        ]
+
+    def test_list_events_conditional_get(self):
+        """
+        Test that the event list answers 304 until an event, its category or
+        its available slots change, or an event is deleted.
+        """
+        event = self.create_event(total_slots=5)
+        other = self.create_event()
+        response = self.client.get(self.url)
+        etag, last_modified = response["ETag"], response["Last-Modified"]
+
+        not_modified = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        assert not_modified.status_code == 304
+        assert not_modified["ETag"] == etag
+        assert (
+            self.client.get(self.url, HTTP_IF_MODIFIED_SINCE=last_modified).status_code
+            == 304
+        )
+        assert (
+            self.client.get(self.url, {"page": 1}, HTTP_IF_NONE_MATCH=etag).status_code
+            == 200
+        )
+
+        self.create_reservation(event=event, status="Confirmed")
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == 200
+        etag = response["ETag"]
+
+        self.category.name = "Renamed category"
+        self.category.save()
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == 200
+        etag, count = response["ETag"], response.json()["count"]
+
+        other.delete()
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == 200
+        assert response.json()["count"] == count - 1
+
+    def test_list_events_cursor_conditional_get_skips_count(self):
+        """
+        Test that keyset-paginated lists get validators without a COUNT over
+        the filtered rows and still see edits.
+        """
+        event = self.create_event()
+        params = {"pagination": "cursor"}
+        etag = self.client.get(self.url, params)["ETag"]
+        self.client.get(self.url, params)
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(self.url, params, HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == 304
+        assert not any("COUNT(" in query["sql"].upper() for query in queries)
+
+        event.name = "Renamed event"
+        event.save()
+        response = self.client.get(self.url, params, HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == 200
+
+    def test_expanded_speakers_conditional_get(self):
+        """
+        Test that list and retrieve with ``?expand=speakers`` stop answering
+        304 once a speaker is renamed, added or removed.
+        """
+        event = self.create_event()
+        speaker = self.create_speaker()
+        event.speakers.add(speaker)
+        detail_url = f"{self.url}{event.id}/"
+        params = {"expand": "speakers"}
+
+        def etags():
+            return (
+                self.client.get(self.url, params)["ETag"],
+                self.client.get(detail_url, params)["ETag"],
+            )
+
+        def assert_changed(previous):
+            for url, etag in zip((self.url, detail_url), previous):
+                response = self.client.get(url, params, HTTP_IF_NONE_MATCH=etag)
+                assert response.status_code == 200, url
+            return etags()
+
+        current = etags()
+        assert (
+            self.client.get(
+                detail_url, params, HTTP_IF_NONE_MATCH=current[1]
+            ).status_code
+            == 304
+        )
+
+        speaker.name = "Renamed speaker"
+        speaker.save()
+        current = assert_changed(current)
+
+        event.speakers.add(self.create_speaker())
+        current = assert_changed(current)
+
+        event.speakers.remove(speaker)
+        current = assert_changed(current)
+
+        speaker.events.add(event)
+        assert_changed(current)
+
+    def test_list_events_shared_response_cache(self):
+        """
+        Test that a list page is cached for every caller with the same
+        permissions and expired when an event, category or speaker changes.
+        """
+        event = self.create_event()
+        params = {"ordering": "name", "expand": "speakers"}
+        first = self.client.get(self.url, params)
+        assert first["X-Response-Cache"] == "MISS"
+
+        other_admin = self._create_user_with_role("Admin")
+        self.client.credentials(
+            HTTP_AUTHORIZATION=f"Bearer {self._generate_token(other_admin)}"
+        )
+        with CaptureQueriesContext(connection) as queries:
+            second = self.client.get(
+                self.url, {"expand": "speakers", "ordering": "name"}
+            )
+        assert second["X-Response-Cache"] == "HIT"
+        assert second.json() == first.json()
+        assert not any('"event"' in query["sql"] for query in queries)
+
+        manager = self._create_user_with_role("Event Manager")
+        self.client.credentials(
+            HTTP_AUTHORIZATION=f"Bearer {self._generate_token(manager)}"
+        )
+        assert self.client.get(self.url, params)["X-Response-Cache"] == "MISS"
+
+        speaker = self.create_speaker()
+        event.speakers.add(speaker)
+        response = self.client.get(self.url, params)
+        assert response["X-Response-Cache"] == "MISS"
+        assert speaker.name in json.dumps(response.json())
+
+        speaker.name = "Renamed speaker"
+        speaker.save()
+        response = self.client.get(self.url, params)
+        assert response["X-Response-Cache"] == "MISS"
+        assert "Renamed speaker" in json.dumps(response.json())
+
+    def test_retrieve_event_conditional_get(self):
+        """
+        Test that retrieving an unchanged event answers 304.
+        """
+        event = self.create_event()
+        url = f"{self.url}{event.id}/"
+        etag = self.client.get(url)["ETag"]
+        assert self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code == 304
+
+        event.location = "Elsewhere"
+        event.save()
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == 200
+        assert response.json()["location"] == "Elsewhere"
+
+    def test_list_events_lookup(self):
+        """
+        Test the events lookup with a name prefix and a limit.
+        """
+        first = self.create_event(name="Python Summit")
+        self.create_event(name="Python Meetup")
+        self.create_event(name="Go Conference")
+
+        response = self.client.get(f"{self.url}list-events/", {"q": "python"})
+        assert response.status_code == 200
+        assert response.streaming
+        assert [event["name"] for event in json.loads(response.getvalue())] == [
+            "Python Meetup",
+            "Python Summit",
+        ]
+
+        response = self.client.get(
+            f"{self.url}list-events/", {"q": "python su", "limit": 1}
+        )
+        assert json.loads(response.getvalue()) == [
+            {"id": str(first.id), "name": "Python Summit"}
+        ]
+
+        response = self.client.get(f"{self.url}list-events/", {"limit": 0})
+        assert response.status_code == 400
+
+    def test_list_events_lookup_revalidation(self):
+        """
+        Test that the lookups answer 304 while nothing changed and a fresh body
+        once an event is renamed.
+        """
+        event = self.create_event(name="Python Summit")
+        url = f"{self.url}list-events/"
+        response = self.client.get(url)
+        etag = response["ETag"]
+        assert response["Last-Modified"]
+
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == 304
+
+        event.name = "Renamed Summit"
+        event.save()
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == 200
+        assert response["ETag"] != etag
+        assert json.loads(response.getvalue())[0]["name"] == "Renamed Summit"
+
+        event.delete()
+        response = self.client.get(url)
+        assert json.loads(response.getvalue()) == []
+
+    def test_list_attendees_lookup(self):
+        """
+        Test the attendees lookup: full name built in SQL, prefix filtering and
+        revalidation when the user's name changes.
+        """
+        attendee = self.create_attendee()
+        user = attendee.user
+        user.first_name, user.last_name = "Ada", "Lovelace"
+        user.save()
+        self.create_attendee()
+
+        url = f"{self.url}list-attendees/"
+        for prefix in ("ada", "love"):
+            response = self.client.get(url, {"q": prefix})
+            assert json.loads(response.getvalue()) == [
+                {"id": str(attendee.id), "full_name": "Ada Lovelace"}
+            ]
+
+        etag = self.client.get(url)["ETag"]
+        assert self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code == 304
+        user.last_name = "Byron"
+        user.save()
+        assert self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code == 200
+
     def test_update_event(self):
         """
         Test updating an event.
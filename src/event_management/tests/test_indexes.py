@@ -0,0 +1,93 @@
+import pytest
+from django.db import connection, transaction
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+from core.utils.test_setup import TestSetup
+from event_management.models import Event, Reservation
+from event_management.views.event_viewset import EventViewSet
+
+
+@pytest.mark.django_db
+class TestQueryIndexes(TestSetup):
+    """
+    EXPLAIN the main viewset queries and check that they are served by the
+    indexes declared for them.
+    """
+
+    def setup_method(self, method):
+        """
+        Setup an event with a reservation.
+        """
+        self.event = self.create_event()
+        self.create_reservation(event=self.event)
+
+    def explain(self, queryset):
+        """
+        Return the query plan of a queryset. Sequential scans are disabled on
+        PostgreSQL, whose planner would otherwise prefer them on tiny tables.
+        """
+        with transaction.atomic():
+            if connection.vendor == "postgresql":
+                with connection.cursor() as cursor:
+                    cursor.execute("SET LOCAL enable_seqscan = off")
+            return queryset.explain()
+
+    def assert_uses_index(self, queryset, *index_names):
+        plan = self.explain(queryset)
+        assert any(name in plan for name in index_names), plan
+
+    def test_event_list_uses_live_date_index(self):
+        """
+        The default event list, ordered by date, reads the partial date index.
+        """
+        self.assert_uses_index(Event.objects.order_by("date"), "event_live_date_idx")
+
+    def viewset_queryset(self, viewset_class, **params):
+        """
+        Build the list queryset of a viewset for a GET with ``params``, through
+        its own ``get_queryset`` and filter backends.
+        """
+        request = Request(APIRequestFactory().get("/", params))
+        view = viewset_class(
+            request=request, action="list", format_kwarg=None, kwargs={}
+        )
+        return view.filter_queryset(view.get_queryset())
+
+    def test_event_category_filter_uses_index(self):
+        """
+        The ``?category=<name>`` event list finds the category through
+        ``category_upper_name_idx`` (``iexact`` is ``UPPER(name) = UPPER(%s)``
+        on PostgreSQL) and its live events, in date order, through the partial
+        category + date index. SQLite turns ``iexact`` into ``LIKE``, which no
+        index serves, and walks the events by date instead.
+        """
+        queryset = self.viewset_queryset(
+            EventViewSet, category=self.event.category.name.upper()
+        )
+        assert self.event in queryset
+        plan = self.explain(queryset)
+        if connection.vendor == "postgresql":
+            assert "category_upper_name_idx" in plan, plan
+            assert "event_live_category_date_idx" in plan, plan
+        else:
+            assert "event_live_date_idx" in plan, plan
+
+    def test_reservation_event_status_filter_uses_index(self):
+        """
+        The ``event`` + ``status`` reservation filters read the partial index.
+        """
+        queryset = Reservation.objects.filter(
+            event=self.event.id, status="Pending"
+        ).order_by("reservation_date")
+        self.assert_uses_index(queryset, "reservation_live_event_idx")
+
+    def test_confirmed_reservations_use_partial_index(self):
+        """
+        Counting the confirmed reservations of an event reads a partial index.
+        """
+        queryset = Reservation.objects.filter(
+            event_id=self.event.id, status=Reservation.CONFIRMED
+        )
+        self.assert_uses_index(
+            queryset, "reservation_confirmed_idx", "reservation_live_event_idx"
+        )
@@ -1,10 +1,22 @@
-from io import BytesIO
+import csv
+import json
+import time
+from io import BytesIO, StringIO
+from unittest.mock import patch
 from rest_framework import status
 import openpyxl
+from django.conf import settings
+from django.core.cache import caches
 from django.utils.timezone import now
 from core.utils.test_setup import TestSetup
 from faker import Faker
 from event_management.models import Category, Event
+from event_management.services.report_cache_service import (
+    DATA_VERSION_KEY,
+    ReportCache,
+    bump_report_data_version,
+    get_report_data_version,
+)
 
 faker = Faker()
 
@@ -55,7 +67,7 @@ class TestEventReportEndpoint(TestSetup):
         response = self.client.get(f"{self.url}?category_id={self.category1.id}")
         self.assertEqual(response.status_code, status.HTTP_200_OK)
 
-        workbook = openpyxl.load_workbook(BytesIO(response.content))
+        workbook = openpyxl.load_workbook(BytesIO(response.getvalue()))
         sheet = workbook.active
 
         headers = [cell.value for cell in sheet[1]]
@@ -82,6 +94,65 @@ class TestEventReportEndpoint(TestSetup):
         )
         self.assertIn(expected_row, data_rows)
 
+    def test_generate_report_is_streamed(self):
+        """
+        Test that the report is sent as a streaming attachment.
+        """
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response.streaming)
+        self.assertIn("attachment;", response["Content-Disposition"])
+        self.assertIn(".xlsx", response["Content-Disposition"])
+
+    def test_generate_report_as_csv(self):
+        """
+        Test that ``format=csv`` streams the filtered rows as CSV.
+        """
+        response = self.client.get(
+            self.url, {"format": "csv", "category_id": self.category1.id}
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response.streaming)
+        self.assertEqual(response["Content-Type"], "text/csv")
+        self.assertIn(".csv", response["Content-Disposition"])
+
+        rows = list(csv.reader(StringIO(response.getvalue().decode())))
+        self.assertEqual(rows[0][0], "Event Name")
+        self.assertEqual(len(rows), 2)
+        self.assertEqual(
+            rows[1],
+            [
+                self.event1.name,
+                self.event1.description,
+                self.event1.date.strftime("%Y-%m-%d %H:%M:%S"),
+                self.event1.location,
+                self.category1.name,
+                "Yes" if self.event1.is_featured else "No",
+            ],
+        )
+
+    def test_generate_report_as_ndjson(self):
+        """
+        Test that ``format=ndjson`` streams one JSON object per event.
+        """
+        response = self.client.get(self.url, {"format": "ndjson"})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response["Content-Type"], "application/x-ndjson")
+
+        lines = response.getvalue().decode().splitlines()
+        self.assertEqual(len(lines), 2)
+        rows = {row["name"]: row for row in map(json.loads, lines)}
+        self.assertEqual(rows[self.event2.name]["category"], self.category2.name)
+        self.assertIs(rows[self.event2.name]["is_featured"], self.event2.is_featured)
+        self.assertEqual(rows[self.event1.name]["date"], self.event1.date.isoformat())
+
+    def test_generate_report_with_unknown_format(self):
+        """
+        Test that an unsupported format is rejected.
+        """
+        response = self.client.get(self.url, {"format": "pdf"})
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
     def test_generate_report_with_date_filters(self):
         """
         Test report generation with date filters. It should only include events within the specified date range.
@@ -90,12 +161,118 @@ class TestEventReportEndpoint(TestSetup):
         response = self.client.get(f"{self.url}?start_date={start_date}")
         self.assertEqual(response.status_code, status.HTTP_200_OK)
 
-        workbook = openpyxl.load_workbook(BytesIO(response.content))
+        workbook = openpyxl.load_workbook(BytesIO(response.getvalue()))
         sheet = workbook.active
 
         data_rows = list(sheet.iter_rows(min_row=2, values_only=True))
         self.assertEqual(len(data_rows), 2)
 
+    def test_generate_report_is_cached_until_data_changes(self):
+        """
+        Test that a repeated report is served from the cache and that changing
+        an event invalidates it.
+        """
+        url = f"{self.url}?category_id={self.category1.id}"
+        first = self.client.get(url)
+        self.assertEqual(first["X-Report-Cache"], "MISS")
+
+        second = self.client.get(url)
+        self.assertEqual(second["X-Report-Cache"], "HIT")
+        self.assertEqual(second.getvalue(), first.getvalue())
+
+        self.event1.name = "Renamed Conference"
+        self.event1.save()
+        third = self.client.get(url)
+        self.assertEqual(third["X-Report-Cache"], "MISS")
+        sheet = openpyxl.load_workbook(BytesIO(third.getvalue())).active
+        self.assertEqual(sheet["A2"].value, "Renamed Conference")
+
+    def test_report_cache_lru_eviction_and_metrics(self):
+        """
+        Test that the report cache evicts the least recently used entries to
+        stay within its size bound and keeps hit/miss metrics.
+        """
+        cache = ReportCache(max_bytes=10, max_entry_bytes=6, ttl=60)
+        self.assertTrue(cache.set("a", b"aaaa"))
+        self.assertTrue(cache.set("b", b"bbbb"))
+        self.assertEqual(cache.get("a"), b"aaaa")
+        self.assertTrue(cache.set("c", b"cccc"))
+        self.assertFalse(cache.set("d", b"ddddddd"))
+
+        self.assertIsNone(cache.get("b"))
+        stats = cache.stats()
+        self.assertEqual(stats["entries"], 2)
+        self.assertEqual(stats["bytes"], 8)
+        self.assertEqual(stats["evictions"], 1)
+        self.assertEqual((stats["hits"], stats["misses"]), (1, 1))
+
+    def test_report_cache_entries_expire(self):
+        """
+        Test that a cached report is dropped once its TTL has passed.
+        """
+        cache = ReportCache(max_bytes=10, max_entry_bytes=6, ttl=60)
+        cache.set("a", b"aaaa")
+        with patch(
+            "core.utils.lru_cache.time.time",
+            return_value=time.time() + 61,
+        ):
+            self.assertIsNone(cache.get("a"))
+        stats = cache.stats()
+        self.assertEqual((stats["expirations"], stats["entries"]), (1, 0))
+        self.assertEqual(stats["bytes"], 0)
+
+    def test_report_data_version_is_shared(self):
+        """
+        Test that the report data version is kept in the shared cache, not in
+        the per-process default cache.
+        """
+        bump_report_data_version()
+        version = caches[settings.RESPONSE_CACHE_ALIAS].get(DATA_VERSION_KEY)
+        self.assertIsNotNone(version)
+        self.assertEqual(get_report_data_version(), version)
+        self.assertIsNone(caches["default"].get(DATA_VERSION_KEY))
+
+    def test_enqueue_report_job(self):
+        """
+        Test that POST enqueues a report job that can be polled and downloaded.
+        Tasks run synchronously in the test settings.
+        """
+        response = self.client.post(
+            self.url, {"category_id": str(self.category1.id)}, format="json"
+        )
+        self.assertEqual(response.status_code, status.HTTP_202_ACCEPTED)
+        job_id = response.json()["job_id"]
+
+        status_url = f"/v1/api/event_management/event/report-jobs/{job_id}/"
+        response = self.client.get(status_url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        job = response.json()
+        self.assertEqual(job["status"], "Finished")
+        self.assertTrue(job["download_url"].endswith(f"{job_id}/download/"))
+
+        response = self.client.get(job["download_url"])
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        sheet = openpyxl.load_workbook(BytesIO(response.getvalue())).active
+        data_rows = list(sheet.iter_rows(min_row=2, values_only=True))
+        self.assertEqual(len(data_rows), 1)
+        self.assertEqual(data_rows[0][0], self.event1.name)
+
+    def test_report_job_of_another_user(self):
+        """
+        Test that a report job cannot be read by a different user.
+        """
+        response = self.client.post(self.url, format="json")
+        job_id = response.json()["job_id"]
+
+        other_user = self._create_user_with_role("Admin")
+        self.client.credentials(
+            HTTP_AUTHORIZATION=f"Bearer {self._generate_token(other_user)}"
+        )
+        response = self.client.get(
+            f"/v1/api/event_management/event/report-jobs/{job_id}/"
+        )
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
     def test_invalid_filters(self):
         """
         Test report generation with invalid filters. It should return a 400 error.
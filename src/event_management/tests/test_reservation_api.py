@@ -1,6 +1,9 @@
 import pytest
+from unittest.mock import patch
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from core.utils.test_setup import TestSetup
-from event_management.models import Reservation
+from event_management.models import Attendee, Reservation
 from security.models import Rol
 
 
@@ -49,6 +52,123 @@ class TestReservationAPI(TestSetup):
         response_data = response.json()
         assert response_data["message"] == "This event has no available slots."
 
+    def test_confirm_reservation_when_sold_out(self):
+        """
+        Test confirming a pending reservation when the event is already full.
+        """
+        self.event.total_slots = 1
+        self.event.save()
+        self.create_reservation(event=self.event, status="Confirmed")
+        reservation = self.create_reservation(event=self.event, attendee=self.attendee)
+
+        response = self.client.put(
+            f"{self.url}{reservation.id}/", {"status": "Confirmed"}
+        )
+        assert response.status_code == 400
+        assert response.json()["message"] == "This event has no available slots."
+        reservation.refresh_from_db()
+        assert reservation.status == "Pending"
+
+    def test_bulk_create_reservations(self):
+        """
+        Test creating many reservations at once, with per-item results for
+        duplicates and unknown attendees, in a constant number of queries.
+        """
+        attendees = [self.create_attendee() for _ in range(3)]
+        self.create_reservation(event=self.event, attendee=attendees[0])
+        unknown = "00000000-0000-0000-0000-000000000000"
+        payload = {
+            "event": str(self.event.id),
+            "attendees": [str(a.id) for a in attendees] + [unknown],
+            "status": "Confirmed",
+        }
+        response = self.client.post(f"{self.url}bulk/", payload, format="json")
+        assert response.status_code == 201
+        data = response.json()
+        assert data["created"] == 2
+        assert [item["result"] for item in data["results"]] == [
+            "error",
+            "created",
+            "created",
+            "error",
+        ]
+        assert data["results"][0]["error"]["code"] == "FORM009"
+        assert data["results"][3]["error"]["code"] == "FORM006"
+
+        created = Reservation.objects.get(id=data["results"][1]["id"])
+        assert created.status == "Confirmed"
+        assert created.search_text == (
+            f"{self.event.name} {attendees[1].user.email}".lower()
+        )
+        self.event.refresh_from_db()
+        assert self.event.confirmed_count == 2
+
+        payload["event"] = str(self.create_event(total_slots=20).id)
+        counts = []
+        for size in (1, 10):
+            payload["attendees"] = [str(self.create_attendee().id) for _ in range(size)]
+            with CaptureQueriesContext(connection) as queries:
+                self.client.post(f"{self.url}bulk/", payload, format="json")
+            counts.append(len(queries))
+        assert counts[0] == counts[1]
+
+    def test_bulk_create_reservations_capacity_is_all_or_nothing(self):
+        """
+        Test that a bulk confirmation larger than the available slots creates
+        nothing.
+        """
+        event = self.create_event(total_slots=2)
+        payload = {
+            "event": str(event.id),
+            "attendees": [str(self.create_attendee().id) for _ in range(3)],
+            "status": "Confirmed",
+        }
+        response = self.client.post(f"{self.url}bulk/", payload, format="json")
+        assert response.status_code == 400
+        assert {item["error"]["code"] for item in response.json()["results"]} == {
+            "no_available_slots"
+        }
+        assert not Reservation.objects.filter(event=event).exists()
+        event.refresh_from_db()
+        assert event.confirmed_count == 0
+
+    def test_bulk_update_reservation_status(self):
+        """
+        Test confirming and cancelling many reservations at once while
+        keeping the confirmed counters in sync.
+        """
+        event = self.create_event(total_slots=2)
+        reservations = [self.create_reservation(event=event) for _ in range(3)]
+        url = f"{self.url}bulk-status/"
+
+        payload = {
+            "reservations": [str(r.id) for r in reservations],
+            "status": "Confirmed",
+        }
+        response = self.client.post(url, payload, format="json")
+        assert response.status_code == 200
+        assert response.json()["updated"] == 0
+        assert {item["error"]["code"] for item in response.json()["results"]} == {
+            "no_available_slots"
+        }
+
+        payload["reservations"] = payload["reservations"][:2]
+        response = self.client.post(url, payload, format="json")
+        assert response.json()["updated"] == 2
+        event.refresh_from_db()
+        assert event.confirmed_count == 2
+
+        payload["status"] = "Cancelled"
+        payload["reservations"].append(str(reservations[2].id))
+        response = self.client.post(url, payload, format="json")
+        assert response.json()["updated"] == 3
+        event.refresh_from_db()
+        assert event.confirmed_count == 0
+        assert (
+            self.client.post(url, payload, format="json").json()["results"][0]["result"]
+            == "unchanged"
+        )
+
     def test_list_reservations(self):
         """
         Test listing reservations.
@@ -63,6 +183,153 @@ class TestReservationAPI(TestSetup):
             self.attendee.user.email
         )
 
+    def test_list_reservations_constant_queries(self):
+        """
+        Test that the event and attendee of each reservation are joined, not
+        fetched one by one.
+        """
+        for _ in range(10):
+            self.create_reservation(event=self.event)
+        self.assert_constant_query_count(self.url)
+        self.assert_constant_query_count(self.url, pagination="cursor")
+
+    def test_list_reservations_cursor_pagination(self):
+        """
+        Test listing reservations with keyset pagination.
+        """
+        self.create_reservation(event=self.event, attendee=self.attendee)
+        self.create_reservation(event=self.event)
+        response = self.client.get(f"{self.url}?pagination=cursor&size=1")
+        response_data = response.json()
+        assert response.status_code == 200
+        assert "count" not in response_data
+        assert len(response_data["results"]) == 1
+
+        response_data = self.client.get(response_data["next"]).json()
+        assert len(response_data["results"]) == 1
+        assert response_data["next"] is None
+
+    def test_search_reservations(self):
+        """
+        Test searching reservations by event name and by attendee email,
+        including after the event is renamed and the email changes.
+        """
+        reservation = self.create_reservation(event=self.event, attendee=self.attendee)
+        self.create_reservation()
+
+        response = self.client.get(self.url, {"search": self.event.name.upper()})
+        assert [r["id"] for r in response.json()["results"]] == [str(reservation.id)]
+
+        self.event.name = "Renamed Gathering"
+        self.event.save()
+        response = self.client.get(self.url, {"search": "renamed gath"})
+        assert [r["id"] for r in response.json()["results"]] == [str(reservation.id)]
+
+        user = self.attendee.user
+        user.email = "new.address@example.org"
+        user.save()
+        response = self.client.get(self.url, {"search": "new.address@"})
+        assert [r["id"] for r in response.json()["results"]] == [str(reservation.id)]
+        reservation.refresh_from_db()
+        assert reservation.search_text == "renamed gathering new.address@example.org"
+
+    def test_bulk_create_reservations_concurrent_duplicate(self):
+        """
+        Test that a reservation inserted concurrently, after the duplicate
+        lookup, turns into the duplicate reservation error without taking
+        any slot.
+        """
+        attendee = self.create_attendee()
+        self.create_reservation(event=self.event, attendee=attendee)
+        self.event.refresh_from_db()
+        confirmed_count = self.event.confirmed_count
+        payload = {
+            "event": str(self.event.id),
+            "attendees": [str(self.create_attendee().id), str(attendee.id)],
+            "status": "Confirmed",
+        }
+        # The concurrent insert happens after the lookup of existing rows.
+        with patch.object(
+            Reservation.all_objects,
+            "filter",
+            return_value=Reservation.all_objects.none(),
+        ):
+            response = self.client.post(f"{self.url}bulk/", payload, format="json")
+
+        assert response.status_code == 400
+        assert response.json()["code"] == "FORM009"
+        assert Reservation.objects.filter(event=self.event).count() == 1
+        self.event.refresh_from_db()
+        assert self.event.confirmed_count == confirmed_count
+
+    def test_search_text_without_related_lookups(self):
+        """
+        Test that saving a reservation fills its search text from the loaded
+        event and attendee user, and with a single UPDATE when they are not
+        loaded, without fetching them.
+        """
+        attendee = Attendee.objects.select_related("user").get(pk=self.attendee.pk)
+        expected = f"{self.event.name} {attendee.user.email}".lower()
+        with CaptureQueriesContext(connection) as queries:
+            reservation = Reservation.objects.create(
+                event=self.event, attendee=attendee
+            )
+        assert reservation.search_text == expected
+        assert not any(
+            query["sql"].startswith("SELECT") and '"user"' in query["sql"]
+            for query in queries
+        )
+
+        other = self.create_attendee()
+        expected = f"{self.event.name} {other.user.email}".lower()
+        with CaptureQueriesContext(connection) as queries:
+            reservation = Reservation.objects.create(
+                event_id=self.event.id, attendee_id=other.id
+            )
+        assert not any(
+            query["sql"].startswith("SELECT")
+            and ('"user"' in query["sql"] or 'FROM "attendee"' in query["sql"])
+            for query in queries
+        )
+        reservation.refresh_from_db()
+        assert reservation.search_text == expected
+
+    def test_search_after_renaming_event_to_a_prefix(self):
+        """
+        Test that renaming an event to a prefix of its old name refreshes the
+        search text, so the dropped words no longer match.
+        """
+        self.event.name = "Python Summit"
+        self.event.save()
+        reservation = self.create_reservation(event=self.event, attendee=self.attendee)
+
+        self.event.name = "Python"
+        self.event.save()
+        reservation.refresh_from_db()
+        assert reservation.search_text == (f"python {self.attendee.user.email}".lower())
+        response = self.client.get(self.url, {"search": "summit"})
+        assert response.json()["results"] == []
+
+    def test_list_reservations_conditional_get(self):
+        """
+        Test that the reservation list answers 304 until a reservation or the
+        attendee email it shows changes.
+        """
+        reservation = self.create_reservation(event=self.event, attendee=self.attendee)
+        etag = self.client.get(self.url)["ETag"]
+        assert self.client.get(self.url, HTTP_IF_NONE_MATCH=etag).status_code == 304
+
+        user = self.attendee.user
+        user.email = "changed@example.org"
+        user.save()
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == 200
+        assert response.json()["results"][0]["attendee_email"] == user.email
+
+        detail_url = f"{self.url}{reservation.id}/"
+        etag = self.client.get(detail_url)["ETag"]
+        assert self.client.get(detail_url, HTTP_IF_NONE_MATCH=etag).status_code == 304
+
     def test_update_reservation(self):
         """
         Test updating a reservation.
@@ -0,0 +1,92 @@
+import pytest
+from concurrent.futures import ThreadPoolExecutor
+from django.db import OperationalError, connection
+from django.utils import timezone
+from datetime import timedelta
+from faker import Faker
+from core.utils.errors import CustomAPIException
+from event_management.models import Attendee, Category, Event, Reservation
+from event_management.services import create_reservation
+from security.models import User
+
+faker = Faker()
+
+BOOKERS = 200
+SLOTS = 50
+
+
+@pytest.mark.django_db(transaction=True)
+class TestReservationConcurrency:
+    """
+    Stress test proving the reservation service never overbooks an event.
+    """
+
+    def setup_method(self, method):
+        """
+        Create a 50-slot event and 200 distinct attendees.
+        """
+        category = Category.objects.create(name=faker.unique.word())
+        self.event = Event.objects.create(
+            name="Sold out show",
+            description="Concurrency stress test",
+            date=timezone.now() + timedelta(days=30),
+            location=faker.city(),
+            total_slots=SLOTS,
+            category=category,
+        )
+        users = User.objects.bulk_create(
+            User(email=f"booker{i}@example.com", username=f"booker{i}")
+            for i in range(BOOKERS)
+        )
+        self.attendees = Attendee.objects.bulk_create(
+            Attendee(user=user) for user in users
+        )
+
+    def _book(self, attendee):
+        try:
+            create_reservation(
+                {"event": self.event, "attendee": attendee, "status": "Confirmed"}
+            )
+            return "booked"
+        except CustomAPIException:
+            return "sold_out"
+        except OperationalError as error:
+            # Only lock contention is expected: SQLite refuses a concurrent
+            # writer ("database is locked") and PostgreSQL may abort a
+            # transaction on a serialization failure or deadlock. Either is a
+            # failed booking, never an overbooking.
+            message = str(error).lower()
+            if not any(
+                reason in message
+                for reason in ("locked", "could not serialize", "deadlock")
+            ):
+                return f"unexpected: {error!r}"
+            return "error"
+        except Exception as error:
+            return f"unexpected: {error!r}"
+        finally:
+            connection.close()
+
+    def test_parallel_bookers_never_overbook(self):
+        """
+        200 parallel confirmed bookings against 50 slots confirm at most 50,
+        and the counter always matches the confirmed rows.
+        """
+        with ThreadPoolExecutor(max_workers=32) as pool:
+            results = list(pool.map(self._book, self.attendees))
+
+        unexpected = [result for result in results if result.startswith("unexpected")]
+        assert not unexpected, unexpected
+
+        booked = results.count("booked")
+        confirmed = Reservation.objects.filter(
+            event=self.event, status="Confirmed"
+        ).count()
+        self.event.refresh_from_db()
+
+        assert booked <= SLOTS
+        assert confirmed == booked
+        assert self.event.confirmed_count == confirmed
+        assert results.count("sold_out") + results.count("error") == BOOKERS - booked
+        if connection.vendor == "postgresql":
+            assert booked == SLOTS
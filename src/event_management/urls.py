@@ -1,9 +1,36 @@
+from django.urls import path
 from rest_framework.routers import SimpleRouter
 
 from .views import EventViewSet, ReservationViewSet
+from .views.async_event_views import (
+    AsyncAttendeeNamesView,
+    AsyncEventDetailView,
+    AsyncEventListView,
+    AsyncEventNamesView,
+)
 
 router = SimpleRouter()
 router.register(r"event", EventViewSet)
 router.register(r"reservation", ReservationViewSet, basename="reservation")
 
-urlpatterns = router.urls + []
+# Async (ASGI) variants of the read-only event endpoints.
+async_urlpatterns = [
+    path("async/event/", AsyncEventListView.as_view(), name="async_event_list"),
+    path(
+        "async/event/list-events/",
+        AsyncEventNamesView.as_view(),
+        name="async_event_list_events",
+    ),
+    path(
+        "async/event/list-attendees/",
+        AsyncAttendeeNamesView.as_view(),
+        name="async_event_list_attendees",
+    ),
+    path(
+        "async/event/<uuid:pk>/",
+        AsyncEventDetailView.as_view(),
+        name="async_event_detail",
+    ),
+]
+
+urlpatterns = router.urls + async_urlpatterns
@@ -0,0 +1,175 @@
+"""
+Async (ASGI) implementations of the read-only event endpoints.
+
+They answer the same requests as the matching ``EventViewSet`` actions and
+reuse its queryset, filter backends and serializer, but authenticate and run
+their queries through the async ORM, so under an ASGI server a worker keeps
+serving other connections while a request waits on the database.
+"""
+
+from django.http import HttpResponse
+from django.views import View
+from rest_framework import status
+from rest_framework.exceptions import APIException, NotFound
+from rest_framework.renderers import JSONRenderer
+from rest_framework.request import Request
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+from core.utils.authorizer_permission import AuthorizerPermission
+from core.utils.pagination import CustomPageNumberPagination
+from core.utils.verify_permission import verify_permission
+from event_management.models import Event
+from event_management.services import attendee_lookup, event_lookup
+from .event_viewset import EventViewSet
+
+
+def json_response(data, status_code=status.HTTP_200_OK):
+    """
+    Render ``data`` with DRF's JSON renderer, like the sync endpoints do.
+    """
+    return HttpResponse(
+        JSONRenderer().render(data),
+        content_type="application/json",
+        status=status_code,
+    )
+
+
+class AsyncAPIView(View):
+    """
+    Base async view: authenticates with ``AuthorizerPermission`` and renders
+    API exceptions the way DRF does.
+    """
+
+    http_method_names = ["get"]
+
+    async def dispatch(self, request, *args, **kwargs):
+        try:
+            await AuthorizerPermission().ahas_permission(request, self)
+            return await super().dispatch(request, *args, **kwargs)
+        except APIException as exc:
+            detail = exc.detail
+            if not isinstance(detail, (dict, list)):
+                detail = {"detail": detail}
+            return json_response(detail, exc.status_code)
+
+    def get_viewset(self, request, action, **kwargs):
+        """
+        Build the ``EventViewSet`` handling the same action, to share its
+        queryset, filters and serializer.
+        """
+        viewset = EventViewSet(
+            request=Request(request), action=action, format_kwarg=None, kwargs=kwargs
+        )
+        viewset.args = ()
+        return viewset
+
+
+class AsyncEventListView(AsyncAPIView):
+    """
+    Async equivalent of ``GET event/`` with page-number pagination.
+    """
+
+    @verify_permission("view_event")
+    async def get(self, request):
+        """
+        List the events matching the filters, search and ordering.
+
+        Returns:
+            HttpResponse: A paginated list of events.
+        """
+        viewset = self.get_viewset(request, "list")
+        queryset = viewset.filter_queryset(viewset.get_queryset())
+        paginator = CustomPageNumberPagination()
+        page_size = paginator.get_page_size(viewset.request)
+        try:
+            page_number = int(request.GET.get(paginator.page_query_param, 1))
+        except ValueError:
+            page_number = 0
+
+        count = await queryset.acount()
+        last_page = max((count + page_size - 1) // page_size, 1)
+        if not 1 <= page_number <= last_page:
+            raise NotFound(paginator.invalid_page_message)
+
+        offset = (page_number - 1) * page_size
+        events = [event async for event in queryset[offset : offset + page_size]]
+        next_link, previous_link = self.get_page_links(
+            request, paginator.page_query_param, page_number, last_page
+        )
+        return json_response(
+            {
+                "count": count,
+                "next": next_link,
+                "previous": previous_link,
+                "results": viewset.get_serializer(events, many=True).data,
+            }
+        )
+
+    def get_page_links(self, request, page_query_param, page_number, last_page):
+        """
+        Build the next and previous links like ``PageNumberPagination``.
+        """
+        url = request.build_absolute_uri()
+        next_link = previous_link = None
+        if page_number < last_page:
+            next_link = replace_query_param(url, page_query_param, page_number + 1)
+        if page_number == 2:
+            previous_link = remove_query_param(url, page_query_param)
+        elif page_number > 2:
+            previous_link = replace_query_param(url, page_query_param, page_number - 1)
+        return next_link, previous_link
+
+
+class AsyncEventDetailView(AsyncAPIView):
+    """
+    Async equivalent of ``GET event/<id>/``.
+    """
+
+    @verify_permission("view_event")
+    async def get(self, request, pk):
+        """
+        Retrieve a single event.
+
+        Returns:
+            HttpResponse: The serialized event.
+        """
+        viewset = self.get_viewset(request, "retrieve", pk=pk)
+        try:
+            event = await viewset.get_queryset().aget(pk=pk)
+        except Event.DoesNotExist:
+            raise NotFound()
+        return json_response(viewset.get_serializer(event).data)
+
+
+class AsyncEventNamesView(AsyncAPIView):
+    """
+    Async equivalent of ``GET event/list-events/``.
+    """
+
+    async def get(self, request):
+        """
+        List the events with their name and ID.
+        """
+        viewset = self.get_viewset(request, "list_events")
+        rows, _ = event_lookup(**viewset._get_lookup_params(viewset.request))
+        return json_response(
+            [{"id": event_id, "name": name} async for event_id, name in rows]
+        )
+
+
+class AsyncAttendeeNamesView(AsyncAPIView):
+    """
+    Async equivalent of ``GET event/list-attendees/``.
+    """
+
+    async def get(self, request):
+        """
+        List the attendees with their full name and ID.
+        """
+        viewset = self.get_viewset(request, "list_attendees")
+        rows, _ = attendee_lookup(**viewset._get_lookup_params(viewset.request))
+        return json_response(
+            [
+                {"id": attendee_id, "full_name": full_name}
+                async for attendee_id, full_name in rows
+            ]
+        )
@@ -2,22 +2,46 @@ from rest_framework import viewsets, status
 from rest_framework.response import Response
 from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework import filters
-from event_management.models import Event, Attendee
+from event_management.models import Event, ReportJob
 from event_management.serializers import (
     EventSerializer,
     EventCreateUpdateSerializer,
     EventReportSerializer,
+    LookupQuerySerializer,
+    ReportJobSerializer,
+)
+from event_management.services import (
+    attendee_lookup,
+    event_list_cache_key,
+    event_lookup,
+    get_cached_event_list,
+    set_cached_event_list,
+    stream_json_array,
 )
 from core.utils.authorizer_permission import AuthorizerPermission
-from .filters import EventFilter
+from core.utils.permission_cache import get_permission_codenames
+from event_management.serializers.event_report_serializer import REPORT_FORMATS
+from .filters import EventFilter, EventSearchFilter
 from core.utils.verify_permission import verify_permission
 from rest_framework.decorators import action
-from core.utils.pagination import CustomPageNumberPagination
-from django.http import HttpResponse
+from core.utils.pagination import OptionalKeysetPagination
+from core.utils.conditional import (
+    ConditionalGetMixin,
+    add_validators,
+    not_modified_response,
+    queryset_validators,
+)
+from core.utils.renderers import CSVRenderer, NDJSONRenderer, XLSXRenderer
+from rest_framework.renderers import JSONRenderer
+from django.http import FileResponse, StreamingHttpResponse
+from django_q.tasks import async_task
+from core.utils.errors import APIErrors, CustomAPIException
 from django.utils.timezone import now
+from django.db.models import F, Value
+from django.db.models.functions import Greatest
 
 
-class EventViewSet(viewsets.ModelViewSet):
+class EventViewSet(ConditionalGetMixin, viewsets.ModelViewSet):
     """
     ViewSet for managing events with CRUD operations, search, filtering, pagination, and ordering.
     Includes custom business logic in overridden methods.
@@ -26,45 +50,134 @@ class EventViewSet(viewsets.ModelViewSet):
     queryset = Event.objects.all()
     serializer_class = EventSerializer
     permission_classes = [AuthorizerPermission]
-    pagination_class = CustomPageNumberPagination
+    pagination_class = OptionalKeysetPagination
     filter_backends = [
         DjangoFilterBackend,
-        filters.SearchFilter,
         filters.OrderingFilter,
+        EventSearchFilter,
     ]
     filterset_class = EventFilter
     search_fields = ["name", "description"]
     ordering_fields = ["date", "name"]
     ordering = ["date"]
+    keyset_ordering = ("date", "id")
+    conditional_modified_fields = ("modified_at", "category__modified_at")
+
+    def _expand_speakers(self):
+        """
+        Whether the client asked for the speakers with ``?expand=speakers``.
+        """
+        if self.request is None:
+            return False
+        return "speakers" in self.request.query_params.get("expand", "").split(",")
+
+    def get_conditional_modified_fields(self):
+        """
+        Expanded speakers are part of the body, so their changes count too.
+        The expand flag itself is part of ``get_conditional_key``.
+        """
+        fields = super().get_conditional_modified_fields()
+        if self._expand_speakers():
+            fields = (*fields, "speakers__modified_at")
+        return fields
+
+    def get_queryset(self):
+        """
+        Tune the queryset for the read paths: join the category, skip the
+        search vector, annotate the available slots in SQL and prefetch
+        speakers only when expanded, so a page costs a constant number of
+        queries.
+        """
+        queryset = super().get_queryset()
+        if self.action in ("list", "retrieve"):
+            queryset = (
+                queryset.select_related("category")
+                .defer("search_vector")
+                .annotate(
+                    open_slots=Greatest(
+                        F("total_slots") - F("confirmed_count"), Value(0)
+                    )
+                )
+            )
+            if self._expand_speakers():
+                queryset = queryset.prefetch_related("speakers")
+        return queryset
+
+    def get_serializer_context(self):
+        """
+        Pass the speakers expansion flag to the serializer.
+        """
+        context = super().get_serializer_context()
+        context["expand_speakers"] = self._expand_speakers()
+        return context
 
     @verify_permission("view_event")
     def list(self, request, *args, **kwargs):
         """
         Overrides list method to handle custom logic before listing Events.
 
+        Answers ``304 Not Modified`` when the ETag / Last-Modified computed
+        from the filtered rows match the client's copy. Rendered pages are
+        shared through the response cache by every caller with the same
+        permissions (see ``response_cache_service``).
+
         Returns:
             Response: A paginated list of all events.
         """
+        cache_key = self.get_list_cache_key()
+        cached = get_cached_event_list(cache_key)
+        if cached is not None:
+            data, validators = cached
+            response = not_modified_response(request, validators) or Response(data)
+            response["X-Response-Cache"] = "HIT"
+            return add_validators(response, validators)
+
         queryset = self.filter_queryset(self.get_queryset())
+        validators = self.get_validators(queryset)
+        not_modified = not_modified_response(request, validators)
+        if not_modified is not None:
+            return not_modified
+
         page = self.paginate_queryset(queryset)
         if page is not None:
             serializer = self.get_serializer(page, many=True)
-            return self.get_paginated_response(serializer.data)
+            response = self.get_paginated_response(serializer.data)
+        else:
+            response = Response(self.get_serializer(queryset, many=True).data)
+        set_cached_event_list(cache_key, response.data, validators)
+        response["X-Response-Cache"] = "MISS"
+        return add_validators(response, validators)
 
-        serializer = self.get_serializer(queryset, many=True)
-        return Response(serializer.data)
+    def get_list_cache_key(self):
+        """
+        Key of the list response in the shared cache: the normalized query
+        parameters, the base URL the pagination links are built from and the
+        caller's permission set.
+        """
+        return event_list_cache_key(
+            self.request.build_absolute_uri(self.request.path),
+            self.get_conditional_key(),
+            get_permission_codenames(self.request.user.id),
+        )
 
     @verify_permission("view_event")
     def retrieve(self, request, *args, **kwargs):
         """
         Overrides retrieve method to handle custom logic before retrieving a single Event.
 
+        Answers ``304 Not Modified`` when the event did not change.
+
         Returns:
             Response: The serialized data of a single event.
         """
+        validators = self.get_object_validators()
+        not_modified = validators and not_modified_response(request, validators)
+        if not_modified:
+            return not_modified
+
         instance = self.get_object()
         serializer = self.get_serializer(instance)
-        return Response(serializer.data)
+        return add_validators(Response(serializer.data), validators)
 
     @verify_permission("add_event")
     def create(self, request, *args, **kwargs):
@@ -105,9 +218,15 @@ class EventViewSet(viewsets.ModelViewSet):
     def list_events(self, request):
         """
         Custom action to list events with their name and ID.
+
+        Supports ``?q=`` (name prefix) and ``?limit=``, streams the JSON and
+        answers ``304 Not Modified`` when the client's copy is still current.
         """
-        events = Event.objects.values("id", "name")
-        return Response(events, status=status.HTTP_200_OK)
+        params = self._get_lookup_params(request)
+        rows, events = event_lookup(**params)
+        return self._lookup_response(
+            request, rows, ("id", "name"), events, ("modified_at",), params
+        )
 
     @action(
         detail=False,
@@ -118,34 +237,173 @@ class EventViewSet(viewsets.ModelViewSet):
     def list_attendees(self, request):
         """
         Custom action to list attendees with their full name and ID.
+
+        The full name is concatenated in SQL. Supports ``?q=`` (full or last
+        name prefix) and ``?limit=``, streams the JSON and answers
+        ``304 Not Modified`` when the client's copy is still current.
+        """
+        params = self._get_lookup_params(request)
+        rows, attendees = attendee_lookup(**params)
+        return self._lookup_response(
+            request,
+            rows,
+            ("id", "full_name"),
+            attendees,
+            ("modified_at", "user__modified_at"),
+            params,
+        )
+
+    def _get_lookup_params(self, request):
+        """
+        Validate the ``q`` and ``limit`` query parameters of a lookup.
+
+        Returns:
+            dict: The ``prefix`` and ``limit`` arguments of the lookup.
+        """
+        serializer = LookupQuerySerializer(data=request.query_params)
+        serializer.is_valid(raise_exception=True)
+        return {
+            "prefix": serializer.validated_data.get("q", ""),
+            "limit": serializer.validated_data.get("limit"),
+        }
+
+    def _lookup_response(self, request, rows, keys, queryset, modified_fields, params):
+        """
+        Stream a lookup as a JSON array with ETag and Last-Modified validators.
+
+        Returns:
+            HttpResponse: ``304 Not Modified`` or the streamed JSON.
         """
-        attendees = Attendee.objects.values("id", "user__first_name", "user__last_name")
-        formatted_attendees = [
-            {
-                "id": attendee["id"],
-                "full_name": f"{attendee['user__first_name']} {attendee['user__last_name']}",
-            }
-            for attendee in attendees
-        ]
-        return Response(formatted_attendees, status=status.HTTP_200_OK)
+        validators = queryset_validators(
+            queryset, modified_fields, key=f"{params['prefix']}:{params['limit']}"
+        )
+        response = not_modified_response(request, validators)
+        if response is None:
+            response = add_validators(
+                StreamingHttpResponse(
+                    stream_json_array(rows, keys), content_type="application/json"
+                ),
+                validators,
+            )
+        return response
 
     @action(
         detail=False,
-        methods=["get"],
+        methods=["get", "post"],
         url_path="generate-report",
         url_name="generate_report",
+        renderer_classes=[JSONRenderer, XLSXRenderer, CSVRenderer, NDJSONRenderer],
     )
     def generate_report(self, request):
         """
-        Custom action to generate an Excel report for events.
+        Custom action to generate a report for events.
+
+        ``GET`` returns an Excel workbook by default, served from the report
+        cache when the same filters were requested and the data did not
+        change. ``?format=csv`` and ``?format=ndjson`` stream the rows as they
+        are read from the database instead. ``POST`` enqueues an Excel report
+        to django-q and returns the job id, so large reports never block a
+        web worker.
         """
+        if request.method == "POST":
+            return self._enqueue_report(request)
+
         serializer = EventReportSerializer(data=request.query_params)
         serializer.is_valid(raise_exception=True)
-        excel_file = serializer.generate_report()
-        filename = f"event_report_{now().strftime('%Y%m%d_%H%M%S')}.xlsx"
-        response = HttpResponse(
+        report_format = serializer.validated_data["format"]
+        filename = f"event_report_{now().strftime('%Y%m%d_%H%M%S')}.{report_format}"
+        if report_format != "xlsx":
+            response = StreamingHttpResponse(
+                serializer.stream_report(),
+                content_type=REPORT_FORMATS[report_format],
+            )
+            response["Content-Disposition"] = f'attachment; filename="{filename}"'
+            return response
+
+        excel_file, cache_hit = serializer.generate_cached_report()
+        response = FileResponse(
             excel_file,
-            content_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+            as_attachment=True,
+            filename=filename,
+            content_type=REPORT_FORMATS["xlsx"],
         )
-        response["Content-Disposition"] = f'attachment; filename="{filename}"'
+        response["X-Report-Cache"] = "HIT" if cache_hit else "MISS"
         return response
+
+    def _enqueue_report(self, request):
+        """
+        Validate the report filters, create a ReportJob and enqueue it.
+
+        Returns:
+            Response: The queued job with a 202 status.
+        """
+        serializer = EventReportSerializer(data=request.data or request.query_params)
+        serializer.is_valid(raise_exception=True)
+        job = ReportJob.objects.create(
+            filters={
+                field: str(value)
+                for field, value in serializer.validated_data.items()
+                if field != "format"
+            },
+            requested_by=request.user.id,
+        )
+        job.task_id = async_task("event_management.tasks.build_event_report", job.id)
+        job.save(update_fields=["task_id"])
+        job.refresh_from_db()
+        return Response(
+            ReportJobSerializer(job, context={"request": request}).data,
+            status=status.HTTP_202_ACCEPTED,
+        )
+
+    def _get_report_job(self, request, job_id):
+        """
+        Retrieve a report job requested by the current user.
+
+        Raises:
+            CustomAPIException: If the job does not exist or belongs to someone else.
+        """
+        job = ReportJob.objects.filter(pk=job_id, requested_by=request.user.id).first()
+        if job is None:
+            raise CustomAPIException(
+                detail=APIErrors.RESOURCE_NOT_FOUND["message"],
+                code=APIErrors.RESOURCE_NOT_FOUND["code"],
+                status_code=status.HTTP_404_NOT_FOUND,
+            )
+        return job
+
+    @action(
+        detail=False,
+        methods=["get"],
+        url_path=r"report-jobs/(?P<job_id>[0-9a-f-]{36})",
+        url_name="report_job",
+    )
+    def report_job(self, request, job_id=None):
+        """
+        Custom action to check the status of a background report job.
+        """
+        job = self._get_report_job(request, job_id)
+        return Response(ReportJobSerializer(job, context={"request": request}).data)
+
+    @action(
+        detail=False,
+        methods=["get"],
+        url_path=r"report-jobs/(?P<job_id>[0-9a-f-]{36})/download",
+        url_name="report_job_download",
+    )
+    def report_job_download(self, request, job_id=None):
+        """
+        Custom action to download the file of a finished report job.
+        """
+        job = self._get_report_job(request, job_id)
+        if job.status != ReportJob.FINISHED or not job.file:
+            raise CustomAPIException(
+                detail="The report is not ready yet.",
+                code=APIErrors.RESOURCE_NOT_FOUND["code"],
+                status_code=status.HTTP_409_CONFLICT,
+            )
+        return FileResponse(
+            job.file.open("rb"),
+            as_attachment=True,
+            filename=f"event_report_{job.created_at.strftime('%Y%m%d_%H%M%S')}.xlsx",
+            content_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+        )
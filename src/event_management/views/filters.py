@@ -1,4 +1,13 @@
+from django.contrib.postgres.search import (
+    SearchQuery,
+    SearchRank,
+    TrigramSimilarity,
+)
+from django.db import connections
+from django.db.models import Case, F, FloatField, Q, Value, When
 from django_filters import rest_framework as filters
+from rest_framework.filters import SearchFilter
+from rest_framework.settings import api_settings
 from event_management.models import Event
 
 
@@ -14,3 +23,71 @@ class EventFilter(filters.FilterSet):
     class Meta:
         model = Event
         fields = []
+
+
+class EventSearchFilter(SearchFilter):
+    """
+    Ranked event search on the ``search`` query parameter.
+
+    On PostgreSQL it matches the trigger-maintained ``search_vector`` through
+    its GIN index, plus trigram similarity on the name for partial words, and
+    ranks by ``ts_rank`` + similarity. Other databases (SQLite in tests) fall
+    back to ``SearchFilter``'s ``icontains`` matching, ranking name matches
+    first. Results are ordered by rank unless ``ordering`` is sent, so this
+    backend must run after ``OrderingFilter``.
+    """
+
+    search_config = "english"
+
+    def filter_queryset(self, request, queryset, view):
+        terms = self.get_search_terms(request)
+        if not terms:
+            return queryset
+
+        if connections[queryset.db].vendor == "postgresql":
+            text = " ".join(terms)
+            query = SearchQuery(
+                text, config=self.search_config, search_type="websearch"
+            )
+            queryset = queryset.filter(
+                Q(search_vector=query) | Q(name__trigram_similar=text)
+            ).annotate(
+                search_rank=SearchRank(F("search_vector"), query)
+                + TrigramSimilarity("name", text)
+            )
+        else:
+            queryset = super().filter_queryset(request, queryset, view)
+            queryset = queryset.annotate(
+                search_rank=sum(
+                    (
+                        Case(
+                            When(name__icontains=term, then=Value(1.0)),
+                            default=Value(0.0),
+                            output_field=FloatField(),
+                        )
+                        for term in terms
+                    ),
+                    Value(0.0),
+                )
+            )
+
+        if request.query_params.get(api_settings.ORDERING_PARAM):
+            return queryset
+        ordering = queryset.query.order_by or queryset.model._meta.ordering
+        return queryset.order_by("-search_rank", *ordering)
+
+
+class ReservationSearchFilter(SearchFilter):
+    """
+    Reservation search over the denormalized ``Reservation.search_text``.
+
+    The column already holds the lowercased event name and attendee email,
+    so no join is needed and each term becomes a case-sensitive ``LIKE
+    '%term%'`` on lowercased input, which PostgreSQL serves from the trigram
+    GIN index (``icontains`` would wrap the column in ``UPPER()`` and miss it).
+    """
+
+    def filter_queryset(self, request, queryset, view):
+        for term in self.get_search_terms(request):
+            queryset = queryset.filter(search_text__contains=term.lower())
+        return queryset
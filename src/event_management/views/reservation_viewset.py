@@ -2,17 +2,30 @@ from rest_framework import viewsets, status
 from rest_framework.response import Response
 from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework import filters
+from rest_framework.decorators import action
 from event_management.models import Reservation
 from event_management.serializers import (
+    ReservationBulkCreateSerializer,
+    ReservationBulkStatusSerializer,
     ReservationCreateUpdateSerializer,
     ReservationListSerializer,
 )
+from event_management.services import (
+    bulk_create_reservations,
+    bulk_update_reservation_status,
+)
 from core.utils.verify_permission import verify_permission
 from core.utils.authorizer_permission import AuthorizerPermission
-from core.utils.pagination import CustomPageNumberPagination
+from core.utils.pagination import OptionalKeysetPagination
+from core.utils.conditional import (
+    ConditionalGetMixin,
+    add_validators,
+    not_modified_response,
+)
+from .filters import ReservationSearchFilter
 
 
-class ReservationViewSet(viewsets.ModelViewSet):
+class ReservationViewSet(ConditionalGetMixin, viewsets.ModelViewSet):
     """
     ViewSet for managing reservations with CRUD operations.
     Includes custom business logic and permission verification.
@@ -21,38 +34,73 @@ class ReservationViewSet(viewsets.ModelViewSet):
     queryset = Reservation.objects.all()
     serializer_class = ReservationListSerializer
     permission_classes = [AuthorizerPermission]
-    pagination_class = CustomPageNumberPagination
+    pagination_class = OptionalKeysetPagination
     filter_backends = [
         DjangoFilterBackend,
-        filters.SearchFilter,
+        ReservationSearchFilter,
         filters.OrderingFilter,
     ]
     filterset_fields = ["event", "status"]
-    search_fields = ["event__name", "attendee__user__email"]
     ordering_fields = ["reservation_date"]
     ordering = ["reservation_date"]
+    keyset_ordering = ("reservation_date", "id")
+    conditional_modified_fields = (
+        "modified_at",
+        "event__modified_at",
+        "attendee__user__modified_at",
+    )
+
+    def get_queryset(self):
+        """
+        Read only the columns the list serializer projects, joining the event
+        and the attendee's user in the same query, so a page costs a constant
+        number of queries.
+        """
+        queryset = super().get_queryset()
+        if self.action in ("list", "retrieve"):
+            queryset = queryset.select_related("event", "attendee__user").only(
+                "id",
+                "reservation_date",
+                "status",
+                "event__name",
+                "attendee__user__email",
+            )
+        return queryset
 
     @verify_permission("view_reservation")
     def list(self, request, *args, **kwargs):
         """
         List reservations with filters and search capabilities.
+        Answers ``304 Not Modified`` when the client's copy is still current.
         """
         queryset = self.filter_queryset(self.get_queryset())
+        validators = self.get_validators(queryset)
+        not_modified = not_modified_response(request, validators)
+        if not_modified is not None:
+            return not_modified
+
         page = self.paginate_queryset(queryset)
         if page is not None:
             serializer = ReservationListSerializer(page, many=True)
-            return self.get_paginated_response(serializer.data)
-        serializer = ReservationListSerializer(queryset, many=True)
-        return Response(serializer.data)
+            response = self.get_paginated_response(serializer.data)
+        else:
+            response = Response(ReservationListSerializer(queryset, many=True).data)
+        return add_validators(response, validators)
 
     @verify_permission("view_reservation")
     def retrieve(self, request, *args, **kwargs):
         """
         Retrieve details of a specific reservation.
+        Answers ``304 Not Modified`` when the reservation did not change.
         """
+        validators = self.get_object_validators()
+        not_modified = validators and not_modified_response(request, validators)
+        if not_modified:
+            return not_modified
+
         instance = self.get_object()
         serializer = ReservationListSerializer(instance)
-        return Response(serializer.data)
+        return add_validators(Response(serializer.data), validators)
 
     @verify_permission("add_reservation")
     def create(self, request, *args, **kwargs):
@@ -86,3 +134,53 @@ class ReservationViewSet(viewsets.ModelViewSet):
         instance = self.get_object()
         self.perform_destroy(instance)
         return Response(status=status.HTTP_204_NO_CONTENT)
+
+    @action(detail=False, methods=["post"], url_path="bulk", url_name="bulk_create")
+    @verify_permission("add_reservation")
+    def bulk_create(self, request):
+        """
+        Create the reservations of many attendees for one event in a single
+        transaction, with one capacity check and one duplicate lookup.
+
+        Confirmed reservations take their slots all together or not at all.
+
+        Returns:
+            Response: The number of reservations created and one result per
+            attendee; 201 if any was created, 400 otherwise.
+        """
+        serializer = ReservationBulkCreateSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        results = bulk_create_reservations(
+            serializer.validated_data["event"],
+            serializer.validated_data["attendees"],
+            serializer.validated_data["status"],
+        )
+        created = sum(1 for result in results if result["result"] == "created")
+        return Response(
+            {"created": created, "results": results},
+            status=status.HTTP_201_CREATED if created else status.HTTP_400_BAD_REQUEST,
+        )
+
+    @action(
+        detail=False, methods=["post"], url_path="bulk-status", url_name="bulk_status"
+    )
+    @verify_permission("change_reservation")
+    def bulk_status(self, request):
+        """
+        Confirm, cancel or reset many reservations in a single transaction.
+
+        Confirmations claim the slots of each event all together or not at
+        all; cancellations release them.
+
+        Returns:
+            Response: The number of reservations updated and one result per
+            reservation.
+        """
+        serializer = ReservationBulkStatusSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        results = bulk_update_reservation_status(
+            serializer.validated_data["reservations"],
+            serializer.validated_data["status"],
+        )
+        updated = sum(1 for result in results if result["result"] == "updated")
+        return Response({"updated": updated, "results": results})
@@ -1,15 +1,37 @@
 from django.contrib import admin
+from django.db.models.functions import Now
+from core.utils.batched_update import bulk_update, message_bulk_update
+from core.utils.permission_cache import invalidate_all_permissions
+
+
+def expire_permissions(batch):
+    """
+    Per-batch hook of the status actions: ``QuerySet.update`` skips the
+    model signals, so the permission cache is expired explicitly.
+    """
+    invalidate_all_permissions()
 
 
 def change_active_status(queryset, active_status):
     """
     Generic function to change the 'active' status of the given queryset.
 
+    The rows are updated in primary-key batches, each in a short transaction
+    (in a background task for large selections), expiring the permission
+    cache once per batch.
+
     Parameters:
         queryset (QuerySet): A QuerySet containing the selected objects.
         active_status (bool): The desired status for the 'active' field.
+
+    Returns:
+        BulkUpdateResult: How the update was carried out.
     """
-    queryset.update(active=active_status)
+    return bulk_update(
+        queryset,
+        {"active": active_status, "modified_at": Now()},
+        on_batch="security.actions.expire_permissions",
+    )
 
 
 @admin.action(description="Activate selected roles")
@@ -25,7 +47,8 @@ def activate_roles(self, request, queryset):
         request (HttpRequest): The current HTTP request object.
         queryset (QuerySet): A QuerySet containing the selected objects.
     """
-    change_active_status(queryset, True)
+    result = change_active_status(queryset, True)
+    message_bulk_update(self, request, result)
 
 
 @admin.action(description="Deactivate selected roles")
@@ -41,7 +64,8 @@ def deactivate_roles(self, request, queryset):
         request (HttpRequest): The current HTTP request object.
         queryset (QuerySet): A QuerySet containing the selected objects.
     """
-    change_active_status(queryset, False)
+    result = change_active_status(queryset, False)
+    message_bulk_update(self, request, result)
 
 
 @admin.action(description="Activate selected user roles")
@@ -57,7 +81,8 @@ def activate_user_roles(self, request, queryset):
         request (HttpRequest): The current HTTP request object.
         queryset (QuerySet): A QuerySet containing the selected objects.
     """
-    change_active_status(queryset, True)
+    result = change_active_status(queryset, True)
+    message_bulk_update(self, request, result)
 
 
 @admin.action(description="Deactivate selected user roles")
@@ -73,4 +98,5 @@ def deactivate_user_roles(self, request, queryset):
         request (HttpRequest): The current HTTP request object.
         queryset (QuerySet): A QuerySet containing the selected objects.
     """
-    change_active_status(queryset, False)
+    result = change_active_status(queryset, False)
+    message_bulk_update(self, request, result)
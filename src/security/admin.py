@@ -1,4 +1,6 @@
 from django.contrib import admin
+from django.db.models import Prefetch
+from core.utils.pagination import EstimatedCountPaginator
 from .models import User, Rol, UserRol
 from .actions import (
     activate_roles,
@@ -16,7 +18,8 @@ class UserAdmin(admin.ModelAdmin):
 
     Displays a list of users with their email, status, date joined,
     and associated roles. Allows searching by email and username,
-    and filtering by status and date joined.
+    and filtering by status and date joined. The roles of a page are
+    prefetched with their names in one query.
     """
 
     form = UserForm
@@ -24,6 +27,20 @@ class UserAdmin(admin.ModelAdmin):
     search_fields = ("email", "username")
     list_filter = ("status", "date_joined", "is_active")
     actions = [activate_roles, deactivate_roles]
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+
+    def get_queryset(self, request):
+        """
+        Prefetch the role assignments of the listed users with their roles.
+        """
+        return (
+            super()
+            .get_queryset(request)
+            .prefetch_related(
+                Prefetch("userrol_set", queryset=UserRol.objects.select_related("rol"))
+            )
+        )
 
     def get_roles(self, obj):
         """
@@ -42,27 +59,30 @@ class UserAdmin(admin.ModelAdmin):
 
     get_roles.short_description = "Roles"
 
-    def change_view(self, request, object_id, form_url="", extra_context=None):
+    def render_change_form(
+        self, request, context, add=False, change=False, form_url="", obj=None
+    ):
         """
-        Override the change view to add roles to the context.
+        Add the roles of the user being edited to the admin context.
 
-        Adds the roles associated with the user to the admin context,
-        allowing them to be displayed as read-only in the admin form.
+        Uses the object already loaded by the change view (with its roles
+        prefetched) instead of fetching the user a second time.
 
         Parameters:
             request (HttpRequest): The current request object.
-            object_id (str): The ID of the user being edited.
+            context (dict): The template context.
+            add (bool): Whether this is the add form.
+            change (bool): Whether this is the change form.
             form_url (str): The form URL.
-            extra_context (dict): Additional context variables.
+            obj (User): The user being edited, if any.
 
         Returns:
             HttpResponse: The response object for the view.
         """
-        extra_context = extra_context or {}
-        user = self.get_object(request, object_id)
-        extra_context["roles"] = self.get_roles(user)
-        return super().change_view(
-            request, object_id, form_url, extra_context=extra_context
+        if obj is not None:
+            context["roles"] = self.get_roles(obj)
+        return super().render_change_form(
+            request, context, add=add, change=change, form_url=form_url, obj=obj
         )
 
 
@@ -97,6 +117,10 @@ class UserRolAdmin(admin.ModelAdmin):
 
     form = UserRolForm
     list_display = ("user", "rol", "active")
+    list_select_related = ("user", "rol")
     search_fields = ("user__email", "rol__name")
     list_filter = ("active",)
+    autocomplete_fields = ("user", "rol")
     actions = [activate_user_roles, deactivate_user_roles]
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
@@ -0,0 +1,25 @@
+"""
+Password hashers with a configurable work factor.
+
+``PASSWORD_HASHERS`` selects the hasher used for new hashes (the first one);
+the others still verify existing hashes. When ``PASSWORD_REHASH_ON_LOGIN`` is
+enabled, a password stored with another hasher or work factor is rehashed
+transparently at the next successful login (see ``User.check_password``).
+"""
+
+from django.conf import settings
+from django.contrib.auth import hashers
+
+
+class PBKDF2PasswordHasher(hashers.PBKDF2PasswordHasher):
+    """
+    Django's PBKDF2-SHA256 hasher with ``PASSWORD_PBKDF2_ITERATIONS`` rounds.
+    """
+
+    @property
+    def iterations(self):
+        return getattr(
+            settings,
+            "PASSWORD_PBKDF2_ITERATIONS",
+            hashers.PBKDF2PasswordHasher.iterations,
+        )
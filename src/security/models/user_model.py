@@ -2,6 +2,8 @@
 Models for the core app.
 """
 
+from django.conf import settings
+from django.contrib.auth.hashers import check_password
 from django.contrib.auth.models import AbstractUser, PermissionsMixin
 from django.db import models
 
@@ -23,6 +25,15 @@ class User(AbstractUser, BaseModel, PermissionsMixin):
     def __str__(self):
         return self.username
 
+    def check_password(self, raw_password):
+        """
+        Check a password, rehashing it with the preferred hasher only when
+        ``PASSWORD_REHASH_ON_LOGIN`` is enabled.
+        """
+        if getattr(settings, "PASSWORD_REHASH_ON_LOGIN", True):
+            return super().check_password(raw_password)
+        return check_password(raw_password, self.password)
+
     class Meta:
         db_table = "user"
         ordering = ["created_at"]
@@ -1,9 +1,9 @@
 from rest_framework_simplejwt.serializers import TokenObtainPairSerializer
-from datetime import datetime
 from django.contrib.auth import authenticate
-from django.contrib.auth.models import update_last_login
-from rest_framework_simplejwt.settings import api_settings
 from core.utils.errors import AuthErrors, CustomAPIException
+from core.utils.permission_cache import get_permission_version
+from security.models import UserRol
+from security.services import record_last_login
 
 
 class MyTokenObtainPairSerializer(TokenObtainPairSerializer):
@@ -17,6 +17,15 @@ class MyTokenObtainPairSerializer(TokenObtainPairSerializer):
         """
         Customizes the JWT token by adding the user's last login time.
 
+        The new login time is stored with a single ``UPDATE`` of
+        ``last_login`` (see ``record_last_login``).
+
+        Also adds the claims used by the stateless authentication mode
+        (``STATELESS_JWT_AUTH``): ``is_active``, the IDs of the user's active
+        roles and the permission-version stamp they are valid for. The
+        security signals rotate that stamp when the user or their roles
+        change, so a token whose claims went stale is not trusted.
+
         Parameters:
             user (User): The user instance for whom the token is generated.
 
@@ -28,8 +37,16 @@ class MyTokenObtainPairSerializer(TokenObtainPairSerializer):
         if user.last_login:
             token["last_login"] = user.last_login.strftime("%Y/%m/%d - %H:%M:%S")
 
-        user.last_login = datetime.now()
-        user.save()
+        record_last_login(user)
+
+        token["is_active"] = user.is_active
+        token["perm_version"] = get_permission_version(user.id)
+        token["roles"] = [
+            str(rol_id)
+            for rol_id in UserRol.objects.filter(user=user, active=True).values_list(
+                "rol_id", flat=True
+            )
+        ]
 
         return token
 
@@ -51,9 +68,6 @@ class MyTokenObtainPairSerializer(TokenObtainPairSerializer):
 
         token = self.get_token(self.user)
 
-        if api_settings.UPDATE_LAST_LOGIN:
-            update_last_login(None, self.user)
-
         return {"token": str(token.access_token)}
 
     def _authenticate_user(self, attrs):
@@ -0,0 +1 @@
+from .last_login_service import record_last_login, write_last_login
@@ -0,0 +1,59 @@
+from datetime import timedelta
+from django.conf import settings
+from django.db.models import Q
+from django.utils import timezone
+from django_q.tasks import async_task
+from security.models import User
+
+
+def write_last_login(user_id, timestamp):
+    """
+    Store the login time of a user with a single targeted ``UPDATE``.
+
+    Writes that arrive late (e.g. from the task queue) never move
+    ``last_login`` backwards.
+
+    Parameters:
+        user_id (UUID): The ID of the user.
+        timestamp (datetime): The login time.
+
+    Returns:
+        int: The number of rows updated (0 or 1).
+    """
+    return (
+        User.objects.filter(pk=user_id)
+        .filter(Q(last_login__isnull=True) | Q(last_login__lt=timestamp))
+        .update(last_login=timestamp)
+    )
+
+
+def record_last_login(user, timestamp=None):
+    """
+    Record a login of ``user``, following the last-login settings:
+
+    - ``LAST_LOGIN_UPDATE_INTERVAL``: seconds during which repeated logins
+      are not written again (0 writes every login).
+    - ``LAST_LOGIN_ASYNC``: queue the write as a django-q task instead of
+      running it in the request.
+
+    Parameters:
+        user (User): The user logging in; ``last_login`` is updated in memory.
+        timestamp (datetime, optional): The login time, now by default.
+
+    Returns:
+        bool: True if a write was issued or queued, False if it was skipped.
+    """
+    timestamp = timestamp or timezone.now()
+    previous, user.last_login = user.last_login, timestamp
+    interval = getattr(settings, "LAST_LOGIN_UPDATE_INTERVAL", 0)
+    if previous and timestamp - previous < timedelta(seconds=interval):
+        return False
+    if getattr(settings, "LAST_LOGIN_ASYNC", False):
+        async_task(
+            "security.services.last_login_service.write_last_login",
+            user.pk,
+            timestamp,
+        )
+    else:
+        write_last_login(user.pk, timestamp)
+    return True
@@ -0,0 +1,63 @@
+from django.contrib.auth.models import Group
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.dispatch import receiver
+from core.utils.permission_cache import (
+    invalidate_all_permissions,
+    invalidate_user_permissions,
+)
+from security.models import Rol, User, UserRol
+
+
+@receiver(post_save, sender=Rol)
+@receiver(post_delete, sender=Rol)
+@receiver(m2m_changed, sender=Rol.permissions.through)
+@receiver(m2m_changed, sender=Group.permissions.through)
+def invalidate_permissions_on_role_change(sender, **kwargs):
+    """
+    Expire every cached permission set when a role or its permissions change.
+
+    Role changes are rare admin operations, so a global rotation is cheaper
+    than resolving the affected users.
+    """
+    if kwargs.get("action", "post_").startswith("post_"):
+        invalidate_all_permissions()
+
+
+@receiver(post_save, sender=UserRol)
+@receiver(post_delete, sender=UserRol)
+def invalidate_permissions_on_user_rol_change(sender, instance, **kwargs):
+    """
+    Expire the cached permissions of a user when a role assignment changes.
+    """
+    invalidate_user_permissions(instance.user_id)
+
+
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+def invalidate_permissions_on_user_change(sender, instance, **kwargs):
+    """
+    Expire the cached permissions of a user when the user is saved (e.g. a
+    change of ``is_superuser``) or deleted. Saves limited to ``last_login``
+    (the login path) are ignored.
+    """
+    if kwargs.get("update_fields") == frozenset({"last_login"}):
+        return
+    invalidate_user_permissions(instance.pk)
+
+
+@receiver(m2m_changed, sender=User.user_permissions.through)
+@receiver(m2m_changed, sender=User.groups.through)
+def invalidate_permissions_on_user_permissions_change(
+    sender, instance, action, reverse, pk_set, **kwargs
+):
+    """
+    Expire the cached permissions of the users whose permissions or groups changed.
+    """
+    if not action.startswith("post_"):
+        return
+    if not reverse:
+        invalidate_user_permissions(instance.pk)
+    elif pk_set:
+        invalidate_user_permissions(*pk_set)
+    else:
+        invalidate_all_permissions()
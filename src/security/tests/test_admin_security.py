@@ -1,5 +1,9 @@
 import pytest
+from unittest import mock
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
+from core.utils.pagination import EstimatedCountPaginator
 from security.models import User, Rol, UserRol
 from faker import Faker
 
@@ -158,3 +162,54 @@ class TestSecurityAdmin:
         assert response.status_code == 302
         self.user.refresh_from_db()
         assert self.user.email == "updated_user@example.com"
+
+    def test_user_admin_list_view_constant_queries(self):
+        """
+        Ensure the roles of the listed users are prefetched, not queried per row.
+        """
+        url = reverse("admin:security_user_changelist")
+        self.client.get(url)
+        counts = []
+        for _ in range(2):
+            with CaptureQueriesContext(connection) as queries:
+                response = self.client.get(url)
+            assert response.status_code == 200
+            counts.append(len(queries))
+            for _ in range(5):
+                user = User.objects.create_user(
+                    email=faker.email(), password="user123", username=faker.name()
+                )
+                UserRol.objects.create(user=user, rol=self.role, active=True)
+        assert counts[0] == counts[1]
+        assert b"Test Role" in response.content
+
+    def test_user_admin_change_view_loads_user_once(self):
+        """
+        Ensure the user change view does not fetch the user twice.
+        """
+        url = reverse("admin:security_user_change", args=[self.user.id])
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url)
+        assert response.status_code == 200
+        user_lookups = [
+            query
+            for query in queries
+            if query["sql"].startswith('SELECT "user"."password"')
+            and str(self.user.id).replace("-", "") in query["sql"]
+        ]
+        assert len(user_lookups) == 1
+
+    def test_estimated_count_paginator(self):
+        """
+        Ensure large changelists trust the row estimate and small ones count.
+        """
+        users = User.objects.order_by("email")
+        assert EstimatedCountPaginator(users, 10).count == users.count()
+        with mock.patch.object(
+            EstimatedCountPaginator, "_estimated_count", return_value=250000
+        ):
+            assert EstimatedCountPaginator(users, 10).count == 250000
+        with mock.patch.object(
+            EstimatedCountPaginator, "_estimated_count", return_value=12
+        ):
+            assert EstimatedCountPaginator(users, 10).count == users.count()
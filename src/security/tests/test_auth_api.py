@@ -1,7 +1,15 @@
 import pytest
 from rest_framework import status
+from core.utils.permission_cache import get_permission_version
 from core.utils.test_setup import TestSetup
-from security.models import User
+import jwt
+from datetime import timedelta
+from django.conf import settings
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from security.models import User, UserRol
+from security.services import write_last_login
 from django.contrib.auth.hashers import make_password
 from faker import Faker
 
@@ -49,6 +57,81 @@ class TestAuthAPI(TestSetup):
         assert "token" in response_data
         assert response_data["token"] is not None
 
+    def test_login_token_has_stateless_claims(self):
+        """
+        Test that the access token carries the claims used by stateless auth.
+        """
+        role = self.create_role()
+        UserRol.objects.create(user=self.valid_user, rol=role, active=True)
+        data = {
+            "email": self.valid_user.email,
+            "password": "ValidPassword123",
+        }
+        response = self.client.post(self.url, data)
+        payload = jwt.decode(
+            response.json()["token"], key=settings.SECRET_KEY, algorithms=["HS256"]
+        )
+        assert payload["user_id"] == str(self.valid_user.id)
+        assert payload["is_active"] is True
+        assert payload["roles"] == [str(role.id)]
+        assert payload["perm_version"] == get_permission_version(self.valid_user.id)
+
+    def login(self, user=None, password="ValidPassword123"):
+        user = user or self.valid_user
+        return self.client.post(self.url, {"email": user.email, "password": password})
+
+    def test_login_writes_only_last_login(self):
+        """
+        Test that a login stores the login time with one targeted UPDATE.
+        """
+        with CaptureQueriesContext(connection) as queries:
+            response = self.login()
+        assert response.status_code == status.HTTP_200_OK
+        updates = [q["sql"] for q in queries if q["sql"].startswith("UPDATE")]
+        assert len(updates) == 1
+        assert updates[0].startswith('UPDATE "user" SET "last_login"')
+        assert "password" not in updates[0]
+        self.valid_user.refresh_from_db()
+        assert self.valid_user.last_login is not None
+
+    def test_login_skips_recent_last_login_write(self):
+        """
+        Test that repeated logins within LAST_LOGIN_UPDATE_INTERVAL are not
+        written again, and that queued writes never move last_login back.
+        """
+        recent = timezone.now() - timedelta(seconds=30)
+        User.objects.filter(pk=self.valid_user.pk).update(last_login=recent)
+        with self.settings(LAST_LOGIN_UPDATE_INTERVAL=60):
+            assert self.login().status_code == status.HTTP_200_OK
+        self.valid_user.refresh_from_db()
+        assert self.valid_user.last_login == recent
+
+        with self.settings(LAST_LOGIN_ASYNC=True):
+            assert self.login().status_code == status.HTTP_200_OK
+        self.valid_user.refresh_from_db()
+        assert self.valid_user.last_login > recent
+        assert write_last_login(self.valid_user.pk, recent) == 0
+
+    def test_login_rehashes_password_when_enabled(self):
+        """
+        Test that a password hashed with another work factor is upgraded at
+        login only when PASSWORD_REHASH_ON_LOGIN is enabled.
+        """
+        with self.settings(PASSWORD_PBKDF2_ITERATIONS=1000):
+            user = self.create_user(password="ValidPassword123", is_active=True)
+        old_hash = user.password
+        assert "$1000$" in old_hash
+
+        with self.settings(PASSWORD_REHASH_ON_LOGIN=False):
+            assert self.login(user).status_code == status.HTTP_200_OK
+        user.refresh_from_db()
+        assert user.password == old_hash
+
+        assert self.login(user).status_code == status.HTTP_200_OK
+        user.refresh_from_db()
+        assert user.password != old_hash
+        assert f"${settings.PASSWORD_PBKDF2_ITERATIONS}$" in user.password
+
     def test_invalid_password(self):
         """
         Test login with an incorrect password.
@@ -1,9 +1,17 @@
 import jwt
 import pytest
+import time
 from unittest.mock import MagicMock, patch
-from security.models import User
+from django.conf import settings
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from security.models import Rol, User, UserRol
 from core.utils.errors import CustomAPIException, APIErrors
 from core.utils.authorizer_permission import AuthorizerPermission
+from core.utils.permission_cache import get_permission_version
+from core.utils.token_cache import VerifiedTokenCache, token_cache
+from core.utils.token_user import TokenUser
 
 
 @pytest.mark.django_db
@@ -24,6 +32,7 @@ class TestAuthorizerPermission:
             email="user@example.com", password="password123"
         )
         self.payload = {"user_id": str(self.user.id)}
+        token_cache.clear()
 
     def test_missing_authorization_header(self):
         """
@@ -114,3 +123,156 @@ class TestAuthorizerPermission:
         exc_value = exc.value
         assert exc_value.detail["message"] == APIErrors.SERVER_ERROR["message"]
         assert exc_value.detail["code"] == APIErrors.SERVER_ERROR["code"]
+
+    def _stateless_token(self, **claims):
+        """
+        Build a signed token carrying the stateless authentication claims.
+        """
+        payload = {
+            "user_id": str(self.user.id),
+            "is_active": True,
+            "perm_version": get_permission_version(self.user.id),
+            "roles": [],
+            **claims,
+        }
+        return jwt.encode(payload, key=settings.SECRET_KEY, algorithm="HS256")
+
+    @override_settings(STATELESS_JWT_AUTH=True)
+    def test_stateless_token_skips_user_fetch(self):
+        """
+        Test that stateless mode builds a lazy user without querying the database.
+        """
+        request = MagicMock()
+        request.headers = {"Authorization": f"Bearer {self._stateless_token()}"}
+
+        with CaptureQueriesContext(connection) as queries:
+            assert self.permission.has_permission(request, None) is True
+            assert request.user.id == str(self.user.id)
+        assert len(queries) == 0
+        assert isinstance(request.user, TokenUser)
+
+        assert request.user.role_ids == ()
+        assert request.user.email == self.user.email
+        assert request.user == self.user
+
+    @override_settings(STATELESS_JWT_AUTH=True)
+    def test_stateless_token_inactive_user(self):
+        """
+        Test that stateless mode rejects tokens issued to inactive users.
+        """
+        request = MagicMock()
+        token = self._stateless_token(is_active=False)
+        request.headers = {"Authorization": f"Bearer {token}"}
+
+        with pytest.raises(CustomAPIException) as exc:
+            self.permission.has_permission(request, None)
+
+        assert exc.value.detail["code"] == "AUTH005"
+
+    @override_settings(STATELESS_JWT_AUTH=True)
+    def test_stateless_token_with_outdated_permission_version(self):
+        """
+        Test that the claims of a token issued before the user changed are not
+        trusted and the user is loaded from the database.
+        """
+        token = self._stateless_token()
+        self.user.is_active = False
+        self.user.save()
+
+        request = self._request(token)
+        assert self.permission.has_permission(request, None) is True
+        assert isinstance(request.user, User)
+        assert request.user.is_active is False
+
+    @override_settings(STATELESS_JWT_AUTH=True)
+    def test_stateless_token_roles_outdated_by_role_change(self):
+        """
+        Test that assigning a role rotates the permission version, so the
+        token's ``roles`` claim is no longer trusted.
+        """
+        token = self._stateless_token()
+        UserRol.objects.create(
+            user=self.user, rol=Rol.objects.create(name="Reviewer"), active=True
+        )
+
+        request = self._request(token)
+        assert self.permission.has_permission(request, None) is True
+        assert isinstance(request.user, User)
+
+    @patch("core.utils.authorizer_permission.User.objects.get")
+    def test_stateless_claims_ignored_when_disabled(self, mock_get_user):
+        """
+        Test that the user is still fetched when stateless mode is off.
+        """
+        mock_get_user.return_value = self.user
+        request = MagicMock()
+        request.headers = {"Authorization": f"Bearer {self._stateless_token()}"}
+
+        assert self.permission.has_permission(request, None) is True
+        assert request.user == self.user
+
+    def _request(self, token):
+        request = MagicMock()
+        request.headers = {"Authorization": f"Bearer {token}"}
+        return request
+
+    def test_verified_token_is_cached(self):
+        """
+        Test that a token is verified once and then served from the cache.
+        """
+        token = jwt.encode(
+            {**self.payload, "exp": int(time.time()) + 3600},
+            key=settings.SECRET_KEY,
+            algorithm="HS256",
+        )
+        with patch(
+            "core.utils.authorizer_permission.jwt.decode", wraps=jwt.decode
+        ) as decode:
+            for _ in range(3):
+                request = self._request(token)
+                assert self.permission.has_permission(request, None) is True
+                assert request.user == self.user
+        assert decode.call_count == 1
+        stats = token_cache.stats()
+        assert (stats["hits"], stats["misses"], stats["entries"]) == (2, 1, 1)
+
+    def test_token_cache_key_rotation(self):
+        """
+        Test that tokens cached under a previous signing key are verified
+        again, and rejected, after the key changes.
+        """
+        token = jwt.encode(
+            {**self.payload, "exp": int(time.time()) + 3600},
+            key=settings.SECRET_KEY,
+            algorithm="HS256",
+        )
+        assert self.permission.has_permission(self._request(token), None) is True
+
+        with override_settings(SECRET_KEY="rotated-signing-key"):
+            with pytest.raises(CustomAPIException) as exc:
+                self.permission.has_permission(self._request(token), None)
+        assert exc.value.detail["code"] == APIErrors.INVALID_AUTH_TOKEN["code"]
+        assert token_cache.stats()["rotations"] == 1
+
+    def test_token_cache_bounds(self):
+        """
+        Test the LRU eviction, the exp/TTL expiry and that tokens without
+        ``exp`` are not cached.
+        """
+        cache = VerifiedTokenCache(max_entries=2, max_ttl=300)
+        exp = time.time() + 3600
+        for token in ("a", "b"):
+            assert cache.set(token, "key", {"user_id": token, "exp": exp})
+        assert cache.get("a", "key")["user_id"] == "a"
+        cache.set("c", "key", {"user_id": "c", "exp": exp})
+        assert cache.get("b", "key") is None
+        assert cache.stats()["evictions"] == 1
+
+        assert not cache.set("d", "key", {"user_id": "d"})
+        cache.set("e", "key", {"user_id": "e", "exp": time.time() - 1})
+        assert cache.get("e", "key") is None
+        assert cache.stats()["expirations"] == 1
+
+        assert not VerifiedTokenCache(max_entries=0, max_ttl=300).set(
+            "a", "key", {"exp": exp}
+        )
@@ -0,0 +1,93 @@
+import pytest
+from django.conf import settings
+from django.contrib.auth.models import Permission
+from django.core.cache import caches
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from core.utils.permission_cache import (
+    USER_VERSION_KEY,
+    get_permission_codenames,
+    invalidate_user_permissions,
+)
+from core.utils.test_setup import TestSetup
+from core.utils.verify_permission import has_permission_for_action
+from security.actions import change_active_status
+from security.models import Rol, UserRol
+
+
+@pytest.mark.django_db
+class TestPermissionCache(TestSetup):
+    """
+    Test cases for the cached per-user permission set.
+    """
+
+    def setUp(self):
+        """
+        Setup a user holding a role with a single permission.
+        """
+        super().setUp()
+        self.role = self.create_role(name="Viewer")
+        self.role.permissions.add(Permission.objects.get(codename="view_event"))
+        self.viewer = self._create_user_with_role("Viewer")
+
+    def test_permission_check_is_cached(self):
+        """
+        Once resolved, a permission check does not hit the database.
+        """
+        assert has_permission_for_action(self.viewer.id, "view_event") is True
+        with CaptureQueriesContext(connection) as queries:
+            assert has_permission_for_action(self.viewer.id, "view_event") is True
+            assert has_permission_for_action(self.viewer.id, "add_event") is False
+        assert len(queries) == 0
+
+    def test_version_stamps_are_shared(self):
+        """
+        The version stamps live in the cache shared by every worker, not in
+        the per-process default cache.
+        """
+        invalidate_user_permissions(self.viewer.id)
+        key = USER_VERSION_KEY.format(user_id=self.viewer.id)
+        assert caches[settings.RESPONSE_CACHE_ALIAS].get(key) is not None
+        assert caches["default"].get(key) is None
+
+    def test_user_without_roles_has_no_permissions(self):
+        """
+        A user without any role assignment gets an empty permission set.
+        """
+        UserRol.objects.filter(user=self.viewer).delete()
+        assert get_permission_codenames(self.viewer.id) == frozenset()
+
+    def test_role_permission_change_invalidates(self):
+        """
+        Adding or removing a role permission is visible on the next check.
+        """
+        assert has_permission_for_action(self.viewer.id, "add_event") is False
+        self.role.permissions.add(Permission.objects.get(codename="add_event"))
+        assert has_permission_for_action(self.viewer.id, "add_event") is True
+        self.role.permissions.clear()
+        assert has_permission_for_action(self.viewer.id, "view_event") is False
+
+    def test_user_rol_deactivation_invalidates(self):
+        """
+        Deactivating the user's role assignment revokes its permissions.
+        """
+        assert has_permission_for_action(self.viewer.id, "view_event") is True
+        user_rol = UserRol.objects.get(user=self.viewer)
+        user_rol.active = False
+        user_rol.save()
+        assert has_permission_for_action(self.viewer.id, "view_event") is False
+
+    def test_role_deactivation_invalidates(self):
+        """
+        Deactivating a role, also through the bulk admin action, revokes it.
+        """
+        assert has_permission_for_action(self.viewer.id, "view_event") is True
+        change_active_status(Rol.objects.filter(pk=self.role.pk), False)
+        assert has_permission_for_action(self.viewer.id, "view_event") is False
+
+    def test_user_permissions_are_included(self):
+        """
+        Permissions granted directly to the user are part of the set.
+        """
+        self.viewer.user_permissions.add(Permission.objects.get(codename="add_event"))
+        assert has_permission_for_action(self.viewer.id, "add_event") is True